@@ -4,6 +4,8 @@ export default defineConfig({
 	schema: './src/lib/server/db/schema.ts',
 	out: './drizzle',
 	dialect: 'sqlite',
+	// Built by scripts/index-collects.py; FTS5 tables cannot be declared in the schema
+	tablesFilter: ['!lectionary_collect_search*'],
 	dbCredentials: {
 		url: './data/chapel-planner.db'
 	}
@@ -0,0 +1,8 @@
+CREATE TABLE `lectionary_resolved_readings` (
+	`date` text NOT NULL,
+	`tradition` text NOT NULL,
+	`occasion_id` integer NOT NULL,
+	`data` text NOT NULL,
+	PRIMARY KEY(`date`, `tradition`),
+	FOREIGN KEY (`occasion_id`) REFERENCES `lectionary_occasions`(`id`) ON UPDATE no action ON DELETE cascade
+);
\ No newline at end of file
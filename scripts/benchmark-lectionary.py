@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""Benchmark the lectionary build pipeline and compare against a baseline.
+
+Times reference parsing over every distinct reference in the datasets,
+each generator (record building and the whole run), JSON load and dump of
+each dataset, date map generation and reading record building (see
+lectionary.benchmarks). Results
+can be saved as a baseline and later runs compared with it; with --compare
+the exit status is 1 if any benchmark is slower than the baseline by more
+than the threshold. --memory instead reports the memory held by every
+reading file loaded as dicts and as compact records.
+
+Usage:
+  python3 scripts/benchmark-lectionary.py --save
+  python3 scripts/benchmark-lectionary.py --compare
+  python3 scripts/benchmark-lectionary.py -k references -k date_map --repeat 10
+  python3 scripts/benchmark-lectionary.py --memory
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from lectionary.benchmarks import (
+    BASELINE_FILE, DEFAULT_REPEAT, DEFAULT_THRESHOLD, all_benchmarks, compare, format_seconds,
+    load_results, memory_usage, run_benchmarks, save_results, select,
+)
+
+
+def print_result(name, result):
+    rate = f'{result["rate"]:,.0f} {result["unit"]}/s' if result['rate'] else ''
+    print(f'{name:<52} {format_seconds(result["seconds"]):>10} '
+          f'{format_seconds(result["median"]):>10}  {rate}', flush=True)
+
+
+def print_comparison(comparisons, threshold, out):
+    print(f'\n{"benchmark":<52} {"baseline":>10} {"current":>10} {"change":>8}', file=out)
+    for c in comparisons:
+        change = f'{c.change:+.1%}' if c.change is not None else ''
+        flag = '' if c.status == 'ok' else f'  {c.status}'
+        print(f'{c.name:<52} {format_seconds(c.baseline):>10} '
+              f'{format_seconds(c.current):>10} {change:>8}{flag}', file=out)
+    regressions = sum(1 for c in comparisons if c.status == 'regression')
+    print(f'\n{regressions} regression{"s" * (regressions != 1)} beyond {threshold:.0%}', file=out)
+    return regressions
+
+
+def print_memory(usage):
+    print(f'{"layout":<14} {"readings":>9} {"held":>10} {"per reading":>12} {"peak":>10}')
+    baseline = usage[0].bytes
+    for u in usage:
+        print(f'{u.name:<14} {u.records:>9,} {u.bytes / 1e6:>7.2f} MB {u.bytes / u.records:>8.0f} B  '
+              f'{u.peak / 1e6:>7.2f} MB  {u.bytes / baseline:>4.0%} of {usage[0].name}')
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__.strip().splitlines()[0],
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument('-k', dest='patterns', action='append', metavar='PATTERN',
+                        help='only run benchmarks whose name contains PATTERN (repeatable)')
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT,
+                        help=f'runs of each benchmark, best kept (default: {DEFAULT_REPEAT})')
+    parser.add_argument('--list', action='store_true', help='list the benchmarks and exit')
+    parser.add_argument('--memory', action='store_true',
+                        help='report the memory held by the reading files in each record '
+                             'layout and exit')
+    parser.add_argument('--save', nargs='?', const=BASELINE_FILE, type=Path, metavar='FILE',
+                        help=f'save the results as a baseline (default: {BASELINE_FILE})')
+    parser.add_argument('--compare', nargs='?', const=BASELINE_FILE, type=Path, metavar='FILE',
+                        help=f'compare with a saved baseline (default: {BASELINE_FILE})')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD * 100,
+                        metavar='PERCENT',
+                        help=f'slowdown reported as a regression (default: {DEFAULT_THRESHOLD * 100:.0f}%%)')
+    parser.add_argument('--json', action='store_true',
+                        help='print the results as JSON instead of a table')
+    args = parser.parse_args()
+
+    if args.memory:
+        print_memory(memory_usage())
+        return
+    benchmarks = select(all_benchmarks(), args.patterns)
+    if args.list:
+        for b in benchmarks:
+            print(b.name)
+        return
+    if not benchmarks:
+        sys.exit('No benchmarks match')
+
+    baseline = None
+    if args.compare:
+        try:
+            baseline = load_results(args.compare)
+        except (OSError, ValueError) as e:
+            sys.exit(f'Cannot read baseline: {e}')
+
+    if not args.json:
+        print(f'{"benchmark":<52} {"best":>10} {"median":>10}  rate')
+    results = run_benchmarks(benchmarks, args.repeat, None if args.json else print_result)
+    if args.json:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+
+    # With --json the results alone go to stdout
+    report = sys.stderr if args.json else sys.stdout
+    if args.save:
+        save_results(results, args.save)
+        print(f'Saved baseline to {args.save}', file=report)
+
+    if baseline:
+        threshold = args.threshold / 100
+        if baseline['python'] != results['python'] or baseline['platform'] != results['platform']:
+            print(f'Note: baseline is from Python {baseline["python"]} on {baseline["platform"]}',
+                  file=report)
+        comparisons = compare(baseline, results, threshold)
+        if args.patterns:
+            # Benchmarks filtered out of this run are not missing
+            comparisons = [c for c in comparisons if c.status != 'missing']
+        if print_comparison(comparisons, threshold, report):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
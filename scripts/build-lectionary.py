@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""Rebuild every lectionary artifact, running independent stages in parallel.
+
+Stages and their dependencies:
+
+  occasions, cw-office, bcp-office, cw-principal   (independent generators)
+  validate      <- all generators (lectionary.validate across every dataset)
+  seed          <- validate (only with --seed, from the committed datasets)
+  resolve       <- seed (lectionary_resolved_readings, when the table exists)
+  collects      <- seed (lectionary_collect_search, the collects' full-text index)
+
+Generators run in a process pool, so the build takes about as long as the
+slowest one. They write to scripts/data/build/generated/, never over the
+committed datasets in scripts/data: the almanac and BCP files there hold
+more than the generators make. validate checks the generators' output
+with the committed files they do not produce, and seed loads the committed
+datasets as the seed scripts do. Each stage's wall time is printed as it finishes; the first
+failure stops the build.
+
+Usage:
+  python3 scripts/build-lectionary.py
+  python3 scripts/build-lectionary.py --pretty --force
+  python3 scripts/build-lectionary.py --seed
+"""
+
+import argparse
+import io
+import os
+import runpy
+import sys
+import time
+import traceback
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from contextlib import redirect_stderr, redirect_stdout
+
+from lectionary.database import (
+    DB_PATH, format_seed_stats, seed, seed_collect_search, seed_resolved_readings,
+)
+from lectionary.columnar import columnar_path
+from lectionary.datasets import BUILD_DIR, DATA_DIR, OCCASIONS_FILE, SCRIPTS_DIR
+from lectionary.output import ndjson_path
+from lectionary.references import parse_reference, parse_segments
+from lectionary.validate import format_problems, is_error, summarise, validate
+from lectionary.versification import locate_reference
+
+Stage = namedtuple('Stage', 'name target deps')
+Result = namedtuple('Result', 'ok output elapsed')
+
+# Stage name: (script, the data file its output stands in for)
+GENERATORS = {
+    'occasions': ('generate-occasions.py', OCCASIONS_FILE),
+    'cw-office': ('generate-cw-office.py', DATA_DIR / 'lectionary-readings-cw-office.json'),
+    'bcp-office': ('generate-bcp-office.py', DATA_DIR / 'lectionary-readings-bcp-office.json'),
+    'cw-principal': ('generate-cw-principal.py',
+                     DATA_DIR / 'lectionary-readings-cw-principal.json'),
+}
+
+GENERATED_DIR = BUILD_DIR / 'generated'
+
+# Problems listed in full before the rest are summarised
+MAX_PROBLEMS_SHOWN = 20
+
+
+def run_generator(script, argv):
+    # Workers are reused; start each generator with empty reference caches
+    # so its cache statistics are its own
+    for cached in (parse_reference, parse_segments, locate_reference):
+        cached.cache_clear()
+    sys.argv = [script] + argv
+    runpy.run_path(str(SCRIPTS_DIR / script), run_name='__main__')
+
+
+def generated_path(data_file, args):
+    """Where the build writes a generator's output for data_file, in the chosen format."""
+    path = GENERATED_DIR / data_file.name
+    if args.pretty:
+        return path
+    if args.columnar:
+        return columnar_path(path)
+    return ndjson_path(path)
+
+
+def run_validate(sources):
+    problems = validate(sources)
+    for line in format_problems(problems, MAX_PROBLEMS_SHOWN):
+        print(line)
+    print(summarise(problems).capitalize())
+    if any(is_error(p) for p in problems):
+        raise SystemExit(1)
+
+
+def run_seed(db_path):
+    print(format_seed_stats(seed(db_path)))
+
+
+def run_resolve(db_path):
+    try:
+        stats = seed_resolved_readings(db_path)
+    except RuntimeError as e:
+        # Databases pushed before the table existed just skip this stage
+        print(f'Skipped: {e}')
+        return
+    print(f'Resolved {stats["rows"]} date/tradition rows for {stats["dates"]} dates')
+
+
+def run_collects(db_path):
+    stats = seed_collect_search(db_path)
+    print(f'Indexed {stats["prayers"]} prayers of {stats["occasions"]} occasions')
+
+
+def run_stage(target, args):
+    """Run one stage in a worker, capturing its output and any failure."""
+    out = io.StringIO()
+    t0 = time.perf_counter()
+    ok = True
+    with redirect_stdout(out), redirect_stderr(out):
+        try:
+            target(*args)
+        except SystemExit as e:
+            if e.code not in (None, 0):
+                ok = False
+                if not isinstance(e.code, int):
+                    print(e.code)
+        except Exception:
+            ok = False
+            traceback.print_exc()
+    return Result(ok, out.getvalue(), time.perf_counter() - t0)
+
+
+def build_stages(args):
+    argv = [flag for flag, on in (('--pretty', args.pretty), ('--columnar', args.columnar),
+                                  ('--force', args.force)) if on]
+    # The validate stage checks everything once the generators are done
+    argv.append('--no-validate')
+    sources = {data_file: generated_path(data_file, args) for _, data_file in GENERATORS.values()}
+    stages = [Stage(name, (run_generator, (script, argv + ['-o', str(sources[data_file])])), ())
+              for name, (script, data_file) in GENERATORS.items()]
+    stages.append(Stage('validate', (run_validate, (sources,)), tuple(GENERATORS)))
+    if args.seed:
+        stages.append(Stage('seed', (run_seed, (args.seed,)), ('validate',)))
+        stages.append(Stage('resolve', (run_resolve, (args.seed,)), ('seed',)))
+        stages.append(Stage('collects', (run_collects, (args.seed,)), ('seed',)))
+    return stages
+
+
+def indent(text):
+    return ''.join(f'    {line}\n' for line in text.rstrip().splitlines())
+
+
+def run(stages, jobs, verbose):
+    """Run stages in dependency order; return True if all succeeded."""
+    pending = {s.name: s for s in stages}
+    done = set()
+    running = {}
+    t0 = time.perf_counter()
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        while pending or running:
+            for name, stage in list(pending.items()):
+                if all(d in done for d in stage.deps):
+                    target, args = stage.target
+                    running[pool.submit(run_stage, target, args)] = name
+                    del pending[name]
+
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                name = running.pop(future)
+                result = future.result()
+                status = 'ok' if result.ok else 'FAILED'
+                print(f'  {name:14} {result.elapsed:6.2f}s  {status}')
+                if verbose or not result.ok:
+                    print(indent(result.output), end='')
+                if not result.ok:
+                    for other in running:
+                        other.cancel()
+                    pool.shutdown(wait=False, cancel_futures=True)
+                    print(f'\nBuild failed: stage {name!r} failed; '
+                          f'not run: {", ".join(sorted(pending)) or "none"}', file=sys.stderr)
+                    return False
+                done.add(name)
+
+    print(f'Built {len(done)} stages in {time.perf_counter() - t0:.2f}s')
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__.splitlines()[0],
+        epilog='Generator output formats and --force are passed through to every generator.',
+    )
+    formats = parser.add_mutually_exclusive_group()
+    formats.add_argument('--pretty', action='store_true', help='write indented JSON arrays')
+    formats.add_argument('--columnar', action='store_true', help='write columnar files')
+    parser.add_argument('--force', action='store_true', help='rebuild unchanged outputs too')
+    parser.add_argument('--seed', nargs='?', const=DB_PATH, metavar='DB',
+                        help='after validating, reseed DB (default: data/chapel-planner.db) '
+                             'and rebuild its resolved readings and collect search index')
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1,
+                        help='worker processes (default: CPU count)')
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help='show the output of every stage, not just failures')
+    args = parser.parse_args()
+
+    stages = build_stages(args)
+    print(f'Building {len(stages)} stages with {min(args.jobs, len(stages))} workers...')
+    if not run(stages, min(args.jobs, len(stages)), args.verbose):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""Pack lectionary data files into columnar form, or export them back to JSON.
+
+Usage:
+  python3 scripts/columnar.py pack
+  python3 scripts/columnar.py pack scripts/data/lectionary-readings-cw-office.json
+  python3 scripts/columnar.py export scripts/data/lectionary-readings-cw-office.columns.json -o out.json
+
+pack writes <name>.columns.json beside each source file (by default the
+occasion and reading files that seed-lectionary.ts can load in this form). export writes the
+records back as the indented JSON array used for the committed data files.
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+from lectionary.columnar import columnar_path, load_columns, write_columns
+from lectionary.datasets import OCCASIONS_FILE, READING_FILES, load_json
+
+DEFAULT_FILES = (OCCASIONS_FILE,) + READING_FILES
+
+
+def pack(paths):
+    total_in = total_out = 0
+    for path in paths:
+        path = Path(path)
+        if not path.exists():
+            print(f'  Skipping {path.name} (not found)')
+            continue
+        t0 = time.perf_counter()
+        records = load_json(path)
+        if not isinstance(records, list) or not all(isinstance(r, dict) for r in records):
+            sys.exit(f'{path}: not a list of records, so it cannot be packed into columns')
+        target = columnar_path(path)
+        with open(target, 'w', encoding='utf-8') as f:
+            count = write_columns(records, f)
+        elapsed = time.perf_counter() - t0
+        size_in, size_out = path.stat().st_size, target.stat().st_size
+        total_in += size_in
+        total_out += size_out
+        print(f'  {target.name}: {count} records, {size_in:,} -> {size_out:,} bytes '
+              f'({size_in / size_out:.1f}x) in {elapsed * 1000:.0f} ms')
+    if total_out:
+        print(f'Total: {total_in:,} -> {total_out:,} bytes ({total_in / total_out:.1f}x)')
+
+
+def export(path, output):
+    records = list(load_columns(path).records())
+    f = sys.stdout if output in (None, '-') else open(output, 'w', encoding='utf-8')
+    try:
+        json.dump(records, f, indent=2, ensure_ascii=False)
+        f.write('\n')
+    finally:
+        if f is not sys.stdout:
+            f.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('command', choices=['pack', 'export'])
+    parser.add_argument('files', nargs='*')
+    parser.add_argument('-o', '--output', help='export: output file (default: stdout)')
+    args = parser.parse_args()
+
+    if args.command == 'pack':
+        pack(args.files or DEFAULT_FILES)
+        return
+
+    if len(args.files) != 1:
+        parser.error('export needs exactly one columnar file')
+    export(args.files[0], args.output)
+
+
+if __name__ == '__main__':
+    main()
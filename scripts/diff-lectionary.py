@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""Compare two versions of the lectionary reading and occasion files.
+
+Records are matched on their keys rather than their lines: a reading on
+(occasionSlug, tradition, serviceContext, readingType, alternateYear,
+sortOrder), an occasion or collects entry on its slug. Added, removed and
+changed records are listed under their occasion, with the fields that
+changed. Given two directories, every dataset in either is compared with
+its namesake in the other (.json, .ndjson and .columns.json forms alike).
+Exits 1 if there are differences, as diff does.
+
+Usage:
+  python3 scripts/diff-lectionary.py old/lectionary-readings-cw-office.json \\
+      scripts/data/lectionary-readings-cw-office.ndjson
+  python3 scripts/diff-lectionary.py /tmp/almanac-2024 /tmp/almanac-2025 --summary
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+from lectionary.diff import diff_files, diff_json, format_diff, pair_files
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__.strip().splitlines()[0],
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument('old', type=Path, help='old data file or directory')
+    parser.add_argument('new', type=Path, help='new data file or directory')
+    parser.add_argument('--summary', action='store_true',
+                        help='only count the changes in each dataset')
+    parser.add_argument('--json', action='store_true',
+                        help='print the changes as JSON instead of a report')
+    args = parser.parse_args()
+    for path in (args.old, args.new):
+        if not path.exists():
+            sys.exit(f'No such file or directory: {path}')
+
+    t0 = time.perf_counter()
+    diffs = [diff_files(old, new, name) for name, old, new in pair_files(args.old, args.new)]
+    elapsed = time.perf_counter() - t0
+
+    if args.json:
+        json.dump([diff_json(d) for d in diffs], sys.stdout, ensure_ascii=False, indent=2)
+        print()
+    else:
+        for diff in diffs:
+            for line in format_diff(diff, args.summary):
+                print(line)
+        records = sum(d.old_count + d.new_count for d in diffs)
+        print(f'Compared {records} records in {len(diffs)} datasets in {elapsed * 1000:.0f} ms',
+              file=sys.stderr)
+
+    if any(d.changes for d in diffs):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
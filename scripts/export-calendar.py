@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""Export the liturgical season timeline for a range of years as JSON.
+
+Each run of days with the same season, colour, Sunday cycle year (A/B/C)
+and weekday office year (1/2) is one entry, so 2024-2030 is under a
+hundred runs. See lectionary.calendar.timeline_json() for the format.
+
+Usage:
+  python3 scripts/export-calendar.py
+  python3 scripts/export-calendar.py --years 1900-2200 -o timeline.json
+  python3 scripts/export-calendar.py --years 2025 -o -
+"""
+
+import argparse
+import json
+from pathlib import Path
+
+from lectionary.calendar import timeline_json
+from lectionary.datasets import BUILD_DIR
+from lectionary.date_map import DEFAULT_YEARS, parse_years
+from lectionary.output import STDOUT, open_output, report_stream
+
+OUTPUT_PATH = BUILD_DIR / 'liturgical-timeline.json'
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__.strip().splitlines()[0],
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument('--years', type=parse_years, default=DEFAULT_YEARS,
+                        help='years to export, e.g. 1900-2200 (default: 2024-2030)')
+    parser.add_argument('-o', '--output', default=OUTPUT_PATH,
+                        help=f'output file, or - for stdout (default: {OUTPUT_PATH})')
+    args = parser.parse_args()
+
+    target = STDOUT if args.output == STDOUT else Path(args.output)
+    data = timeline_json(args.years)
+    with open_output(target) as f:
+        json.dump(data, f, separators=(',', ':'))
+        f.write('\n')
+    print(f'Exported {len(data["runs"])} runs to {target}', file=report_stream(target))
+
+
+if __name__ == '__main__':
+    main()
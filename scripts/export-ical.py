@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Export the lectionary as an iCalendar (.ics) file for calendar apps.
+
+One all-day event per date: the day's occasion, with its readings for the
+chosen tradition listed by service context. Events are streamed from the
+date map and the reading files a year at a time (see lectionary.ical).
+--context limits the readings listed ('office' is morning and evening
+prayer) and --split writes one file per year into a directory.
+
+Usage:
+  python3 scripts/export-ical.py
+  python3 scripts/export-ical.py --years 2025-2034 --tradition bcp -o bcp.ics
+  python3 scripts/export-ical.py --context principal --context office --split
+  python3 scripts/export-ical.py --years 2025 -o -
+"""
+
+import argparse
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from lectionary.datasets import BUILD_DIR
+from lectionary.date_map import DEFAULT_YEARS, parse_years
+from lectionary.ical import CONTEXT_LABELS, TRADITION_NAMES, LectionaryCalendar, parse_contexts
+from lectionary.output import STDOUT, report_stream
+
+OUTPUT_DIR = BUILD_DIR / 'calendar'
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__.strip().splitlines()[0],
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument('--years', type=parse_years, default=DEFAULT_YEARS,
+                        help='calendar years to export, e.g. 2025-2034 (default: 2024-2030)')
+    parser.add_argument('--tradition', choices=sorted(TRADITION_NAMES), default='cw',
+                        help='whose readings to list (default: cw)')
+    parser.add_argument('--context', action='append', default=[],
+                        help='only readings for this service context (repeatable): '
+                             f'{", ".join(CONTEXT_LABELS)} or office')
+    parser.add_argument('--split', action='store_true',
+                        help='write one file per year into the -o directory')
+    parser.add_argument('-o', '--output',
+                        help=f'.ics file, or - for stdout; with --split, a directory '
+                             f'(default: {OUTPUT_DIR}/lectionary-TRADITION[-YEAR].ics)')
+    args = parser.parse_args()
+
+    try:
+        contexts = parse_contexts(args.context)
+    except ValueError as e:
+        sys.exit(str(e))
+    if args.split and args.output == STDOUT:
+        parser.error('--split writes files; give a directory with -o')
+
+    t0 = time.perf_counter()
+    calendar = LectionaryCalendar(args.tradition, contexts)
+    stamp = datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+    name = f'lectionary-{args.tradition}'
+
+    if args.split:
+        directory = Path(args.output) if args.output else OUTPUT_DIR
+        directory.mkdir(parents=True, exist_ok=True)
+        total = 0
+        for year in args.years:
+            target = directory / f'{name}-{year}.ics'
+            with open(target, 'w', encoding='utf-8', newline='') as f:
+                total += calendar.write(f, range(year, year + 1), stamp)
+        print(f'Exported {total:,} events to {len(args.years)} files in {directory} '
+              f'in {time.perf_counter() - t0:.2f}s')
+        return
+
+    target = STDOUT if args.output == STDOUT else Path(args.output or OUTPUT_DIR / f'{name}.ics')
+    if target == STDOUT:
+        count = calendar.write(sys.stdout, args.years, stamp)
+        sys.stdout.flush()
+    else:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with open(target, 'w', encoding='utf-8', newline='') as f:
+            count = calendar.write(f, args.years, stamp)
+    print(f'Exported {count:,} events to {target} in {time.perf_counter() - t0:.2f}s',
+          file=report_stream(target))
+
+
+if __name__ == '__main__':
+    main()
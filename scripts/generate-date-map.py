@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Generate the date-to-occasion map for any range of years.
+
+Maps every date in the range to its Sunday, weekday, feast and
+commemoration occasions exactly as seed-lectionary.ts does for 2024-2030,
+streaming the rows as NDJSON or writing them straight into
+lectionary_date_map.
+
+Usage:
+  python3 scripts/generate-date-map.py --years 1900-2200
+  python3 scripts/generate-date-map.py --years 2025 -o -
+  python3 scripts/generate-date-map.py --years 1900-2200 --sqlite
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+from lectionary.database import DB_PATH, seed_date_map
+from lectionary.datasets import (
+    BUILD_DIR, COMMEMORATION_OCCASIONS_FILE, OCCASIONS_FILE, load_records, resolve_data_file,
+)
+from lectionary.date_map import DEFAULT_YEARS, iter_date_map, parse_years
+from lectionary.output import STDOUT, open_output, report_stream, write_ndjson
+
+OUTPUT_PATH = BUILD_DIR / 'lectionary-date-map.ndjson'
+
+
+def load_occasions():
+    """(occasion slugs, commemoration occasions) from the data files."""
+    occasions = load_records(resolve_data_file(OCCASIONS_FILE))
+    commemorations = load_records(resolve_data_file(COMMEMORATION_OCCASIONS_FILE))
+    slugs = {occ['slug'] for occ in occasions} | {occ['slug'] for occ in commemorations}
+    return slugs, commemorations
+
+
+def date_map_records(slugs, commemorations, years):
+    for m in iter_date_map(slugs, commemorations, years):
+        yield {
+            'date': m.date,
+            'occasionSlug': m.slug,
+            'mappingType': m.mapping_type,
+            'liturgicalYear': m.liturgical_year,
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__.strip().splitlines()[0],
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument('--years', type=parse_years, default=DEFAULT_YEARS,
+                        help='years to map, e.g. 1900-2200 (default: 2024-2030)')
+    parser.add_argument('--sqlite', nargs='?', const=DB_PATH, metavar='DB',
+                        help='replace lectionary_date_map in DB (default: data/chapel-planner.db) '
+                             'for the occasions already seeded there')
+    parser.add_argument('-o', '--output', default=OUTPUT_PATH,
+                        help=f'NDJSON output file, or - for stdout (default: {OUTPUT_PATH})')
+    args = parser.parse_args()
+    years = f'{args.years[0]}-{args.years[-1]}' if len(args.years) > 1 else str(args.years[0])
+
+    if args.sqlite:
+        t0 = time.perf_counter()
+        try:
+            count = seed_date_map(args.sqlite, args.years)
+        except RuntimeError as e:
+            sys.exit(str(e))
+        print(f'Wrote {count} date map entries for {years} to {args.sqlite} '
+              f'in {time.perf_counter() - t0:.2f}s')
+        return
+
+    target = STDOUT if args.output == STDOUT else Path(args.output)
+    report = report_stream(target)
+    t0 = time.perf_counter()
+    slugs, commemorations = load_occasions()
+    with open_output(target) as f:
+        count = write_ndjson(date_map_records(slugs, commemorations, args.years), f)
+    print(f'Generated {count} date map entries for {years} in {time.perf_counter() - t0:.2f}s',
+          file=report)
+    print(f'Output: {target}', file=report)
+
+
+if __name__ == '__main__':
+    main()
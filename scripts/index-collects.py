@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""Build the full-text search index of the collects and post-communions.
+
+Loads every seeded occasion's CW and BCP collects and CW post-communion,
+each made a single line of text, into the FTS5 table
+lectionary_collect_search keyed by occasion slug (see
+lectionary.collect_search). Run after seeding; --search queries the index
+instead of building it.
+
+Usage:
+  python3 scripts/index-collects.py
+  python3 scripts/index-collects.py --db /tmp/test.db
+  python3 scripts/index-collects.py --search '"armour of light"'
+  python3 scripts/index-collects.py --search 'merc* NOT judge' --limit 5
+"""
+
+import argparse
+import sqlite3
+import sys
+
+from lectionary.collect_search import search_collects
+from lectionary.database import DB_PATH, seed_collect_search
+
+DEFAULT_LIMIT = 10
+
+
+def show(db_path, query, limit):
+    try:
+        hits = search_collects(db_path, query, limit)
+    except sqlite3.OperationalError as e:
+        sys.exit(str(e))
+    if not hits:
+        sys.exit(f'No collects match {query}')
+    for hit in hits:
+        print(f'{hit.slug} ({hit.prayer}) {hit.name or ""}'.rstrip())
+        print(f'  {hit.snippet}')
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__.strip().splitlines()[0],
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument('--db', default=DB_PATH, help='database (default: data/chapel-planner.db)')
+    parser.add_argument('--search', metavar='QUERY',
+                        help='print the best matches for an FTS5 query instead of building')
+    parser.add_argument('--limit', type=int, default=DEFAULT_LIMIT,
+                        help=f'with --search, the most matches shown (default: {DEFAULT_LIMIT})')
+    args = parser.parse_args()
+
+    if args.search:
+        show(args.db, args.search, args.limit)
+        return
+
+    try:
+        stats = seed_collect_search(args.db)
+    except RuntimeError as e:
+        sys.exit(str(e))
+    print(f'Indexed {stats["prayers"]} prayers of {stats["occasions"]} occasions in {args.db} '
+          f'in {stats["elapsed"]:.3f}s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,5 @@
+"""Shared helpers for the lectionary generator scripts.
+
+The generators in ``scripts/`` put this directory on ``sys.path`` when run
+directly, so modules here are imported as ``lectionary.<module>``.
+"""
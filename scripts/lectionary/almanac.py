@@ -0,0 +1,373 @@
+"""Stream oremus almanac HTML into parsed entries, with a per-file cache.
+
+An almanac file is a run of "previewhtml" blocks, one per day or
+observance, each a flat list of <span class="..."> elements (lect1 to
+lect4, bcphc, collects1 cwcol, ...). AlmanacParser is fed the file in
+chunks and keeps only the block in progress, so memory stays bounded by
+the largest block rather than the ~1.5 MB file. The span-level rules are
+those of parse-almanac.ts, applied to each span's raw inner HTML as it
+closes, so entries match what its regexes find over the whole file.
+
+Parsed entries are plain JSON and are cached in scripts/data/build/almanac/
+under the SHA-256 of the HTML file, so adding almanac-2027.html parses
+only that file. parse_almanacs() parses uncached files in parallel, one
+worker process per file.
+"""
+
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from html.parser import HTMLParser
+from pathlib import Path
+
+from lectionary.datasets import BUILD_DIR, DATA_DIR
+from lectionary.manifest import file_digest
+
+CACHE_DIR = BUILD_DIR / 'almanac'
+CACHE_VERSION = 1
+
+ALMANAC_RE = re.compile(r'almanac-(\d{4})\.html$')
+
+# Spans whose contents make up an entry, by their exact class attribute
+LECT_CLASSES = ('lect1', 'lect2', 'lect3', 'lect4')
+BIBLEREF_CLASSES = ('bcphc', 'bcpadd')
+CW_COLLECT_CLASS = 'collects1 cwcol'
+COMMEMORATION_COLLECT_CLASS = 'collects2 cwcol'
+BCP_COLLECT_CLASS = 'bcpcoll'
+SPAN_CLASSES = frozenset(LECT_CLASSES + BIBLEREF_CLASSES + (
+    CW_COLLECT_CLASS, COMMEMORATION_COLLECT_CLASS, BCP_COLLECT_CLASS, 'cwtitle', 'colours',
+))
+
+CHUNK_SIZE = 1 << 16
+
+_EM_RE = re.compile(r'<em>(.*?)</em>')
+_BIBLEREF_RE = re.compile(r'<bibleref ref="([^"]*)">(.*?)</bibleref>')
+_BR_RE = re.compile(r'<br\s*/?>')
+_TAG_RE = re.compile(r'<[^>]+>')
+_OR_RE = re.compile(r'<em>\(or\)</em>')
+_COLLECT_MARKER = '<em>Collect</em>'
+_POST_COMMUNION_MARKER = '<em>Post Communion</em>'
+_BCP_COLLECT_MARKER = '<em>BCP Collect</em>'
+
+
+def almanac_files(data_dir=DATA_DIR):
+    """The almanac-YYYY.html files in data_dir, in year order."""
+    return sorted(
+        (p for p in Path(data_dir).iterdir() if ALMANAC_RE.match(p.name)),
+        key=lambda p: p.name,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Span contents (the rules of parse-almanac.ts)
+# ---------------------------------------------------------------------------
+
+def clean_collect_html(text):
+    text = _BR_RE.sub('\n', text)
+    for entity, char in (('&nbsp;', ' '), ('&rsquo;', '’'), ('&lsquo;', '‘'),
+                         ('&ndash;', '–'), ('&mdash;', '—'), ('&amp;', '&')):
+        text = text.replace(entity, char)
+    text = _TAG_RE.sub('', text)
+    text = re.sub(r'[ \t]+\n', '\n', text)
+    text = re.sub(r'\n{3,}', '\n\n', text)
+    return text.strip()
+
+
+def _join_alternatives(text):
+    """Clean each "(or)" alternative in text and join them, or None if empty."""
+    if not text:
+        return None
+    parts = [clean_collect_html(p) for p in _OR_RE.split(text)]
+    parts = [p for p in parts if p]
+    return '\n\nor\n\n'.join(parts) if parts else None
+
+
+def extract_collects(contents):
+    """{'collectCw', 'postCommunionCw'} from the contents of a block's collect spans."""
+    if not contents:
+        return {'collectCw': None, 'postCommunionCw': None}
+    full = '\n'.join(contents)
+    collect_at = full.find(_COLLECT_MARKER)
+    post_communion_at = full.find(_POST_COMMUNION_MARKER)
+    collect = post_communion = None
+    if collect_at >= 0:
+        start = collect_at + len(_COLLECT_MARKER)
+        if post_communion_at >= 0:
+            collect = full[start:post_communion_at]
+            post_communion = full[post_communion_at + len(_POST_COMMUNION_MARKER):]
+        else:
+            collect = full[start:]
+    return {
+        'collectCw': _join_alternatives(collect),
+        'postCommunionCw': _join_alternatives(post_communion),
+    }
+
+
+def extract_bcp_collect(contents):
+    if not contents:
+        return None
+    full = '\n'.join(contents)
+    marker_at = full.find(_BCP_COLLECT_MARKER)
+    if marker_at >= 0:
+        full = full[marker_at + len(_BCP_COLLECT_MARKER):]
+    return _join_alternatives(full)
+
+
+def parse_lect_spans(contents):
+    """Group lect spans into [{'label', 'readings'}] sections.
+
+    A span with an <em> label starts a new section; "(or)" marks the
+    readings after it as optional alternatives.
+    """
+    sections = []
+    label = ''
+    readings = []
+    after_or = False
+
+    for content in contents:
+        em = _EM_RE.search(content)
+        if em:
+            new_label = em.group(1)
+            new_label = (new_label[:-1] if new_label.endswith(':') else new_label).strip()
+            if new_label in ('(or)', 'or'):
+                after_or = True
+                continue
+            # "Gospel at Holy Communion:" within lect1 is a sub-label, not a section
+            if new_label and not new_label.startswith('(') and not new_label.startswith('Gospel at'):
+                if label and readings:
+                    sections.append({'label': label, 'readings': readings})
+                label = new_label
+                readings = []
+                after_or = False
+            ref = _BIBLEREF_RE.search(content)
+            if ref:
+                readings.append({'ref': ref.group(2), 'biblerefAttr': ref.group(1),
+                                 'isOptional': after_or})
+            continue
+
+        for ref in _BIBLEREF_RE.finditer(content):
+            readings.append({'ref': ref.group(2), 'biblerefAttr': ref.group(1),
+                             'isOptional': after_or})
+
+    if label and readings:
+        sections.append({'label': label, 'readings': readings})
+    return sections
+
+
+def parse_bible_refs(contents):
+    """The reference opening each span, for the BCP spans with one reading each."""
+    readings = []
+    for content in contents:
+        ref = _BIBLEREF_RE.match(content)
+        if ref:
+            readings.append({'ref': ref.group(2), 'biblerefAttr': ref.group(1)})
+    return readings
+
+
+def _commemoration_details(spans):
+    """(name, colour) of the commemoration in a block with lect4 readings."""
+    titles = []
+    for content in spans.get('cwtitle', ()):
+        title = _TAG_RE.sub('', _BR_RE.split(content, 1)[0]).strip()
+        if title:
+            titles.append(title)
+
+    colour = None
+    colours = spans.get('colours', ())
+    if len(colours) >= 2:
+        # The second colours span is the commemoration's: " / red"
+        colour = re.sub(r'^\s*/\s*', '', _BR_RE.sub('', colours[1])).strip().lower() or None
+    elif len(colours) == 1:
+        colour = _BR_RE.sub('', colours[0]).strip().lower() or None
+    return (titles[0] if titles else None), colour
+
+
+def make_entry(date_attr, summary, spans):
+    """An entry from a block's date, summary and {class: [span contents]}."""
+    sections = {cls: parse_lect_spans(spans.get(cls, ())) for cls in LECT_CLASSES}
+    name = colour = None
+    if sections['lect4']:
+        name, colour = _commemoration_details(spans)
+    sections.update((cls, parse_bible_refs(spans.get(cls, ()))) for cls in BIBLEREF_CLASSES)
+    return {
+        'dateStart': f'{date_attr[:4]}-{date_attr[4:6]}-{date_attr[6:8]}',
+        'summary': summary,
+        'commemorationName': name,
+        'commemorationColour': colour,
+        'collectsCw': extract_collects(spans.get(CW_COLLECT_CLASS)),
+        'collectBcp': extract_bcp_collect(spans.get(BCP_COLLECT_CLASS)),
+        'commemorationCollects': extract_collects(spans.get(COMMEMORATION_COLLECT_CLASS)),
+        'sections': sections,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Streaming parser
+# ---------------------------------------------------------------------------
+
+class AlmanacParser(HTMLParser):
+    """Incremental parser collecting one entry per previewhtml block.
+
+    Character references are left unconverted and tags are kept as written,
+    so each span's contents are the raw HTML the span-level rules expect.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=False)
+        self.entries = []
+        self._block = None      # date attribute of the block in progress
+        self._summary = None
+        self._spans = {}
+        self._capture = None    # (kind, class) while inside a captured element
+        self._raw = []
+
+    # Block boundaries
+
+    def handle_starttag(self, tag, attrs):
+        if self._capture:
+            self._raw.append(self.get_starttag_text())
+            return
+        attrs = dict(attrs)
+        cls = attrs.get('class') or ''
+        if tag == 'div' and cls.startswith('previewhtml'):
+            date_attr = attrs.get('data-almanac-d1') or ''
+            self._start_block(date_attr if date_attr.isdigit() else None)
+        elif self._block is None:
+            return
+        elif tag == 'div' and cls == 'previewsummary' and self._summary is None:
+            self._capture, self._raw = ('summary', None), []
+        elif tag == 'span' and cls in SPAN_CLASSES:
+            self._capture, self._raw = ('span', cls), []
+
+    def handle_startendtag(self, tag, attrs):
+        if self._capture:
+            self._raw.append(self.get_starttag_text())
+
+    def handle_endtag(self, tag):
+        if not self._capture:
+            return
+        kind, cls = self._capture
+        # Each element ends at the first closing tag of its type, as the
+        # non-greedy regexes in parse-almanac.ts do
+        if (kind, tag) in (('summary', 'div'), ('span', 'span')):
+            content = ''.join(self._raw)
+            if kind == 'summary':
+                self._summary = content
+            else:
+                self._spans.setdefault(cls, []).append(content)
+            self._capture = None
+        else:
+            self._raw.append(f'</{tag}>')
+
+    def handle_data(self, data):
+        if self._capture:
+            self._raw.append(data)
+
+    def handle_entityref(self, name):
+        if self._capture:
+            self._raw.append(f'&{name};')
+
+    def handle_charref(self, name):
+        if self._capture:
+            self._raw.append(f'&#{name};')
+
+    def handle_comment(self, data):
+        if data.strip() == 'class="previewhtml"':
+            self._end_block()
+        elif self._capture:
+            self._raw.append(f'<!--{data}-->')
+
+    def _start_block(self, date_attr):
+        self._block = date_attr
+        self._summary = None
+        self._spans = {}
+        self._capture = None
+
+    def _end_block(self):
+        summary = self._summary
+        if self._block and summary is not None and 'Almanac and Lectionary' not in summary:
+            self.entries.append(make_entry(self._block, summary, self._spans))
+        self._start_block(None)
+
+
+def parse_almanac_file(path, chunk_size=CHUNK_SIZE):
+    """Parse one almanac HTML file into a list of entries, reading it in chunks."""
+    parser = AlmanacParser()
+    with open(path, encoding='utf-8') as f:
+        for chunk in iter(lambda: f.read(chunk_size), ''):
+            parser.feed(chunk)
+    parser.close()
+    return parser.entries
+
+
+# ---------------------------------------------------------------------------
+# Cache
+# ---------------------------------------------------------------------------
+
+def _parser_digest():
+    # Cached entries are only valid for the rules that produced them
+    return file_digest(__file__)
+
+
+def cache_path(digest):
+    return CACHE_DIR / f'{digest}.json'
+
+
+def load_cached(digest, parser):
+    try:
+        with open(cache_path(digest), encoding='utf-8') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if cached.get('version') != CACHE_VERSION or cached.get('parser') != parser:
+        return None
+    return cached['entries']
+
+
+def store_cached(digest, parser, source, entries):
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    path = cache_path(digest)
+    tmp = path.with_suffix('.tmp')
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump({'version': CACHE_VERSION, 'parser': parser, 'source': source,
+                   'entries': entries}, f, ensure_ascii=False)
+    os.replace(tmp, path)
+
+
+def prune_cache(keep):
+    """Remove cached parses of files that are no longer inputs."""
+    if not CACHE_DIR.exists():
+        return
+    for path in CACHE_DIR.glob('*.json'):
+        if path.stem not in keep:
+            path.unlink()
+
+
+def parse_almanacs(paths, jobs=None, use_cache=True):
+    """Entries of each file, in order, as a list of (path, entries, cached).
+
+    Files whose contents and parser are unchanged since they were last
+    parsed come from the cache; the rest are parsed in parallel.
+    """
+    paths = [Path(p) for p in paths]
+    parser = _parser_digest()
+    digests = [file_digest(p) for p in paths]
+    entries = [load_cached(d, parser) if use_cache else None for d in digests]
+
+    todo = [i for i, e in enumerate(entries) if e is None]
+    if len(todo) > 1 and (jobs is None or jobs > 1):
+        with ProcessPoolExecutor(max_workers=min(jobs or os.cpu_count() or 1, len(todo))) as pool:
+            parsed = pool.map(parse_almanac_file, [paths[i] for i in todo])
+            for i, result in zip(todo, parsed):
+                entries[i] = result
+    else:
+        for i in todo:
+            entries[i] = parse_almanac_file(paths[i])
+
+    for i in todo:
+        store_cached(digests[i], parser, paths[i].name, entries[i])
+    # Parsing some of the files keeps the cached parses of the rest
+    others = set(almanac_files()) - {p.resolve() for p in paths}
+    prune_cache(set(digests) | {file_digest(p) for p in others})
+    return [(p, e, i not in todo) for i, (p, e) in enumerate(zip(paths, entries))]
@@ -0,0 +1,294 @@
+"""BCP office readings from the 1922 Revised Table of Lessons.
+
+A Python port of parse-bcp-office.ts. The Proper of Time
+(data/1922-time.csv) gives each Sunday and weekday three Old Testament and
+three New Testament columns for Morning and for Evening Prayer; the
+Proper of Saints (data/1922-saints.csv) gives each holy day its first
+Evensong, Mattins and second Evensong lessons. Both are read a row at a
+time with the csv module.
+
+Readings match the TypeScript parser's except that a lesson running to
+"end" ("Isaiah 1:18–end") gets the chapter's last verse as its verseEnd,
+from the verse counts in lectionary.versification, and each reading carries
+the segments and ordinals the other generators add.
+"""
+
+import csv
+import re
+from itertools import chain
+
+from lectionary.datasets import DATA_DIR
+from lectionary.date_map import DAY_ABBREVS
+from lectionary.records import make_reading
+from lectionary.versification import locate_reference
+
+TIME_CSV = DATA_DIR / '1922-time.csv'
+SAINTS_CSV = DATA_DIR / '1922-saints.csv'
+
+# 1922 Table "Day" labels -> occasion slugs
+DAY_LABEL_SLUGS = {
+    # Advent
+    'Advent Sunday': 'advent-1',
+    '2nd Sunday in Advent': 'advent-2',
+    '3rd Sunday in Advent': 'advent-3',
+    '4th Sunday in Advent': 'advent-4',
+    # Christmas season
+    'Christmas Eve': 'christmas-eve',
+    'Christmas Day': 'christmas-day',
+    'St Stephen': 'st-stephen',
+    'St John Evangelist': 'st-john-evangelist',
+    "Innocents' Day": 'holy-innocents',
+    'Sunday after Christmas Day': 'christmas-1',
+    'December 29': 'christmas-dec-29',
+    'December 30': 'christmas-dec-30',
+    'December 31': 'christmas-dec-31',
+    'Circumcision': 'christmas-jan-1',
+    '2nd Sunday after Christmas': 'christmas-2',
+    # Epiphany
+    'Epiphany': 'epiphany',
+    '1st Sunday after Epiphany': 'epiphany-1',
+    '2nd Sunday after Epiphany': 'epiphany-2',
+    '3rd Sunday after Epiphany': 'epiphany-3',
+    '4th Sunday after Epiphany': 'epiphany-4',
+    # Pre-Lent (BCP names -> CW slugs)
+    'Septuagesima': 'before-lent-3',
+    'Sexagesima': 'before-lent-2',
+    'Quinquagesima': 'before-lent-1',
+    # Lent
+    'Ash Wednesday': 'ash-wednesday',
+    '1st Sunday in Lent': 'lent-1',
+    '2nd Sunday in Lent': 'lent-2',
+    '3rd Sunday in Lent': 'lent-3',
+    '4th Sunday in Lent': 'lent-4',
+    '5th Sunday in Lent': 'lent-5',
+    # Holy Week
+    'Palm Sunday': 'palm-sunday',
+    'Good Friday': 'good-friday',
+    'Easter Eve': 'easter-eve',
+    # Easter
+    'Easter Day': 'easter-day',
+    '1st Sunday after Easter': 'easter-2',
+    '2nd Sunday after Easter': 'easter-3',
+    '3rd Sunday after Easter': 'easter-4',
+    '4th Sunday after Easter': 'easter-5',
+    '5th Sunday after Easter': 'easter-6',
+    # Ascension & Pentecost
+    'Ascension Day': 'ascension-day',
+    'Sunday after Ascension': 'easter-7',
+    'Whit-Sunday': 'pentecost',
+    # Trinity
+    'Trinity Sunday': 'trinity-sunday',
+    # Sundays after Trinity -> CW Propers
+    '1st Sunday after Trinity': 'proper-4',
+    '2nd Sunday after Trinity': 'proper-5',
+    '3rd Sunday after Trinity': 'proper-6',
+    '4th Sunday after Trinity': 'proper-7',
+    '5th Sunday after Trinity': 'proper-8',
+    '6th Sunday after Trinity': 'proper-9',
+    '7th Sunday after Trinity': 'proper-10',
+    '8th Sunday after Trinity': 'proper-11',
+    '9th Sunday after Trinity': 'proper-12',
+    '10th Sunday after Trinity': 'proper-13',
+    '11th Sunday after Trinity': 'proper-14',
+    '12th Sunday after Trinity': 'proper-15',
+    '13th Sunday after Trinity': 'proper-16',
+    '14th Sunday after Trinity': 'proper-17',
+    '15th Sunday after Trinity': 'proper-18',
+    '16th Sunday after Trinity': 'proper-19',
+    '17th Sunday after Trinity': 'proper-20',
+    '18th Sunday after Trinity': 'proper-21',
+    '19th Sunday after Trinity': 'proper-22',
+    '20th Sunday after Trinity': 'proper-23',
+    '21st Sunday after Trinity': 'proper-24',
+    '22nd Sunday after Trinity': 'proper-25',
+    # Last weeks before Advent -> CW kingdom Sundays
+    '23rd Sunday after Trinity': 'kingdom-5',
+    '24th Sunday after Trinity': 'kingdom-4',
+    '25th Sunday after Trinity': 'kingdom-3',
+    '26th Sunday after Trinity': 'kingdom-2',
+    'Sunday next before Advent': 'christ-the-king',
+}
+
+# Proper of Saints "HolyDay" labels -> occasion slugs
+SAINT_SLUGS = {
+    'St Andrew': 'st-andrew',
+    'St Thomas': 'st-thomas',
+    'Conversion of St Paul': 'conversion-of-st-paul',
+    'Purification of the Virgin Mary': 'candlemas',
+    'St Matthias': 'st-matthias',
+    'Annunciation of Our Lady': 'annunciation',
+    'St Mark': 'st-mark',
+    'St Phillip and St James': 'ss-philip-and-james',
+    'St Barnabas': 'st-barnabas',
+    'St John Baptist': 'birth-of-st-john-baptist',
+    'St Peter': 'ss-peter-and-paul',
+    'St Mary Magdalene': 'st-mary-magdalene',
+    'St James': 'st-james',
+    'Transfiguration': 'transfiguration',
+    'St Bartholomew': 'st-bartholomew',
+    'St Matthew': 'st-matthew',
+    'St Michael': 'st-michael-all-angels',
+    'St Luke': 'st-luke',
+    'St Simon and St Jude': 'ss-simon-and-jude',
+    'All Saints': 'all-saints',
+}
+
+WEEKDAYS = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday')
+
+# Proper of Time columns after Day and Weekday, three to a group:
+# (context, first column, is NT). Evening Prayer numbers its lessons afresh.
+TIME_COLUMNS = (
+    ('morning_prayer', 2, False), ('morning_prayer', 5, True),
+    ('evening_prayer', 8, False), ('evening_prayer', 11, True),
+)
+EVENING_FIRST_COLUMN = 8
+
+GOSPEL_BOOKS = ('Matthew', 'Mark', 'Luke', 'John')
+NT_BOOKS = (
+    'Acts', 'Romans', 'Corinthians', 'Galatians', 'Ephesians', 'Philippians', 'Colossians',
+    'Thessalonians', 'Timothy', 'Titus', 'Philemon', 'Hebrews', 'James', 'Peter', 'Jude',
+    'John', 'Revelation',
+)
+
+_NUMBERED_EPISTLE_RE = re.compile(r'^\d\s*(Corinthians|Thessalonians|Timothy|Peter|John)')
+_REFERENCE_RE = re.compile(
+    r'^(\d?\s*[A-Za-z][A-Za-z\s]*?)\s+(\d+)(?::(\d+[a-z]?)(?:\s*[-–]\s*(\d+[a-z]?))?)?')
+# A first span that runs from a verse to the end of its chapter
+_TO_END_RE = re.compile(r'^[^:]*\d+:\d+[a-z]?\s*[-–]\s*end\b')
+_SPACES_RE = re.compile(r'\s+')
+
+
+def slug_table(valid_slugs):
+    """(Day label, Weekday) -> occasion slug for every Proper of Time row that has one.
+
+    Sundays have an empty Weekday. A weekday maps to its Sunday's slug with
+    the day's suffix ('advent-1-mon'), when that occasion exists.
+    """
+    table = {}
+    for label, slug in DAY_LABEL_SLUGS.items():
+        if slug in valid_slugs:
+            table[label, ''] = slug
+        for weekday, abbrev in zip(WEEKDAYS, DAY_ABBREVS[1:]):
+            if f'{slug}-{abbrev}' in valid_slugs:
+                table[label, weekday] = f'{slug}-{abbrev}'
+    return table
+
+
+def classify_reading(ref, is_nt_column):
+    """The reading type of a lesson, as classifyReading() in parse-bcp-office.ts."""
+    if ref.lower().startswith('psalm'):
+        return 'psalm'
+    if ref.startswith(GOSPEL_BOOKS):
+        return 'gospel'
+    if is_nt_column:
+        return 'epistle'
+    # An Old Testament column that holds a New Testament lesson
+    if _NUMBERED_EPISTLE_RE.match(ref) or any(book in ref for book in NT_BOOKS):
+        return 'epistle'
+    return 'old_testament'
+
+
+def parse_lesson_reference(ref):
+    """(book, chapter, verseStart, verseEnd) as parseReference() in parse-bcp-office.ts."""
+    m = _REFERENCE_RE.match(ref.replace('–', '-'))
+    if not m:
+        return None, None, None, None
+    return m.group(1).strip(), m.group(2), m.group(3), m.group(4)
+
+
+def make_lesson(slug, context, ref, is_nt_column, is_optional, sort_order):
+    """A Reading for one lesson, its "end" resolved to a verse number."""
+    ref = _SPACES_RE.sub(' ', ref).strip()
+    book, chapter, verse_start, verse_end = parse_lesson_reference(ref)
+    segments, ordinal_start, ordinal_end = locate_reference(ref)
+    if verse_end is None and segments and _TO_END_RE.match(ref):
+        first = segments[0]
+        if str(first.chapter) == chapter and first.chapter_end == first.chapter:
+            verse_end = str(first.verse_end)
+    return make_reading(
+        slug, 'bcp', context, classify_reading(ref, is_nt_column), ref, book, chapter,
+        verse_start, verse_end, None, is_optional, sort_order,
+        segments=segments, ordinal_start=ordinal_start, ordinal_end=ordinal_end,
+    )
+
+
+def _rows(path):
+    """Yield the trimmed cells of each non-blank data row of a CSV file."""
+    with open(path, encoding='utf-8', newline='') as f:
+        rows = csv.reader(f)
+        next(rows, None)
+        for row in rows:
+            row = [cell.strip() for cell in row]
+            if any(row):
+                yield row
+
+
+def _cell(row, i):
+    return row[i] if i < len(row) else ''
+
+
+def iter_time_readings(valid_slugs, path=TIME_CSV, skipped=None):
+    """Yield the Proper of Time readings; unmapped rows are added to skipped."""
+    table = slug_table(valid_slugs)
+    day_label = ''
+    for row in _rows(path):
+        # Weekday rows may leave the Day column empty
+        day_label = _cell(row, 0) or day_label
+        weekday = _cell(row, 1)
+        slug = table.get((day_label, weekday))
+        if slug is None:
+            # Weekdays without an occasion of their own are expected
+            if skipped is not None and (day_label, '') not in table:
+                skipped.add(f'{day_label} {weekday or "(Sunday)"}')
+            continue
+        sort_order = 0
+        for context, first, is_nt in TIME_COLUMNS:
+            if first == EVENING_FIRST_COLUMN:
+                sort_order = 0
+            refs = [ref for ref in (_cell(row, first + i) for i in range(3)) if ref]
+            for ref in refs:
+                sort_order += 1
+                # The second and third lessons of a column are alternatives
+                yield make_lesson(slug, context, ref, is_nt, refs.index(ref) > 0, sort_order)
+
+
+def iter_saint_readings(valid_slugs, path=SAINTS_CSV, skipped=None):
+    """Yield the Proper of Saints readings; unmapped holy days are added to skipped."""
+    for row in _rows(path):
+        holy_day = _cell(row, 0)
+        slug = SAINT_SLUGS.get(holy_day)
+        if slug is None or slug not in valid_slugs:
+            if skipped is not None:
+                skipped.add(holy_day)
+            continue
+        # Mattins, then second Evensong, then first Evensong (the evening
+        # before) as optional evening readings
+        for context, ot, nt, is_optional in (
+            ('morning_prayer', 4, 5, False),
+            ('evening_prayer', 6, 7, False),
+            ('evening_prayer', 2, 3, True),
+        ):
+            sort_order = 0
+            for col, is_nt in ((ot, False), (nt, True)):
+                ref = _cell(row, col)
+                if ref:
+                    sort_order += 1
+                    yield make_lesson(slug, context, ref, is_nt, is_optional, sort_order)
+
+
+def iter_readings(valid_slugs, time_path=TIME_CSV, saints_path=SAINTS_CSV, skipped=None):
+    """Yield every reading of both tables, dropping repeats as parse-bcp-office.ts does.
+
+    skipped, if given, is a dict of sets that collects the unmapped 'time'
+    and 'saints' rows.
+    """
+    skipped = skipped if skipped is not None else {}
+    seen = set()
+    for r in chain(
+        iter_time_readings(valid_slugs, time_path, skipped.setdefault('time', set())),
+        iter_saint_readings(valid_slugs, saints_path, skipped.setdefault('saints', set())),
+    ):
+        key = (r.occasion_slug, r.service_context, r.reading_type, r.reference, r.is_optional)
+        if key not in seen:
+            seen.add(key)
+            yield r
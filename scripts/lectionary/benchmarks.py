@@ -0,0 +1,350 @@
+"""Benchmarks for the lectionary build pipeline.
+
+Each benchmark times one stage on real data: the reference parsers over
+every distinct reference string in scripts/data/*.json, each generator's
+record building and its whole run, JSON load and dump of each dataset, and
+date map generation, and building compact reading records
+(lectionary.records). A benchmark is run several times and the best time is
+kept, since slower runs are noise from the rest of the machine.
+
+Results are saved as JSON (scripts/data/build/benchmarks/baseline.json by
+default) so a later run can be compared against them and any benchmark
+slower by more than a threshold reported as a regression.
+
+memory_usage() compares the memory held by every reading file loaded as
+dicts, as Readings and as a ReadingSet.
+"""
+
+import io
+import json
+import platform
+import runpy
+import statistics
+import sys
+import time
+import tracemalloc
+from collections import namedtuple
+from contextlib import redirect_stderr, redirect_stdout
+from datetime import datetime, timezone
+
+from lectionary.datasets import (
+    BUILD_DIR, COLLECTS_FILE, COMMEMORATION_OCCASIONS_FILE, DATA_DIR, OCCASIONS_FILE,
+    READING_FILES, SCRIPTS_DIR, load_json,
+)
+from lectionary import bcp_1922, occasions, office, principal
+from lectionary.date_map import DEFAULT_YEARS, iter_date_map
+from lectionary.records import Reading, ReadingSet
+from lectionary.references import parse_reference, parse_segments
+from lectionary.versification import locate_reference
+
+BASELINE_FILE = BUILD_DIR / 'benchmarks' / 'baseline.json'
+RESULTS_FORMAT = 'lectionary-benchmarks'
+RESULTS_VERSION = 1
+
+DEFAULT_REPEAT = 5
+# Slowdown, as a fraction of the baseline time, reported as a regression
+DEFAULT_THRESHOLD = 0.10
+# Differences smaller than this are timer noise whatever the percentage
+NOISE_FLOOR = 100e-6
+
+# Generator scripts and the function that builds each one's records
+GENERATORS = {
+    'occasions': ('generate-occasions.py', occasions.generate_weekday_occasions),
+    'cw-office': ('generate-cw-office.py', lambda: office.iter_entries('cw')),
+    'bcp-office': ('generate-bcp-office.py', lambda: office.iter_entries('bcp')),
+    'cw-principal': ('generate-cw-principal.py', principal.iter_readings),
+    'bcp-1922': ('parse-bcp-office.py',
+                 lambda: bcp_1922.iter_readings({o['slug'] for o in load_json(OCCASIONS_FILE)})),
+}
+
+DATE_MAP_YEARS = {
+    'default': DEFAULT_YEARS,
+    '1900-2200': range(1900, 2201),
+}
+
+_CACHED = (parse_reference, parse_segments, locate_reference)
+
+# setup() does any untimed preparation and returns run(), which does the
+# timed work and returns how many units it processed
+Benchmark = namedtuple('Benchmark', 'name unit setup')
+Comparison = namedtuple('Comparison', 'name baseline current change status')
+MemoryUsage = namedtuple('MemoryUsage', 'name records bytes peak')
+
+
+def _clear_caches():
+    # Every run starts cold, so the time is for parsing rather than lookups
+    for cached in _CACHED:
+        cached.cache_clear()
+
+
+def reference_corpus(data_dir=DATA_DIR):
+    """Every distinct reference string in the committed datasets, sorted."""
+    refs = set()
+    for path in sorted(data_dir.glob('*.json')):
+        records = load_json(path)
+        if isinstance(records, list):
+            refs.update(r['reference'] for r in records
+                        if isinstance(r, dict) and isinstance(r.get('reference'), str))
+    return sorted(refs)
+
+
+def _reference_benchmark(parse):
+    def setup():
+        corpus = reference_corpus()
+
+        def run():
+            _clear_caches()
+            for ref in corpus:
+                parse(ref)
+            return len(corpus)
+        return run
+    return setup
+
+
+def _load_generator(script):
+    # Running under another name defines the module without calling main()
+    return runpy.run_path(str(SCRIPTS_DIR / script), run_name='lectionary_benchmark')
+
+
+def _build_benchmark(build):
+    def setup():
+        def run():
+            _clear_caches()
+            return sum(1 for _ in build())
+        return run
+    return setup
+
+
+def _generator_benchmark(script):
+    """The generator's whole main(), writing NDJSON to memory unvalidated."""
+    def setup():
+        main = _load_generator(script)['main']
+
+        def run():
+            _clear_caches()
+            sink = io.StringIO()
+            with redirect_stdout(sink), redirect_stderr(io.StringIO()):
+                argv, sys.argv = sys.argv, [script, '-o', '-', '--no-validate']
+                try:
+                    main()
+                finally:
+                    sys.argv = argv
+            return sink.getvalue().count('\n')
+        return run
+    return setup
+
+
+def _json_load_benchmark(path):
+    def setup():
+        text = path.read_text(encoding='utf-8')
+
+        def run():
+            records = json.loads(text)
+            return len(records)
+        return run
+    return setup
+
+
+def _json_dump_benchmark(path, ndjson):
+    def setup():
+        records = load_json(path)
+        encode = json.JSONEncoder(ensure_ascii=False, separators=(',', ':')).encode
+
+        def run():
+            if ndjson:
+                for record in records:
+                    encode(record)
+            else:
+                json.dumps(records, indent=2, ensure_ascii=False)
+            return len(records)
+        return run
+    return setup
+
+
+def _records_benchmark(container):
+    """Converting every reading dict to a Reading, kept in container."""
+    def setup():
+        records = [r for path in READING_FILES if path.exists() for r in load_json(path)]
+
+        def run():
+            return len(container(map(Reading.from_json, records)))
+        return run
+    return setup
+
+
+def _date_map_benchmark(years):
+    def setup():
+        occasions = load_json(OCCASIONS_FILE)
+        commemorations = load_json(COMMEMORATION_OCCASIONS_FILE)
+        slugs = {o['slug'] for o in occasions} | {o['slug'] for o in commemorations}
+
+        def run():
+            return sum(1 for _ in iter_date_map(slugs, commemorations, years))
+        return run
+    return setup
+
+
+def all_benchmarks():
+    """Every benchmark, in the order they are run."""
+    benchmarks = [
+        Benchmark('references.parse_reference', 'references', _reference_benchmark(parse_reference)),
+        Benchmark('references.parse_segments', 'references', _reference_benchmark(parse_segments)),
+        Benchmark('versification.locate_reference', 'references',
+                  _reference_benchmark(locate_reference)),
+    ]
+    for name, (script, build) in GENERATORS.items():
+        benchmarks.append(Benchmark(f'generator.{name}.build', 'records', _build_benchmark(build)))
+        benchmarks.append(Benchmark(f'generator.{name}', 'records', _generator_benchmark(script)))
+    for path in sorted(DATA_DIR.glob('*.json')):
+        stem = path.name[:-len('.json')]
+        benchmarks.append(Benchmark(f'json.load.{stem}', 'records', _json_load_benchmark(path)))
+        benchmarks.append(Benchmark(f'json.dump.{stem}', 'records', _json_dump_benchmark(path, False)))
+        # The collects overlay is one object keyed by slug, never NDJSON
+        if path != COLLECTS_FILE:
+            benchmarks.append(Benchmark(f'ndjson.dump.{stem}', 'records',
+                                        _json_dump_benchmark(path, True)))
+    benchmarks.append(Benchmark('records.readings', 'records', _records_benchmark(list)))
+    benchmarks.append(Benchmark('records.reading_set', 'records', _records_benchmark(ReadingSet)))
+    for label, years in DATE_MAP_YEARS.items():
+        benchmarks.append(Benchmark(f'date_map.{label}', 'mappings', _date_map_benchmark(years)))
+    return benchmarks
+
+
+def select(benchmarks, patterns):
+    """The benchmarks whose names contain any of patterns (all if none)."""
+    if not patterns:
+        return list(benchmarks)
+    return [b for b in benchmarks if any(p in b.name for p in patterns)]
+
+
+def measure(benchmark, repeat=DEFAULT_REPEAT):
+    """Run a benchmark repeat times and return its result record."""
+    run = benchmark.setup()
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        units = run()
+        times.append(time.perf_counter() - t0)
+    best = min(times)
+    return {
+        'seconds': best,
+        'median': statistics.median(times),
+        'units': units,
+        'unit': benchmark.unit,
+        'rate': units / best if best else None,
+        'repeat': repeat,
+    }
+
+
+def run_benchmarks(benchmarks, repeat=DEFAULT_REPEAT, progress=None):
+    """Results for benchmarks as a JSON-ready dict; progress(name, result) after each."""
+    results = {}
+    for benchmark in benchmarks:
+        results[benchmark.name] = result = measure(benchmark, repeat)
+        if progress:
+            progress(benchmark.name, result)
+    return {
+        'format': RESULTS_FORMAT,
+        'version': RESULTS_VERSION,
+        'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': results,
+    }
+
+
+def load_results(path):
+    results = load_json(path)
+    if results.get('format') != RESULTS_FORMAT or results.get('version') != RESULTS_VERSION:
+        raise ValueError(f'{path} is not a version {RESULTS_VERSION} benchmark results file')
+    return results
+
+
+def save_results(results, path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+        f.write('\n')
+
+
+def _load_dicts(paths):
+    return [r for path in paths for r in load_json(path)]
+
+
+def _load_readings(paths):
+    return [Reading.from_json(r) for path in paths for r in load_json(path)]
+
+
+def _load_reading_set(paths):
+    readings = ReadingSet()
+    for path in paths:
+        readings.extend(map(Reading.from_json, load_json(path)))
+    return readings
+
+
+# Ways of holding every reading in memory, compared by memory_usage()
+MEMORY_LAYOUTS = {
+    'dicts': _load_dicts,
+    'readings': _load_readings,
+    'reading_set': _load_reading_set,
+}
+
+
+def memory_usage(paths=READING_FILES):
+    """A MemoryUsage for loading every reading file in each of MEMORY_LAYOUTS.
+
+    bytes is what tracemalloc still finds allocated once the readings are
+    loaded (the memory they hold on to), peak the most used while loading.
+    """
+    paths = [path for path in paths if path.exists()]
+    usage = []
+    for name, load in MEMORY_LAYOUTS.items():
+        tracemalloc.start()
+        try:
+            readings = load(paths)
+            current, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        usage.append(MemoryUsage(name, len(readings), current, peak))
+        del readings
+    return usage
+
+
+def compare(baseline, current, threshold=DEFAULT_THRESHOLD):
+    """A Comparison for each benchmark in either set of results, in current's order.
+
+    status is 'regression' when current is slower than baseline by more than
+    threshold (and NOISE_FLOOR), 'faster' when quicker by as much, 'ok' in
+    between, and 'new' or 'missing' when only one set has the benchmark.
+    """
+    base, cur = baseline['results'], current['results']
+    comparisons = []
+    for name in list(cur) + [n for n in base if n not in cur]:
+        if name not in base:
+            comparisons.append(Comparison(name, None, cur[name]['seconds'], None, 'new'))
+            continue
+        if name not in cur:
+            comparisons.append(Comparison(name, base[name]['seconds'], None, None, 'missing'))
+            continue
+        before, after = base[name]['seconds'], cur[name]['seconds']
+        change = after / before - 1 if before else 0.0
+        if abs(after - before) < NOISE_FLOOR:
+            status = 'ok'
+        elif change > threshold:
+            status = 'regression'
+        elif change < -threshold:
+            status = 'faster'
+        else:
+            status = 'ok'
+        comparisons.append(Comparison(name, before, after, change, status))
+    return comparisons
+
+
+def format_seconds(seconds):
+    if seconds is None:
+        return '-'
+    if seconds < 1e-3:
+        return f'{seconds * 1e6:.0f} µs'
+    if seconds < 1:
+        return f'{seconds * 1e3:.1f} ms'
+    return f'{seconds:.2f} s'
@@ -0,0 +1,129 @@
+"""Every spelling of a book name the datasets and users write, and its canonical name.
+
+The datasets name books inconsistently: "Psalm" and "Psalms", "Song of
+Songs", "Susannah", "Wisdom of Solomon"; people type "1 Cor", "Ps" or "II
+Kings". alias_table() expands each canonical name (the names of the
+lectionary.versification table) into its abbreviations, singular and
+plural forms and, for numbered books, every way of writing the number,
+once at import time. A name is then found with a dict lookup on the name
+itself or on its book_key(): no regular expressions and no scanning.
+
+Canonical names are interned, so every record that holds a book shares one
+string object per book.
+"""
+
+import sys
+
+# Other names and abbreviations of each book, without the number of
+# numbered books ('Samuel' stands for '1 Samuel' and '2 Samuel')
+ABBREVIATIONS = {
+    'Genesis': ('Gen', 'Gn', 'Ge'),
+    'Exodus': ('Exod', 'Ex', 'Exo'),
+    'Leviticus': ('Lev', 'Lv'),
+    'Numbers': ('Num', 'Nm', 'Nb'),
+    'Deuteronomy': ('Deut', 'Dt', 'Deu'),
+    'Joshua': ('Josh', 'Jos'),
+    'Judges': ('Judg', 'Jdg', 'Jgs'),
+    'Ruth': ('Rth', 'Ru'),
+    'Samuel': ('Sam', 'Sm', 'Sa'),
+    'Kings': ('Kgs', 'Kin', 'Ki'),
+    'Chronicles': ('Chron', 'Chr'),
+    'Ezra': ('Ezr',),
+    'Nehemiah': ('Neh', 'Ne'),
+    'Esther': ('Esth', 'Est'),
+    'Job': ('Jb',),
+    'Psalms': ('Psalm', 'Ps', 'Pss', 'Psa', 'Psalter'),
+    'Proverbs': ('Proverb', 'Prov', 'Prv', 'Pr'),
+    'Ecclesiastes': ('Eccles', 'Eccl', 'Ecc', 'Qoheleth'),
+    'Song of Solomon': ('Song of Songs', 'Song of Sol', 'Song', 'Canticles', 'Cant'),
+    'Isaiah': ('Isa', 'Is'),
+    'Jeremiah': ('Jer',),
+    'Lamentations': ('Lam',),
+    'Ezekiel': ('Ezek', 'Ezk'),
+    'Daniel': ('Dan', 'Dn'),
+    'Hosea': ('Hos',),
+    'Joel': ('Jl',),
+    'Amos': ('Am',),
+    'Obadiah': ('Obad', 'Ob'),
+    'Jonah': ('Jon',),
+    'Micah': ('Mic',),
+    'Nahum': ('Nah',),
+    'Habakkuk': ('Hab',),
+    'Zephaniah': ('Zeph', 'Zep'),
+    'Haggai': ('Hag',),
+    'Zechariah': ('Zech', 'Zec'),
+    'Malachi': ('Mal',),
+    'Esdras': ('Esd',),
+    'Tobit': ('Tob',),
+    'Judith': ('Jdt',),
+    'Wisdom': ('Wisdom of Solomon', 'Wis'),
+    'Ecclesiasticus': ('Sirach', 'Ben Sira', 'Ecclus', 'Sir'),
+    'Baruch': ('Bar',),
+    'Song of the Three Children': ('Song of the Three', 'Song of the Three Holy Children',
+                                   'Song of Three Children'),
+    'Susanna': ('Susannah', 'Sus'),
+    'Bel and the Dragon': ('Bel',),
+    'Prayer of Manasseh': ('Prayer of Manasses', 'Pr Man', 'Manasseh'),
+    'Maccabees': ('Macc', 'Mac'),
+    'Matthew': ('Matt', 'Mt'),
+    'Mark': ('Mk', 'Mrk'),
+    'Luke': ('Lk', 'Luk'),
+    'John': ('Jn', 'Joh'),
+    'Acts': ('Acts of the Apostles',),
+    'Romans': ('Rom', 'Rm'),
+    'Corinthians': ('Cor',),
+    'Galatians': ('Gal',),
+    'Ephesians': ('Eph',),
+    'Philippians': ('Phil', 'Php'),
+    'Colossians': ('Col',),
+    'Thessalonians': ('Thess', 'Thes'),
+    'Timothy': ('Tim', 'Tm'),
+    'Titus': ('Tit',),
+    'Philemon': ('Philem', 'Phlm', 'Phm'),
+    'Hebrews': ('Heb',),
+    'James': ('Jas', 'Jm'),
+    'Peter': ('Pet', 'Pt'),
+    'Jude': (),
+    'Revelation': ('Revelations', 'Rev', 'Rv', 'Apocalypse'),
+}
+
+# Ways of writing the number of a numbered book
+NUMBER_FORMS = {
+    '1': ('1', 'I', 'First', '1st'),
+    '2': ('2', 'II', 'Second', '2nd'),
+    '3': ('3', 'III', 'Third', '3rd'),
+}
+
+
+def book_key(name):
+    """The lookup key of a name: lower case, no full stops, single spaces."""
+    return ' '.join(name.replace('.', ' ').split()).lower()
+
+
+def _spellings(name):
+    number, _, base = name.partition(' ')
+    if number not in NUMBER_FORMS:
+        return (name,) + ABBREVIATIONS.get(name, ())
+    spellings = []
+    for short in (base,) + ABBREVIATIONS.get(base, ()):
+        for prefix in NUMBER_FORMS[number]:
+            spellings.append(f'{prefix} {short}')
+            if prefix[0].isdigit():
+                # '1Cor', '1Samuel'
+                spellings.append(f'{prefix}{short}')
+    return spellings
+
+
+def alias_table(names):
+    """{spelling or book_key(): canonical name} for the canonical names given.
+
+    Raises ValueError if two books share a spelling.
+    """
+    table = {}
+    for name in names:
+        canonical = sys.intern(name)
+        for spelling in _spellings(name):
+            for key in (spelling, book_key(spelling)):
+                if table.setdefault(key, canonical) is not canonical:
+                    raise ValueError(f'{spelling!r} names both {table[key]} and {name}')
+    return table
@@ -0,0 +1,198 @@
+"""Liturgical calendar arithmetic, matching src/lib/utils/liturgical-date.ts.
+
+Easter dates for 1583-4099 are read from a one-byte-per-year table built
+at import; other years fall back to the computus. calendar_year() builds
+and memoises a CalendarYear, which holds the year as a run-length timeline:
+the first date of each season run, in order, and a shared DayInfo for each
+run. day_info() looks a date up with one bisect and returns that shared
+tuple, so answering a date allocates nothing. timeline_json() exports the
+runs for a range of years (scripts/export-calendar.py).
+"""
+
+from bisect import bisect_right
+from collections import namedtuple
+from datetime import date, timedelta
+from functools import lru_cache
+
+# Years covered by the Easter table: the first full Gregorian year to 4099,
+# the range published Easter tables conventionally cover
+EASTER_TABLE_YEARS = range(1583, 4100)
+
+DayInfo = namedtuple('DayInfo', 'season colour liturgical_year office_year')
+
+TIMELINE_FORMAT = 'liturgical-timeline'
+TIMELINE_VERSION = 1
+TIMELINE_FIELDS = ('start', 'season', 'colour', 'liturgicalYear', 'officeYear')
+
+# The colour getLiturgicalSeason() gives each season
+SEASON_COLOURS = {
+    'christmas': 'white',
+    'epiphany': 'white',
+    'ordinary_time': 'green',
+    'lent': 'purple',
+    'holy_week': 'red',
+    'easter': 'white',
+    'ascension': 'white',
+    'pentecost': 'red',
+    'kingdom': 'red',
+    'advent': 'purple',
+}
+
+
+def computus(year):
+    """Easter Day (Meeus/Jones/Butcher computus)."""
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return date(year, month, day + 1)
+
+
+# Easter Day as days after 21 March (1 to 35), one byte per year
+_EASTER_TABLE = bytes(
+    (computus(y) - date(y, 3, 21)).days for y in EASTER_TABLE_YEARS
+)
+
+
+def easter(year):
+    """Easter Day, from the table where it covers the year."""
+    if year not in EASTER_TABLE_YEARS:
+        return computus(year)
+    offset = _EASTER_TABLE[year - EASTER_TABLE_YEARS.start]
+    return date(year, 3, 21 + offset) if offset <= 10 else date(year, 4, offset - 10)
+
+
+def js_weekday(d):
+    """Day of the week counted from Sunday = 0, as Date.getDay() does."""
+    return (d.weekday() + 1) % 7
+
+
+def advent_sunday(year):
+    christmas = date(year, 12, 25)
+    weekday = js_weekday(christmas)
+    return christmas - timedelta(days=28 if weekday == 0 else weekday + 21)
+
+
+def _cycle_years(year):
+    """(Sunday cycle year, office year) of the liturgical year beginning in Advent of year."""
+    return 'ABC'[(year + 1) % 3 - 1], '1' if year % 2 == 1 else '2'
+
+
+# Every DayInfo is one of a few dozen; sharing them keeps years small
+_day_infos = {}
+
+
+def _shared_day_info(*fields):
+    return _day_infos.setdefault(fields, DayInfo(*fields))
+
+
+class CalendarYear:
+    """One calendar year as runs of days with the same DayInfo."""
+
+    __slots__ = ('year', 'easter', 'advent_sunday', 'starts', 'infos')
+
+    def __init__(self, year):
+        self.year = year
+        self.easter = easter(year)
+        self.advent_sunday = advent_sunday(year)
+        day = timedelta(days=1)
+        runs = [
+            (date(year, 1, 1), 'christmas'),
+            (date(year, 1, 6), 'epiphany'),
+            (date(year, 2, 2) + day, 'ordinary_time'),
+            (self.easter - 46 * day, 'lent'),
+            (self.easter - 7 * day, 'holy_week'),
+            (self.easter, 'easter'),
+            (self.easter + 39 * day, 'ascension'),
+            (self.easter + 49 * day, 'pentecost'),
+            (self.easter + 56 * day, 'ordinary_time'),
+            # Kingdom season: the four weeks before Advent
+            (self.advent_sunday - 28 * day, 'kingdom'),
+            (self.advent_sunday, 'advent'),
+            (date(year, 12, 25), 'christmas'),
+        ]
+        before, after = _cycle_years(year - 1), _cycle_years(year)
+        self.starts = [start for start, _ in runs]
+        self.infos = [
+            _shared_day_info(season, SEASON_COLOURS[season],
+                             *(after if start >= self.advent_sunday else before))
+            for start, season in runs
+        ]
+
+    def day_info(self, d):
+        """DayInfo for a date in this year."""
+        return self.infos[bisect_right(self.starts, d) - 1]
+
+    def runs(self):
+        """(first date, last date, DayInfo) for each run in the year."""
+        ends = [start - timedelta(days=1) for start in self.starts[1:]]
+        ends.append(date(self.year, 12, 31))
+        return zip(self.starts, ends, self.infos)
+
+
+@lru_cache(maxsize=None)
+def calendar_year(year):
+    return CalendarYear(year)
+
+
+def day_info(d):
+    """(season, colour, liturgical_year, office_year) for a date."""
+    return calendar_year(d.year).day_info(d)
+
+
+def liturgical_year(d):
+    """Principal service year 'A', 'B' or 'C' for a date."""
+    return day_info(d).liturgical_year
+
+
+def office_year(d):
+    """Weekday office and eucharist year '1' or '2' for a date."""
+    return day_info(d).office_year
+
+
+def timeline(years):
+    """(first date, last date, DayInfo) runs across years, merged where they meet."""
+    current = None
+    for year in years:
+        for start, end, info in calendar_year(year).runs():
+            if current and info is current[2] and start == current[1] + timedelta(days=1):
+                current = (current[0], end, info)
+                continue
+            if current:
+                yield current
+            current = (start, end, info)
+    if current:
+        yield current
+
+
+def timeline_json(years):
+    """The merged timeline for years as a JSON-ready dict.
+
+    Each run is [start, season, colour, liturgicalYear, officeYear] and
+    lasts until the day before the next run's start (the last until end),
+    so a date is found by binary search on the ISO start strings.
+    """
+    runs = list(timeline(years))
+    return {
+        'format': TIMELINE_FORMAT,
+        'version': TIMELINE_VERSION,
+        'fields': list(TIMELINE_FIELDS),
+        'runs': [[start.isoformat(), *info] for start, _, info in runs],
+        'end': runs[-1][1].isoformat() if runs else None,
+    }
+
+
+def sundays_between(start, end):
+    """Every Sunday from start to end inclusive."""
+    current = start + timedelta(days=(7 - js_weekday(start)) % 7)
+    sundays = []
+    while current <= end:
+        sundays.append(current)
+        current += timedelta(days=7)
+    return sundays
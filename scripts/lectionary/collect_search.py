@@ -0,0 +1,88 @@
+"""Full-text search over the collects and post-communion prayers.
+
+The prayers are stored with their line breaks and indentation
+("Almighty God,\\ngive us grace ...\\n   to judge the living"), and a LIKE
+scan over collect_cw reads every row, misses phrases split across lines
+and finds "light" inside "lighten". normalize_text() makes each prayer a
+single line, and lectionary.database.seed_collect_search() loads the
+prayers into an SQLite FTS5 table with one row per occasion and prayer:
+
+  lectionary_collect_search(slug, prayer, text)
+
+slug is the occasion's slug and prayer its column (collectCw, collectBcp
+or postCommunionCw); only text is indexed. Queries use FTS5 syntax
+('"armour of light"', 'light NOT darkness', 'merc*'), results are ranked
+by bm25 and snippet() marks the matching words.
+
+The table is built by Python rather than Drizzle, which cannot declare a
+virtual table; drizzle.config.ts leaves it and its shadow tables alone.
+"""
+
+import sqlite3
+from collections import namedtuple
+
+SEARCH_TABLE = 'lectionary_collect_search'
+
+# (occasion column, prayer name), in the order an occasion's rows are stored
+PRAYERS = (
+    ('collect_cw', 'collectCw'),
+    ('collect_bcp', 'collectBcp'),
+    ('post_communion_cw', 'postCommunionCw'),
+)
+
+# Words are stemmed, so "mercy" also finds "mercies" and "merciful"
+CREATE_SQL = (f'CREATE VIRTUAL TABLE {SEARCH_TABLE} USING fts5('
+              "slug UNINDEXED, prayer UNINDEXED, text, "
+              "tokenize = 'porter unicode61 remove_diacritics 2')")
+
+# Most words in a snippet, and the marks either side of each match
+SNIPPET_WORDS = 12
+SNIPPET_MARKS = ('[', ']')
+
+Hit = namedtuple('Hit', 'slug name prayer snippet score')
+
+_QUOTES = str.maketrans({'‘': "'", '’': "'", '“': '"', '”': '"'})
+
+
+def normalize_text(text):
+    """A prayer as one line: line breaks and indentation become single spaces,
+    curly quotes straight ones."""
+    return ' '.join(text.translate(_QUOTES).split())
+
+
+def prayer_rows(occasions):
+    """(slug, prayer, text) for each prayer of occasion rows (slug, then PRAYERS' columns)."""
+    for slug, *texts in occasions:
+        for (_, prayer), text in zip(PRAYERS, texts):
+            if text and text.strip():
+                yield slug, prayer, normalize_text(text)
+
+
+def phrase_query(text):
+    """An FTS5 query matching text as a phrase, whatever punctuation it holds."""
+    return '"' + normalize_text(text).replace('"', '""') + '"'
+
+
+def search(conn, query, limit=20):
+    """The best Hits for an FTS5 query, best first.
+
+    Raises sqlite3.OperationalError if the query is not valid FTS5 syntax
+    or the table has not been built.
+    """
+    start, end = SNIPPET_MARKS
+    rows = conn.execute(
+        f'SELECT s.slug, o.name, s.prayer, '
+        f'snippet({SEARCH_TABLE}, 2, ?, ?, ?, ?), bm25({SEARCH_TABLE}) '
+        f'FROM {SEARCH_TABLE} s LEFT JOIN lectionary_occasions o ON o.slug = s.slug '
+        f'WHERE {SEARCH_TABLE} MATCH ? ORDER BY rank LIMIT ?',
+        (start, end, '...', SNIPPET_WORDS, query, limit))
+    return [Hit(*row) for row in rows]
+
+
+def search_collects(db_path, query, limit=20):
+    """search() on the database at db_path."""
+    conn = sqlite3.connect(db_path)
+    try:
+        return search(conn, query, limit)
+    finally:
+        conn.close()
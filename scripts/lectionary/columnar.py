@@ -0,0 +1,220 @@
+"""Dictionary-encoded columnar files for record datasets.
+
+The JSON data files repeat the same keys and a handful of values in every
+record ("tradition": "cw", "serviceContext": "evening_prayer", ...). A
+columnar file stores each key once, as a column:
+
+  - "int" columns hold integers (and null) in the narrowest packed signed
+    array that fits them; the type's minimum value stands for null
+  - "dict" columns hold everything else: a list of distinct values plus a
+    packed array of codes into it. Lists and objects (segments) are
+    dictionary-encoded by their JSON text.
+
+Packed arrays are little-endian and base64-encoded inside a small JSON
+document, so seed-lectionary.ts can read them with Buffer and typed arrays.
+A column that some records lack carries a "missing" bitmap, and columns are
+kept in record key order, so records() returns exactly the original dicts.
+"""
+
+import json
+import sys
+from array import array
+from base64 import b64decode, b64encode
+from pathlib import Path
+
+FORMAT = 'lectionary-columns'
+FORMAT_VERSION = 1
+SUFFIX = '.columns.json'
+
+# Signed array typecodes by size; the minimum of each is reserved for null
+INT_WIDTHS = ('b', 'h', 'i')
+_INT_MIN, _INT_MAX = -2 ** 31 + 1, 2 ** 31 - 1
+
+
+def _pack(values, typecode):
+    data = array(typecode, values)
+    if sys.byteorder == 'big':
+        data.byteswap()
+    return b64encode(data.tobytes()).decode('ascii')
+
+
+def _unpack(text, typecode):
+    data = array(typecode)
+    data.frombytes(b64decode(text))
+    if sys.byteorder == 'big':
+        data.byteswap()
+    return data
+
+
+def _code_width(size):
+    if size <= 0xFF:
+        return 'B'
+    if size <= 0xFFFF:
+        return 'H'
+    return 'I'
+
+
+def _pack_bits(flags):
+    bits = bytearray((len(flags) + 7) // 8)
+    for i, flag in enumerate(flags):
+        if flag:
+            bits[i >> 3] |= 1 << (i & 7)
+    return b64encode(bytes(bits)).decode('ascii')
+
+
+def _unpack_bits(text, count):
+    bits = b64decode(text)
+    return [bool(bits[i >> 3] & (1 << (i & 7))) for i in range(count)]
+
+
+def _int_null(typecode):
+    return -2 ** (8 * array(typecode).itemsize - 1)
+
+
+def _int_width(values):
+    present = [v for v in values if v is not None]
+    lo, hi = (min(present), max(present)) if present else (0, 0)
+    for typecode in INT_WIDTHS:
+        null = _int_null(typecode)
+        if null < lo and hi < -null:
+            return typecode
+    return 'i'
+
+
+def _is_int(value):
+    return value is None or (type(value) is int and _INT_MIN <= value <= _INT_MAX)
+
+
+class _ColumnBuilder:
+    """Accumulates one column while records stream past."""
+
+    def __init__(self, name, row):
+        self.name = name
+        self.values = [None] * row
+        self.missing = [True] * row
+
+    def add(self, value):
+        self.values.append(value)
+        self.missing.append(False)
+
+    def skip(self):
+        self.values.append(None)
+        self.missing.append(True)
+
+    def encode(self):
+        column = {'name': self.name}
+        if all(map(_is_int, self.values)):
+            width = _int_width(self.values)
+            null = _int_null(width)
+            column.update(type='int', width=width,
+                          data=_pack([null if v is None else v for v in self.values], width))
+        else:
+            index = {}
+            values = []
+            codes = []
+            for value in self.values:
+                key = json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+                code = index.get(key)
+                if code is None:
+                    code = index[key] = len(values)
+                    values.append(value)
+                codes.append(code)
+            width = _code_width(len(values))
+            column.update(type='dict', values=values, width=width, codes=_pack(codes, width))
+        if any(self.missing):
+            column['missing'] = _pack_bits(self.missing)
+        return column
+
+
+def encode_records(records):
+    """Build the columnar document for an iterable of flat-ish dicts."""
+    columns = {}
+    order = []
+    count = 0
+    for record in records:
+        previous = None
+        for key, value in record.items():
+            builder = columns.get(key)
+            if builder is None:
+                builder = columns[key] = _ColumnBuilder(key, count)
+                # Keep the relative key order of the record that introduced it
+                order.insert(order.index(previous) + 1 if previous else 0, key)
+            builder.add(value)
+            previous = key
+        for key, builder in columns.items():
+            if len(builder.values) == count:
+                builder.skip()
+        count += 1
+    return {
+        'format': FORMAT,
+        'version': FORMAT_VERSION,
+        'count': count,
+        'columns': [columns[key].encode() for key in order],
+    }
+
+
+def write_columns(records, f):
+    """Write records to an open file in columnar form; return the record count."""
+    document = encode_records(records)
+    json.dump(document, f, ensure_ascii=False, separators=(',', ':'))
+    return document['count']
+
+
+class ColumnarTable:
+    """A decoded columnar file: whole columns, or records rebuilt on demand."""
+
+    def __init__(self, document):
+        if document.get('format') != FORMAT or document.get('version') != FORMAT_VERSION:
+            raise ValueError('not a lectionary columnar file (or a different version)')
+        self.count = document['count']
+        self.names = [c['name'] for c in document['columns']]
+        self._columns = {c['name']: c for c in document['columns']}
+        self._decoded = {}
+
+    def __len__(self):
+        return self.count
+
+    def column(self, name):
+        """All values of one column, with None where the key is missing."""
+        values = self._decoded.get(name)
+        if values is None:
+            spec = self._columns[name]
+            if spec['type'] == 'int':
+                null = _int_null(spec['width'])
+                values = [None if v == null else v for v in _unpack(spec['data'], spec['width'])]
+            else:
+                lookup = spec['values']
+                values = [lookup[code] for code in _unpack(spec['codes'], spec['width'])]
+            self._decoded[name] = values
+        return values
+
+    def _missing(self, name):
+        spec = self._columns[name]
+        if 'missing' not in spec:
+            return None
+        return _unpack_bits(spec['missing'], self.count)
+
+    def records(self):
+        """Yield the original records as dicts."""
+        columns = [(name, self.column(name), self._missing(name)) for name in self.names]
+        for i in range(self.count):
+            yield {
+                name: values[i]
+                for name, values, missing in columns
+                if missing is None or not missing[i]
+            }
+
+
+def load_columns(path):
+    with open(path, encoding='utf-8') as f:
+        return ColumnarTable(json.load(f))
+
+
+def columnar_path(path):
+    """lectionary-readings-cw-office.json -> lectionary-readings-cw-office.columns.json"""
+    name = Path(path).name
+    for suffix in (SUFFIX, '.ndjson', '.json'):
+        if name.endswith(suffix):
+            name = name[:-len(suffix)]
+            break
+    return Path(path).with_name(name + SUFFIX)
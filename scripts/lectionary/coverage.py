@@ -0,0 +1,277 @@
+"""Verse coverage of the lectionaries, as bitsets over the verse ordinals.
+
+Every reading is placed on the global verse axis of lectionary.versification
+(ordinals 0 to TOTAL_VERSES - 1). A group of readings, such as a tradition
+or a tradition's service context, then has
+
+  - bits: a Python int with bit n set when verse n is read at least once
+  - counts: an array of how many of the group's readings include each verse
+
+An int is an arbitrary-length bitset whose &, |, ~ and bit_count() run in
+C over all 36,718 verses at once, so overlaps between groups and never-read
+gaps cost a few big-integer operations each. Counts come from a difference
+array summed with itertools.accumulate.
+
+Groups are named 'all', a tradition ('cw'), or a tradition and service
+context ('cw:morning_prayer'); 'office' stands for morning and evening
+prayer together ('bcp:office').
+"""
+
+import csv
+import json
+from array import array
+from itertools import accumulate
+
+from lectionary.datasets import READING_FILES, iter_readings
+from lectionary.versification import (
+    BOOK_ORDER, TOTAL_VERSES, book_range, canonical_book, chapter_count, chapter_range,
+    ordinal_to_verse, reference_spans,
+)
+
+ALL = 'all'
+CONTEXT_ALIASES = {'office': ('morning_prayer', 'evening_prayer')}
+
+# Parts of the verse axis reported by summary()
+TESTAMENTS = (
+    ('Old Testament', 'Genesis', 'Malachi'),
+    ('Apocrypha', '1 Esdras', '2 Maccabees'),
+    ('New Testament', 'Matthew', 'Revelation'),
+)
+
+
+def span_mask(start, end):
+    """The bitset of ordinals start to end inclusive."""
+    return ((1 << (end - start + 1)) - 1) << start
+
+
+ALL_VERSES = span_mask(0, TOTAL_VERSES - 1)
+
+
+def runs(bits):
+    """The (start, end) ordinal ranges of consecutive set bits, in order."""
+    found = []
+    while bits:
+        start = (bits & -bits).bit_length() - 1
+        shifted = bits >> start
+        # ~shifted & (shifted + 1) isolates the first clear bit above the run
+        length = (~shifted & (shifted + 1)).bit_length() - 1
+        found.append((start, start + length - 1))
+        bits &= ~span_mask(start, start + length - 1)
+    return found
+
+
+def _merge(spans):
+    merged = []
+    for start, end in sorted(spans):
+        if merged and start <= merged[-1][1] + 1:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def parse_group(spec):
+    """(tradition, contexts) for a group name; None matches anything."""
+    if spec == ALL:
+        return None, None
+    tradition, _, context = spec.partition(':')
+    if not context:
+        return tradition, None
+    return tradition, CONTEXT_ALIASES.get(context, (context,))
+
+
+class Coverage:
+    """The verses read by one group of readings."""
+
+    __slots__ = ('name', 'readings', 'bits', 'counts')
+
+    def __init__(self, name, readings, bits, counts):
+        self.name = name
+        self.readings = readings
+        self.bits = bits
+        self.counts = counts
+
+    def verses(self, within=ALL_VERSES):
+        """How many verses (of the bitset within) are read at least once."""
+        return (self.bits & within).bit_count()
+
+    def reads(self, start, end):
+        """Total readings over the verses start to end: the sum of their counts."""
+        return sum(self.counts[start:end + 1])
+
+    def gaps(self, within=ALL_VERSES):
+        """Never-read (start, end) ranges of within, split at book boundaries."""
+        found = []
+        for start, end in runs(~self.bits & within):
+            while start <= end:
+                book_end = book_range(ordinal_to_verse(start)[0])[1]
+                found.append((start, min(end, book_end)))
+                start = book_end + 1
+        return found
+
+
+class VerseCoverage:
+    """Reading spans of every (tradition, service context), and their Coverage."""
+
+    def __init__(self, spans):
+        # spans: {(tradition, context): [merged spans of one reading, ...]}
+        self.spans = spans
+        self._coverage = {}
+
+    @classmethod
+    def load(cls, paths=READING_FILES):
+        spans = {}
+        for _, reading in iter_readings(paths):
+            placed = reference_spans(reading['reference'])
+            if placed:
+                key = (reading['tradition'], reading.get('serviceContext') or 'principal')
+                spans.setdefault(key, []).append(_merge(placed))
+        return cls(spans)
+
+    def groups(self):
+        """Every group name with readings: all, each tradition, each tradition:context."""
+        traditions = sorted({t for t, _ in self.spans})
+        contexts = sorted(f'{t}:{c}' for t, c in self.spans)
+        return [ALL] + traditions + contexts
+
+    def coverage(self, spec):
+        """The Coverage of a group (see parse_group()); ValueError if it has no readings."""
+        coverage = self._coverage.get(spec)
+        if coverage is None:
+            coverage = self._coverage[spec] = self._build(spec)
+        return coverage
+
+    def _build(self, spec):
+        tradition, contexts = parse_group(spec)
+        readings = [
+            reading
+            for (t, c), group in self.spans.items()
+            if (tradition is None or t == tradition) and (contexts is None or c in contexts)
+            for reading in group
+        ]
+        if not readings:
+            raise ValueError(f'no readings in group {spec!r}')
+        diff = array('i', [0]) * (TOTAL_VERSES + 1)
+        every = []
+        for spans in readings:
+            for start, end in spans:
+                diff[start] += 1
+                diff[end + 1] -= 1
+            every.extend(spans)
+        bits = 0
+        for start, end in _merge(every):
+            bits |= span_mask(start, end)
+        counts = array('i', accumulate(diff))
+        del counts[TOTAL_VERSES:]
+        return Coverage(spec, len(readings), bits, counts)
+
+
+def book_mask(book):
+    span = book_range(book)
+    if span is None:
+        raise ValueError(f'unknown book: {book!r}')
+    return span_mask(*span)
+
+
+def testament_masks():
+    return [(name, span_mask(book_range(first)[0], book_range(last)[1]))
+            for name, first, last in TESTAMENTS]
+
+
+def summary(coverage, book=None):
+    """Verses read in total and in each testament (or in book), as a JSON-ready dict."""
+    masks = [(book, book_mask(book))] if book else [('Bible', ALL_VERSES)] + testament_masks()
+    parts = {}
+    for name, mask in masks:
+        verses = coverage.verses(mask)
+        total = mask.bit_count()
+        parts[name] = {'verses': verses, 'total': total, 'fraction': round(verses / total, 4)}
+    return {'group': coverage.name, 'readings': coverage.readings, 'coverage': parts}
+
+
+def overlap(a, b, within=ALL_VERSES):
+    """Verses of within read by both groups, by only one, and their Jaccard index."""
+    a_bits, b_bits = a.bits & within, b.bits & within
+    both = (a_bits & b_bits).bit_count()
+    either = (a_bits | b_bits).bit_count()
+    return {
+        'groups': [a.name, b.name],
+        'both': both,
+        'onlyFirst': (a_bits & ~b_bits).bit_count(),
+        'onlySecond': (b_bits & ~a_bits).bit_count(),
+        'neither': (within & ~(a_bits | b_bits)).bit_count(),
+        'jaccard': round(both / either, 4) if either else None,
+    }
+
+
+def format_span(start, end):
+    """A reference for an ordinal range: 'Psalms 119.1-8', 'Genesis 1.1-2.3'."""
+    book, chapter, verse = ordinal_to_verse(start)
+    end_book, end_chapter, end_verse = ordinal_to_verse(end)
+    if end_book != book:
+        return f'{book} {chapter}.{verse}-{end_book} {end_chapter}.{end_verse}'
+    if end_chapter != chapter:
+        return f'{book} {chapter}.{verse}-{end_chapter}.{end_verse}'
+    if end_verse != verse:
+        return f'{book} {chapter}.{verse}-{end_verse}'
+    return f'{book} {chapter}.{verse}'
+
+
+def chapter_heatmap(coverages, books=BOOK_ORDER, metric='covered'):
+    """One row per chapter of books: the share of its verses each group reads.
+
+    With metric 'reads' a cell is instead the mean number of readings per
+    verse of the chapter.
+    """
+    rows = []
+    for book in books:
+        for chapter in range(1, chapter_count(book) + 1):
+            start, end = chapter_range(book, chapter)
+            verses = end - start + 1
+            if metric == 'reads':
+                values = [round(c.reads(start, end) / verses, 3) for c in coverages]
+            else:
+                mask = span_mask(start, end)
+                values = [round(c.verses(mask) / verses, 3) for c in coverages]
+            rows.append([book, chapter, verses] + values)
+    return ['book', 'chapter', 'verses'], rows
+
+
+def verse_heatmap(coverages, book, chapters=None, metric='reads'):
+    """One row per verse of a book (or of some of its chapters): each group's count.
+
+    With metric 'covered' a cell is 1 if the group reads the verse, else 0.
+    """
+    if canonical_book(book) is None:
+        raise ValueError(f'unknown book: {book!r}')
+    book = canonical_book(book)
+    rows = []
+    for chapter in chapters or range(1, chapter_count(book) + 1):
+        span = chapter_range(book, chapter)
+        if span is None:
+            raise ValueError(f'{book} has no chapter {chapter}')
+        for ordinal in range(span[0], span[1] + 1):
+            if metric == 'covered':
+                values = [c.bits >> ordinal & 1 for c in coverages]
+            else:
+                values = [c.counts[ordinal] for c in coverages]
+            rows.append([book, chapter, ordinal - span[0] + 1] + values)
+    return ['book', 'chapter', 'verse'], rows
+
+
+def write_heatmap(f, header, rows, coverages, fmt='csv'):
+    """Write heatmap rows as CSV, or as JSON with one value list per group."""
+    groups = [c.name for c in coverages]
+    if fmt == 'csv':
+        writer = csv.writer(f, lineterminator='\n')
+        writer.writerow(header + groups)
+        writer.writerows(rows)
+        return
+    keys = len(header)
+    json.dump({
+        'groups': groups,
+        'rows': [dict(zip(header, row[:keys])) for row in rows],
+        'values': {g: [row[keys + i] for row in rows] for i, g in enumerate(groups)},
+    }, f, ensure_ascii=False, separators=(',', ':'))
+    f.write('\n')
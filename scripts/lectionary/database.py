@@ -0,0 +1,375 @@
+"""Bulk-load the lectionary tables of data/chapel-planner.db with sqlite3.
+
+Produces the same lectionary_occasions, lectionary_readings and
+lectionary_date_map rows as seed-lectionary.ts, but in one transaction:
+indexes on the three tables are dropped and recreated around the inserts,
+occasion ids are assigned in memory so slugs never need a lookup query, and
+every table is filled with a single executemany().
+
+seed_date_map() replaces just the date map, for example to cover other
+years than the seeder's. seed_resolved_readings() fills
+lectionary_resolved_readings from the seeded rows (lectionary.resolved);
+reseeding empties it, since its documents hold reading and occasion ids.
+seed_collect_search() rebuilds the full-text index of the seeded
+occasions' collects (lectionary.collect_search); reseeding empties that
+too, rather than leave it searching the old collects.
+
+The schema itself comes from Drizzle (npm run db:push); this module only
+replaces the rows.
+"""
+
+import sqlite3
+import time
+from pathlib import Path
+
+from lectionary.collect_search import CREATE_SQL, PRAYERS, SEARCH_TABLE, prayer_rows
+from lectionary.datasets import (
+    COLLECTS_FILE, COMMEMORATION_OCCASIONS_FILE, OCCASIONS_FILE, READING_FILES,
+    SCRIPTS_DIR, load_json, load_records, resolve_data_file,
+)
+from lectionary.date_map import DEFAULT_YEARS, iter_date_map
+from lectionary.records import ABSENT, Reading
+from lectionary.resolved import (
+    OCCASION_FIELDS, READING_FIELDS, TRADITIONS, ResolvedReadings, dumps, occasion_json,
+    reading_json,
+)
+
+DB_PATH = SCRIPTS_DIR.parent / 'data' / 'chapel-planner.db'
+
+TABLES = ('lectionary_occasions', 'lectionary_readings', 'lectionary_date_map')
+
+OCCASION_COLUMNS = (
+    'id', 'name', 'slug', 'season', 'colour', 'is_fixed', 'fixed_month',
+    'fixed_day', 'week_of_season', 'day_of_week', 'priority', 'collect_cw',
+    'collect_bcp', 'post_communion_cw', 'occasion_rank',
+    'can_transfer_to_sunday', 'common_slug',
+)
+READING_COLUMNS = (
+    'occasion_id', 'tradition', 'service_context', 'reading_type', 'book',
+    'chapter', 'verse_start', 'verse_end', 'reference', 'alternate_year',
+    'is_optional', 'sort_order', 'reading_set_label',
+)
+DATE_MAP_COLUMNS = ('date', 'occasion_id', 'liturgical_year', 'mapping_type')
+
+# Built from the tables above by seed_resolved_readings(); may not exist yet
+RESOLVED_TABLE = 'lectionary_resolved_readings'
+RESOLVED_COLUMNS = ('date', 'tradition', 'occasion_id', 'data')
+
+
+def _insert_sql(table, columns):
+    return (f'INSERT INTO {table} ({", ".join(columns)}) '
+            f'VALUES ({", ".join("?" * len(columns))})')
+
+
+def _or(value, default):
+    # JavaScript's `value ?? default`
+    return default if value is None else value
+
+
+def occasion_row(occ_id, occ):
+    return (
+        occ_id, occ['name'], occ['slug'], occ.get('season'), occ.get('colour'),
+        _or(occ.get('isFixed'), False), occ.get('fixedMonth'), occ.get('fixedDay'),
+        occ.get('weekOfSeason'), _or(occ.get('dayOfWeek'), 0), _or(occ.get('priority'), 50),
+        occ.get('collectCw'), occ.get('collectBcp'), occ.get('postCommunionCw'),
+        occ.get('occasionRank'), _or(occ.get('canTransferToSunday'), False),
+        occ.get('commonSlug'),
+    )
+
+
+def commemoration_row(occ_id, occ):
+    return (
+        occ_id, occ['name'], occ['slug'], None, occ.get('colour'),
+        _or(occ.get('isFixed'), True), occ.get('fixedMonth'), occ.get('fixedDay'),
+        None, 0, _or(occ.get('priority'), 20),
+        occ.get('collectCw'), None, occ.get('postCommunionCw'),
+        _or(occ.get('occasionRank'), 'lesser_festival'), False, None,
+    )
+
+
+def reading_row(occasion_id, r):
+    return (
+        occasion_id, r['tradition'], _or(r.get('serviceContext'), 'principal'),
+        r['readingType'], r.get('book'), r.get('chapter'), r.get('verseStart'),
+        r.get('verseEnd'), r['reference'], r.get('alternateYear'),
+        _or(r.get('isOptional'), False), _or(r.get('sortOrder'), 0),
+        r.get('readingSetLabel'),
+    )
+
+
+def record_row(occasion_id, r):
+    """reading_row() for a lectionary.records.Reading."""
+    return (
+        occasion_id, r.tradition, _or(r.service_context, 'principal'),
+        r.reading_type, r.book, r.chapter, r.verse_start,
+        r.verse_end, r.reference, r.alternate_year,
+        _or(r.is_optional, False), _or(r.sort_order, 0),
+        None if r.reading_set_label is ABSENT else r.reading_set_label,
+    )
+
+
+def _load(path, overrides):
+    """Records for a data file: an override if given, else the file on disk."""
+    if path in overrides:
+        return overrides[path]
+    source = resolve_data_file(path)
+    return load_records(source) if source.exists() else None
+
+
+def _tables(conn):
+    return {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+
+
+def _connect(db_path, tables=TABLES):
+    """Open db_path, checking that Drizzle has created the lectionary tables."""
+    conn = sqlite3.connect(db_path, isolation_level=None)
+    conn.execute('PRAGMA journal_mode = WAL')
+    conn.execute('PRAGMA foreign_keys = ON')
+    existing = _tables(conn)
+    missing = [t for t in tables if t not in existing]
+    if missing:
+        conn.close()
+        raise RuntimeError(f'{db_path} has no {", ".join(missing)} table; '
+                           'run npm run db:push first')
+    return conn
+
+
+def _replace_rows(conn, tables):
+    """Replace the rows of each table in one transaction.
+
+    tables maps a table name to (columns, rows), in insertion order; they
+    are emptied in the reverse order so foreign keys hold throughout.
+    """
+    conn.execute('BEGIN')
+    try:
+        indexes = conn.execute(
+            "SELECT name, sql FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL "
+            f"AND tbl_name IN ({', '.join('?' * len(tables))})", tuple(tables)).fetchall()
+        for name, _ in indexes:
+            conn.execute(f'DROP INDEX "{name}"')
+        for table in reversed(tables):
+            conn.execute(f'DELETE FROM {table}')
+
+        for table, (columns, rows) in tables.items():
+            conn.executemany(_insert_sql(table, columns), rows)
+
+        for _, sql in indexes:
+            conn.execute(sql)
+        conn.execute('COMMIT')
+    except BaseException:
+        conn.execute('ROLLBACK')
+        raise
+
+
+def seed(db_path=DB_PATH, overrides=None, years=DEFAULT_YEARS, log=print):
+    """Replace the lectionary rows in db_path; return row counts and timings.
+
+    overrides maps a data file path (as in lectionary.datasets) to records
+    to use instead of reading that file, so a generator can seed straight
+    from what it has just built (reading dicts or Readings).
+    """
+    overrides = {Path(p): records for p, records in (overrides or {}).items()}
+    timings = {}
+    t0 = time.perf_counter()
+
+    occasions = _load(OCCASIONS_FILE, overrides)
+    collects = load_json(COLLECTS_FILE) if COLLECTS_FILE.exists() else {}
+    commemorations = _load(COMMEMORATION_OCCASIONS_FILE, overrides) or []
+    readings = [(path, _load(path, overrides)) for path in READING_FILES]
+    timings['load'] = time.perf_counter() - t0
+
+    # Occasion ids and rows, with the collects overlay applied in memory
+    t0 = time.perf_counter()
+    slug_to_id = {}
+    occasion_rows = []
+    for occ in occasions:
+        if occ['slug'] in collects:
+            c = collects[occ['slug']]
+            occ = dict(occ, collectCw=c.get('collectCw'), collectBcp=c.get('collectBcp'),
+                       postCommunionCw=c.get('postCommunionCw'))
+        slug_to_id[occ['slug']] = len(occasion_rows) + 1
+        occasion_rows.append(occasion_row(len(occasion_rows) + 1, occ))
+    base_occasions = len(occasion_rows)
+    for occ in commemorations:
+        if occ['slug'] in slug_to_id:
+            continue
+        slug_to_id[occ['slug']] = len(occasion_rows) + 1
+        occasion_rows.append(commemoration_row(len(occasion_rows) + 1, occ))
+
+    reading_rows = []
+    skipped = 0
+    for path, records in readings:
+        if records is None:
+            log(f'  Skipping {path.name} (not found)')
+            continue
+        for r in records:
+            is_record = isinstance(r, Reading)
+            occasion_id = slug_to_id.get(r.occasion_slug if is_record else r['occasionSlug'])
+            if occasion_id is None:
+                skipped += 1
+                continue
+            reading_rows.append(record_row(occasion_id, r) if is_record
+                                else reading_row(occasion_id, r))
+
+    date_rows = [
+        (m.date, slug_to_id[m.slug], m.liturgical_year, m.mapping_type)
+        for m in iter_date_map(slug_to_id, commemorations, years)
+    ]
+    timings['build'] = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    conn = _connect(db_path)
+    try:
+        _replace_rows(conn, {
+            'lectionary_occasions': (OCCASION_COLUMNS, occasion_rows),
+            'lectionary_readings': (READING_COLUMNS, reading_rows),
+            'lectionary_date_map': (DATE_MAP_COLUMNS, date_rows),
+            **_stale_resolved(conn),
+            **_stale_search(conn),
+        })
+    finally:
+        conn.close()
+    timings['write'] = time.perf_counter() - t0
+
+    return {
+        'occasions': base_occasions,
+        'commemorationOccasions': len(occasion_rows) - base_occasions,
+        'readings': len(reading_rows),
+        'readingsSkipped': skipped,
+        'dateMap': len(date_rows),
+        'timings': timings,
+    }
+
+
+def seed_date_map(db_path=DB_PATH, years=DEFAULT_YEARS):
+    """Replace only lectionary_date_map, for the occasions already in db_path.
+
+    Returns the number of rows written.
+    """
+    conn = _connect(db_path)
+    try:
+        slug_to_id = dict(conn.execute('SELECT slug, id FROM lectionary_occasions'))
+        if not slug_to_id:
+            raise RuntimeError(f'{db_path} has no lectionary occasions; seed them first')
+        commemorations = _load(COMMEMORATION_OCCASIONS_FILE, {}) or []
+        date_rows = [
+            (m.date, slug_to_id[m.slug], m.liturgical_year, m.mapping_type)
+            for m in iter_date_map(slug_to_id, commemorations, years)
+        ]
+        _replace_rows(conn, {
+            'lectionary_date_map': (DATE_MAP_COLUMNS, date_rows),
+            **_stale_resolved(conn),
+        })
+    finally:
+        conn.close()
+    return len(date_rows)
+
+
+def _stale_resolved(conn):
+    # Listed last, so _replace_rows() empties it before the tables its rows refer to
+    if RESOLVED_TABLE in _tables(conn):
+        return {RESOLVED_TABLE: (RESOLVED_COLUMNS, [])}
+    return {}
+
+
+def _stale_search(conn):
+    if SEARCH_TABLE in _tables(conn):
+        return {SEARCH_TABLE: (('slug', 'prayer', 'text'), [])}
+    return {}
+
+
+def seed_resolved_readings(db_path=DB_PATH, years=DEFAULT_YEARS):
+    """Replace lectionary_resolved_readings with every date of years in the date map.
+
+    Each row holds, as JSON, what getReadingsGroupedByContext() returns for
+    that date and tradition (see lectionary.resolved). Returns the number
+    of rows written and the timings of the load, build and write stages.
+    """
+    timings = {}
+    conn = _connect(db_path, TABLES + (RESOLVED_TABLE,))
+    try:
+        t0 = time.perf_counter()
+        occasions = {}
+        for row in conn.execute(
+                f'SELECT {", ".join(c for c, _ in OCCASION_FIELDS)} FROM lectionary_occasions'):
+            occasions[row[0]] = occasion_json(row)
+        readings = {}
+        for row in conn.execute(f'SELECT {", ".join(c for c, _ in READING_FIELDS)} '
+                                'FROM lectionary_readings ORDER BY id'):
+            reading = reading_json(row)
+            readings.setdefault((reading['occasionId'], reading['tradition']), []).append(reading)
+        dates = {}
+        for date, occasion_id, lit_year, mapping_type in conn.execute(
+                'SELECT date, occasion_id, liturgical_year, mapping_type FROM lectionary_date_map '
+                'WHERE date BETWEEN ? AND ? ORDER BY id',
+                (f'{min(years)}-01-01', f'{max(years)}-12-31')):
+            if int(date[:4]) in years:
+                dates.setdefault(date, []).append((occasion_id, lit_year, mapping_type))
+        timings['load'] = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        resolved = ResolvedReadings(occasions, readings)
+        rows = []
+        for date in sorted(dates):
+            for tradition in TRADITIONS:
+                document = resolved.resolve_date(date, dates[date], tradition)
+                if document is not None:
+                    rows.append((date, tradition, document['occasion']['id'], dumps(document)))
+        timings['build'] = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        _replace_rows(conn, {RESOLVED_TABLE: (RESOLVED_COLUMNS, rows)})
+        timings['write'] = time.perf_counter() - t0
+    finally:
+        conn.close()
+    return {'rows': len(rows), 'dates': len(dates), 'timings': timings}
+
+
+def seed_collect_search(db_path=DB_PATH):
+    """Rebuild lectionary_collect_search from the collects of the seeded occasions.
+
+    The table is dropped and created again, so a change to its definition
+    needs no migration. Returns the number of occasions and prayers indexed
+    and the time taken.
+    """
+    t0 = time.perf_counter()
+    conn = _connect(db_path, ('lectionary_occasions',))
+    try:
+        occasions = conn.execute(
+            f'SELECT slug, {", ".join(column for column, _ in PRAYERS)} '
+            'FROM lectionary_occasions ORDER BY id').fetchall()
+        if not occasions:
+            raise RuntimeError(f'{db_path} has no lectionary occasions; seed them first')
+        rows = list(prayer_rows(occasions))
+        conn.execute('BEGIN')
+        try:
+            conn.execute(f'DROP TABLE IF EXISTS {SEARCH_TABLE}')
+            conn.execute(CREATE_SQL)
+            conn.executemany(f'INSERT INTO {SEARCH_TABLE} (slug, prayer, text) VALUES (?, ?, ?)',
+                             rows)
+            # Merge the index into one b-tree, as nothing is added until the next rebuild
+            conn.execute(f"INSERT INTO {SEARCH_TABLE} ({SEARCH_TABLE}) VALUES ('optimize')")
+            conn.execute('COMMIT')
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+    finally:
+        conn.close()
+    return {
+        'occasions': len({slug for slug, _, _ in rows}),
+        'prayers': len(rows),
+        'elapsed': time.perf_counter() - t0,
+    }
+
+
+def format_seed_stats(stats):
+    t = stats['timings']
+    return '\n'.join([
+        f'  Inserted {stats["occasions"]} occasions and '
+        f'{stats["commemorationOccasions"]} commemoration occasions.',
+        f'  Inserted {stats["readings"]} readings '
+        f'({stats["readingsSkipped"]} skipped due to missing occasion).',
+        f'  Inserted {stats["dateMap"]} date map entries.',
+        f'  Load {t["load"]:.3f}s, build {t["build"]:.3f}s, write {t["write"]:.3f}s '
+        f'(total {sum(t.values()):.3f}s)',
+    ])
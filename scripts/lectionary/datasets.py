@@ -0,0 +1,108 @@
+"""Locations of the lectionary data files and helpers to load them."""
+
+import json
+import os
+from pathlib import Path
+
+from lectionary.columnar import load_columns
+from lectionary.records import ReadingSet
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+DATA_DIR = SCRIPTS_DIR / 'data'
+
+# Derived artifacts (indexes, caches) that are rebuilt from the files above
+BUILD_DIR = DATA_DIR / 'build'
+
+OCCASIONS_FILE = DATA_DIR / 'lectionary-occasions.json'
+COMMEMORATION_OCCASIONS_FILE = DATA_DIR / 'lectionary-occasions-commemorations.json'
+COLLECTS_FILE = DATA_DIR / 'lectionary-collects.json'
+
+# Forms a data file can be read in, and the variable that picks one
+DATA_FORM_ENV = 'LECTIONARY_DATA_FORM'
+DATA_FORMS = {'json': '.json', 'ndjson': '.ndjson', 'columns': '.columns.json'}
+
+# The reading files loaded by seed-lectionary.ts, in the same order
+READING_FILES = (
+    DATA_DIR / 'lectionary-readings-cw-principal.json',
+    DATA_DIR / 'lectionary-readings-cw-office.json',
+    DATA_DIR / 'lectionary-readings-cw-eucharist.json',
+    DATA_DIR / 'lectionary-readings-bcp-hc.json',
+    DATA_DIR / 'lectionary-readings-bcp-office.json',
+    DATA_DIR / 'lectionary-readings-cw-commemorations.json',
+)
+
+
+def load_json(path):
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def data_form():
+    """The form data files are read in: $LECTIONARY_DATA_FORM, else 'json'."""
+    form = os.environ.get(DATA_FORM_ENV) or 'json'
+    if form not in DATA_FORMS:
+        raise ValueError(f'{DATA_FORM_ENV} must be one of {", ".join(DATA_FORMS)}, not {form!r}')
+    return form
+
+
+def resolve_data_file(path, form=None):
+    """The file to read for a data file: the committed .json unless another form is asked for.
+
+    form ('json', 'ndjson' or 'columns') defaults to data_form(). A file
+    with no copy in that form is read from its .json file. Mirrors
+    resolveDataFile() in seed-lectionary.ts. The .ndjson and .columns.json
+    files are not chosen by their age: a generator's output need not hold
+    the committed data, and these files are not tracked by git.
+    """
+    path = Path(path)
+    ending = DATA_FORMS[form or data_form()]
+    stem = path.name[:-len('.json')] if path.name.endswith('.json') else path.name
+    candidate = path.with_name(stem + ending)
+    return candidate if candidate.exists() else path
+
+
+def load_records(path):
+    """Load a list of records from a .json, .ndjson or .columns.json file."""
+    path = Path(path)
+    if path.name.endswith('.columns.json'):
+        return list(load_columns(path).records())
+    if path.suffix == '.ndjson':
+        with open(path, encoding='utf-8') as f:
+            return [json.loads(line) for line in f if line.strip()]
+    return load_json(path)
+
+
+def load_reading_set(path):
+    """Load a reading file of any form as a lectionary.records.ReadingSet.
+
+    An .ndjson or .columns.json file is converted a record at a time, so
+    its dicts never all exist at once.
+    """
+    path = Path(path)
+    if path.name.endswith('.columns.json'):
+        return ReadingSet.from_json(load_columns(path).records())
+    if path.suffix == '.ndjson':
+        with open(path, encoding='utf-8') as f:
+            return ReadingSet.from_json(json.loads(line) for line in f if line.strip())
+    return ReadingSet.from_json(load_json(path))
+
+
+def iter_readings(paths=READING_FILES):
+    """Yield (path, reading) for every reading in the given files that exist."""
+    for path in paths:
+        path = Path(path)
+        if not path.exists():
+            continue
+        for reading in load_json(path):
+            yield path, reading
+
+
+def source_signature(paths):
+    """Size and mtime of each existing file, to tell when derived data is stale."""
+    signature = {}
+    for path in paths:
+        path = Path(path)
+        if path.exists():
+            st = path.stat()
+            signature[path.name] = [st.st_size, st.st_mtime_ns]
+    return signature
@@ -0,0 +1,303 @@
+"""Date-to-occasion mappings, ported from seed-lectionary.ts.
+
+iter_date_map() yields rows in the same order as the TypeScript seeder
+inserts them, so both produce identical lectionary_date_map tables.
+
+Dates are handled as day ordinals (date.toordinal()) rather than date
+objects: Easter and Advent Sunday are worked out once per year, every other
+date is integer arithmetic from them or from 1 January, and each ordinal's
+ISO date and Sunday cycle year come from per-year tables. A map of three
+centuries takes a fraction of a second.
+"""
+
+from collections import namedtuple
+from datetime import date, timedelta
+
+from lectionary.calendar import advent_sunday, easter
+
+DEFAULT_YEARS = range(2024, 2031)
+
+DateMapping = namedtuple('DateMapping', 'date slug mapping_type liturgical_year')
+
+DAY_ABBREVS = ['sun', 'mon', 'tue', 'wed', 'thu', 'fri', 'sat']
+
+CHRISTMAS_DATE_SLUGS = [
+    (26, 'christmas-dec-26'),
+    (27, 'christmas-dec-27'),
+    (28, 'christmas-dec-28'),
+    (29, 'christmas-dec-29'),
+    (30, 'christmas-dec-30'),
+    (31, 'christmas-dec-31'),
+]
+
+# Alternatives on their fixed dates; All Saints replaces the day as primary.
+# Candlemas is mapped as primary separately.
+FIXED_FEASTS = [
+    (1, 25, 'conversion-of-st-paul'),
+    (3, 19, 'st-joseph'),
+    (3, 25, 'annunciation'),
+    (4, 25, 'st-mark'),
+    (5, 1, 'ss-philip-and-james'),
+    (5, 14, 'st-matthias'),
+    (5, 31, 'visit-of-mary'),
+    (6, 11, 'st-barnabas'),
+    (6, 24, 'birth-of-st-john-baptist'),
+    (6, 29, 'ss-peter-and-paul'),
+    (7, 3, 'st-thomas'),
+    (7, 22, 'st-mary-magdalene'),
+    (7, 25, 'st-james'),
+    (8, 6, 'transfiguration'),
+    (8, 15, 'blessed-virgin-mary'),
+    (8, 24, 'st-bartholomew'),
+    (9, 14, 'holy-cross-day'),
+    (9, 21, 'st-matthew'),
+    (9, 29, 'st-michael-all-angels'),
+    (10, 18, 'st-luke'),
+    (10, 28, 'ss-simon-and-jude'),
+    (11, 1, 'all-saints'),
+    (11, 2, 'all-souls'),
+    (11, 30, 'st-andrew'),
+]
+
+# Feasts that may be kept on the preceding Sunday when they fall on a weekday
+TRANSFERABLE_FEASTS = [
+    (2, 2, 'candlemas'),
+    (3, 25, 'annunciation'),
+]
+
+HOLY_WEEK = [
+    (-7, 'palm-sunday'),
+    (-6, 'holy-monday'),
+    (-5, 'holy-tuesday'),
+    (-4, 'holy-wednesday'),
+    (-3, 'maundy-thursday'),
+    (-2, 'good-friday'),
+    (-1, 'easter-eve'),
+]
+
+
+def parse_years(text):
+    """A year range from the command line: '2024-2030' or '2024'."""
+    first, _, last = text.partition('-')
+    return range(int(first), int(last or first) + 1)
+
+
+def _is_leap(year):
+    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+
+
+def _days_of_year(leap):
+    """[(month, day)] for each day of a leap or common year."""
+    jan_1 = date(2000 if leap else 2001, 1, 1)
+    days = []
+    for i in range(366 if leap else 365):
+        d = jan_1 + timedelta(days=i)
+        days.append((d.month, d.day))
+    return days
+
+
+_DAYS_OF_YEAR = {leap: _days_of_year(leap) for leap in (False, True)}
+# 'MM-DD' by day of the year, and day of the year by (month, day)
+_MONTH_DAY_LABELS = {leap: [f'{m:02d}-{d:02d}' for m, d in days] for leap, days in _DAYS_OF_YEAR.items()}
+_DAY_INDEX = {leap: {md: i for i, md in enumerate(days)} for leap, days in _DAYS_OF_YEAR.items()}
+
+
+class _Year:
+    """Ordinals and labels for one calendar year."""
+
+    __slots__ = ('jan_1', 'easter', 'advent', 'prefix', 'labels', 'day_index', 'cycles')
+
+    def __init__(self, year):
+        leap = _is_leap(year)
+        self.jan_1 = date(year, 1, 1).toordinal()
+        self.easter = easter(year).toordinal()
+        self.advent = advent_sunday(year).toordinal()
+        self.prefix = f'{year:04d}-'
+        self.labels = _MONTH_DAY_LABELS[leap]
+        self.day_index = _DAY_INDEX[leap]
+        # Sunday cycle year before and from this year's Advent Sunday
+        self.cycles = ('ABC'[year % 3 - 1], 'ABC'[(year + 1) % 3 - 1])
+
+    def on(self, month, day):
+        return self.jan_1 + self.day_index[month, day]
+
+
+def _sundays_between(start, end):
+    """Ordinals of every Sunday from start to end inclusive."""
+    return range(start + (7 - start % 7) % 7, end + 1, 7)
+
+
+def iter_date_map(slugs, commemorations=(), years=DEFAULT_YEARS):
+    """Yield DateMappings for every year, skipping slugs not in `slugs`.
+
+    commemorations are occasion dicts with fixedMonth/fixedDay, mapped as
+    'commemoration' on their dates.
+    """
+    # Ordinal n falls on a Sunday when n % 7 == 0 (date.fromordinal(7) is a Sunday)
+    tables = {}
+    rows = []
+    weekday_slugs = {}
+    this = following = None
+    # Dates held by principal feasts, on which weekday primaries are skipped
+    principal_feast_days = ()
+
+    def year_table(year):
+        if year not in tables:
+            tables[year] = _Year(year)
+        return tables[year]
+
+    def add(n, slug, mapping_type='primary'):
+        if slug not in slugs:
+            return
+        y = this if n < following.jan_1 else following
+        rows.append(DateMapping(
+            y.prefix + y.labels[n - y.jan_1], slug, mapping_type,
+            y.cycles[n >= y.advent],
+        ))
+
+    def add_weekdays(sunday, prefix):
+        if prefix not in weekday_slugs:
+            weekday_slugs[prefix] = [f'{prefix}-{day}' for day in DAY_ABBREVS[1:]]
+        for offset, slug in enumerate(weekday_slugs[prefix], 1):
+            if slug in slugs and sunday + offset not in principal_feast_days:
+                add(sunday + offset, slug)
+
+    commemorations = [
+        (occ['fixedMonth'], occ['fixedDay'], occ['slug']) for occ in commemorations
+        if occ.get('fixedMonth') and occ.get('fixedDay')
+    ]
+
+    for year in years:
+        rows.clear()
+        this, following = year_table(year), year_table(year + 1)
+        easter_day = this.easter
+        advent = this.advent
+        on = this.on
+
+        principal_feast_days = (on(2, 2), on(1, 6), on(12, 25))
+
+        # Advent Sundays + weekdays
+        for w in range(4):
+            sunday = advent + w * 7
+            add(sunday, f'advent-{w + 1}')
+            add_weekdays(sunday, f'advent-{w + 1}')
+
+        add(on(12, 24), 'christmas-eve')
+        add(on(12, 25), 'christmas-day')
+        for day, slug in CHRISTMAS_DATE_SLUGS:
+            add(on(12, day), slug)
+        add(following.jan_1, 'christmas-jan-1')
+
+        add(on(12, 26), 'st-stephen', 'alternative')
+        add(on(12, 27), 'st-john-evangelist', 'alternative')
+        add(on(12, 28), 'holy-innocents', 'alternative')
+
+        christmas_sundays = _sundays_between(on(12, 26), following.jan_1)
+        if christmas_sundays:
+            add(christmas_sundays[0], 'christmas-1')
+        christmas_2_sundays = _sundays_between(following.jan_1 + 1, following.jan_1 + 4)
+        if christmas_2_sundays:
+            add(christmas_2_sundays[0], 'christmas-2')
+
+        add(this.jan_1, 'naming-of-jesus', 'alternative')
+        add(on(1, 6), 'epiphany')
+
+        # Epiphany Sundays + weekdays, stopping before the Sundays before Lent
+        epiphany_start = on(1, 7)
+        ash_wednesday = easter_day - 46
+        epiphany_sundays = _sundays_between(epiphany_start, ash_wednesday - 15)
+        for i, sunday in enumerate(epiphany_sundays[:4]):
+            add(sunday, f'epiphany-{i + 1}')
+            add_weekdays(sunday, f'epiphany-{i + 1}')
+
+        add(on(2, 2), 'candlemas')
+
+        # Sundays before Lent + weekdays
+        weekday = ash_wednesday % 7
+        before_lent_1 = ash_wednesday - (7 if weekday == 0 else weekday)
+        add(before_lent_1, 'before-lent-1')
+        add_weekdays(before_lent_1, 'before-lent-1')
+        before_lent_2 = before_lent_1 - 7
+        add(before_lent_2, 'before-lent-2')
+        add_weekdays(before_lent_2, 'before-lent-2')
+
+        # Third and fourth Sundays before Lent, when they fall after Epiphany 4
+        before_lent_3 = before_lent_1 - 14
+        epiphany_4_end = epiphany_sundays[3] + 7 if len(epiphany_sundays) >= 4 else epiphany_start
+        if before_lent_3 >= epiphany_4_end:
+            add(before_lent_3, 'before-lent-3')
+            add_weekdays(before_lent_3, 'before-lent-3')
+            before_lent_4 = before_lent_1 - 21
+            if before_lent_4 >= epiphany_4_end:
+                add(before_lent_4, 'before-lent-4')
+                add_weekdays(before_lent_4, 'before-lent-4')
+
+        add(ash_wednesday, 'ash-wednesday')
+
+        # Lent Sundays + weekdays
+        lent_1 = ash_wednesday + 4
+        for w in range(5):
+            sunday = lent_1 + w * 7
+            add(sunday, f'lent-{w + 1}')
+            add_weekdays(sunday, f'lent-{w + 1}')
+        add(lent_1 + 21, 'mothering-sunday', 'alternative')
+
+        for offset, slug in HOLY_WEEK:
+            add(easter_day + offset, slug)
+        add(easter_day - 1, 'easter-vigil', 'alternative')
+
+        # Easter + weekdays
+        add(easter_day, 'easter-day')
+        for w in range(2, 8):
+            sunday = easter_day + (w - 1) * 7
+            add(sunday, f'easter-{w}')
+            add_weekdays(sunday, f'easter-{w}')
+
+        for offset in (36, 37, 38):
+            add(easter_day + offset, 'rogation-day', 'commemoration')
+        add(easter_day + 39, 'ascension-day')
+        add(easter_day + 49, 'pentecost')
+        add(easter_day + 56, 'trinity-sunday')
+        add(easter_day + 60, 'corpus-christi')
+
+        # Propers after Trinity, then the Kingdom Sundays before Advent
+        sunday = easter_day + 63
+        proper = 4
+        while sunday < advent and proper <= 25:
+            weeks_before_advent = (advent - sunday) // 7
+            if weeks_before_advent <= 4:
+                slug = 'christ-the-king' if weeks_before_advent == 0 else f'kingdom-{weeks_before_advent + 1}'
+                add(sunday, slug)
+                if weeks_before_advent > 0:
+                    add_weekdays(sunday, slug)
+            else:
+                add(sunday, f'proper-{proper}')
+                add_weekdays(sunday, f'proper-{proper}')
+                proper += 1
+            sunday += 7
+
+        for month, day, slug in FIXED_FEASTS:
+            add(on(month, day), slug, 'primary' if slug == 'all-saints' else 'alternative')
+
+        for month, day, slug in commemorations:
+            add(on(month, day), slug, 'commemoration')
+
+        add(on(6, 29), 'peter-apostle', 'alternative')
+
+        # Bible Sunday and Dedication Festival on the last Sunday after Trinity
+        christ_the_king = advent - 7
+        add(christ_the_king, 'bible-sunday', 'alternative')
+        oct_1 = on(10, 1)
+        add(oct_1 + (7 - oct_1 % 7) % 7, 'dedication-festival', 'alternative')
+        add(christ_the_king, 'dedication-festival', 'alternative')
+
+        for month, day, slug in TRANSFERABLE_FEASTS:
+            fixed = on(month, day)
+            weekday = fixed % 7
+            if weekday != 0:
+                add(fixed - weekday, slug, 'transferred')
+
+        yield from rows
+
+        # Tables are only needed for this year and the next
+        tables.pop(year - 1, None)
@@ -0,0 +1,213 @@
+"""Keyed differences between two versions of a lectionary dataset.
+
+A line diff of the indented JSON files says little when a generator or an
+almanac year changes: records move, and one changed field shows as a
+hunk of braces. Here each record is keyed instead (a reading on its
+occasion, tradition, service context, reading type, year and position; an
+occasion or a collects entry on its slug), both versions are indexed into
+dicts, and one pass over each finds the records added, removed and
+changed, grouped by occasion.
+"""
+
+from collections import namedtuple
+from pathlib import Path
+
+from lectionary.datasets import load_records, resolve_data_file
+
+# kind is 'added', 'removed' or 'changed'; fields are the changed fields
+Change = namedtuple('Change', 'kind key old new fields')
+DatasetDiff = namedtuple('DatasetDiff', 'name changes old_count new_count')
+
+# Longest field value shown in a change before it is cut short
+MAX_VALUE_LENGTH = 60
+
+
+def record_key(record):
+    """The key of a reading (the fields that identify it within a dataset) or occasion."""
+    if 'occasionSlug' in record:
+        return (
+            record['occasionSlug'], record.get('tradition'),
+            record.get('serviceContext') or 'principal', record.get('readingType'),
+            record.get('alternateYear'), record.get('sortOrder'),
+        )
+    return (record.get('slug'),)
+
+
+def index_records(records):
+    """{key: record} for a list of records or an object keyed by slug.
+
+    A key that repeats within the file gets the number of the repeat
+    appended, so duplicates pair up in order rather than overwrite.
+    """
+    if isinstance(records, dict):
+        return {(slug,): value for slug, value in records.items()}
+    index = {}
+    repeats = {}
+    for record in records:
+        key = record_key(record)
+        if key in index:
+            repeats[key] = n = repeats.get(key, 1) + 1
+            key += (n,)
+        index[key] = record
+    return index
+
+
+def changed_fields(old, new):
+    """The fields whose values differ between two versions of a record, in order.
+
+    A field that is missing from one version and null in the other has not
+    changed.
+    """
+    if not (isinstance(old, dict) and isinstance(new, dict)):
+        return ('value',)
+    fields = [f for f, value in new.items() if old.get(f) != value]
+    fields += [f for f, value in old.items() if f not in new and value is not None]
+    return tuple(fields)
+
+
+def diff_records(old, new):
+    """Every Change from old records to new, added and changed in new's order, then removed."""
+    old_index = index_records(old)
+    new_index = index_records(new)
+    changes = []
+    for key, record in new_index.items():
+        before = old_index.get(key)
+        if before is None:
+            changes.append(Change('added', key, None, record, ()))
+        elif before != record:
+            fields = changed_fields(before, record)
+            if fields:
+                changes.append(Change('changed', key, before, record, fields))
+    changes.extend(Change('removed', key, record, None, ())
+                   for key, record in old_index.items() if key not in new_index)
+    return changes
+
+
+def by_occasion(changes):
+    """{occasion slug: [Change]}, occasions in the order they first change."""
+    groups = {}
+    for change in changes:
+        groups.setdefault(change.key[0], []).append(change)
+    return groups
+
+
+def dataset_name(path):
+    """A data file's name without its .json, .ndjson or .columns.json ending."""
+    name = Path(path).name
+    for ending in ('.columns.json', '.ndjson', '.json'):
+        if name.endswith(ending):
+            return name[:-len(ending)]
+    return name
+
+
+def _dataset_file(directory, name):
+    # The form the seeders would read, else whichever form the directory holds
+    path = resolve_data_file(Path(directory) / f'{name}.json')
+    if not path.exists():
+        path = next(Path(directory).glob(f'{name}.*json'), path)
+    return path
+
+
+def _dataset_files(directory):
+    names = sorted({dataset_name(p) for p in Path(directory).glob('lectionary-*.*json')})
+    return {name: _dataset_file(directory, name) for name in names}
+
+
+def pair_files(old, new):
+    """(name, old file, new file) for two files, or for the datasets of two directories.
+
+    A directory's datasets are its lectionary-*.json files, each read in the
+    form the seeders read, or in the only form the directory holds; a
+    dataset only in one directory is paired with None.
+    """
+    old, new = Path(old), Path(new)
+    if not (old.is_dir() and new.is_dir()):
+        return [(dataset_name(new), old, new)]
+    old_files = _dataset_files(old)
+    new_files = _dataset_files(new)
+    names = list(old_files) + [n for n in new_files if n not in old_files]
+    return [(n, old_files.get(n), new_files.get(n)) for n in names]
+
+
+def diff_files(old_path, new_path, name=None):
+    """The DatasetDiff between two versions of a data file; a missing file has no records."""
+    old = load_records(old_path) if old_path else []
+    new = load_records(new_path) if new_path else []
+    return DatasetDiff(name or dataset_name(new_path or old_path), diff_records(old, new),
+                       len(old), len(new))
+
+
+def count_changes(changes):
+    counts = {'added': 0, 'removed': 0, 'changed': 0}
+    for change in changes:
+        counts[change.kind] += 1
+    return counts
+
+
+def _short(value):
+    text = repr(value)
+    if len(text) > MAX_VALUE_LENGTH:
+        text = text[:MAX_VALUE_LENGTH - 3] + '...'
+    return text
+
+
+def describe_key(key):
+    """A key without its occasion: 'cw principal gospel A 3'."""
+    return ' '.join(str(part) for part in key[1:] if part is not None)
+
+
+def _label(record):
+    if not isinstance(record, dict):
+        return _short(record)
+    # A collects entry has no name: list the prayers it holds
+    return (record.get('reference') or record.get('name')
+            or ', '.join(field for field, value in record.items() if value))
+
+
+def format_change(change):
+    """One line for a Change: '+', '-' or '~', the key, and what was added or changed."""
+    where = describe_key(change.key)
+    if change.kind == 'changed':
+        if change.fields == ('value',):
+            details = f'{_short(change.old)} -> {_short(change.new)}'
+        else:
+            details = ', '.join(f'{field} {_short(change.old.get(field))} -> '
+                                f'{_short(change.new.get(field))}' for field in change.fields)
+        return f'~ {where}: {details}' if where else f'~ {details}'
+    record = change.new if change.kind == 'added' else change.old
+    sign = '+' if change.kind == 'added' else '-'
+    label = _label(record)
+    return f'{sign} {where}: {label}' if where and label else f'{sign} {where or label}'.rstrip()
+
+
+def format_diff(diff, summary=False):
+    """The lines reporting one DatasetDiff, its changes grouped by occasion."""
+    counts = count_changes(diff.changes)
+    unchanged = diff.new_count - counts['added'] - counts['changed']
+    lines = [f'{diff.name}: {counts["added"]} added, {counts["removed"]} removed, '
+             f'{counts["changed"]} changed, {unchanged} unchanged']
+    if not summary:
+        for slug, changes in by_occasion(diff.changes).items():
+            lines.append(f'  {slug}')
+            lines.extend(f'    {format_change(c)}' for c in changes)
+    return lines
+
+
+def diff_json(diff):
+    """A DatasetDiff as JSON-ready dicts, changes grouped by occasion."""
+    return {
+        'name': diff.name,
+        'old': diff.old_count,
+        'new': diff.new_count,
+        **count_changes(diff.changes),
+        'occasions': {
+            slug: [{
+                'kind': c.kind,
+                'key': list(c.key),
+                **({'old': c.old} if c.old is not None else {}),
+                **({'new': c.new} if c.new is not None else {}),
+                **({'fields': list(c.fields)} if c.fields else {}),
+            } for c in changes]
+            for slug, changes in by_occasion(diff.changes).items()
+        },
+    }
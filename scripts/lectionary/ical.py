@@ -0,0 +1,209 @@
+"""The lectionary as an iCalendar (RFC 5545) feed.
+
+Every date gets one all-day VEVENT per tradition: the day's primary
+occasion as its summary, and that occasion's readings for the year (Sunday
+cycle A/B/C or office year 1/2) listed by service context in its
+description, with any alternative occasions and commemorations named
+after them.
+
+Events are written as they are made. The date map is generated a year at a
+time and each year's dates are sorted and written before the next year is
+mapped, so memory holds the occasions, the readings wanted and one year of
+mappings however many years are exported.
+"""
+
+from collections import namedtuple
+from datetime import date as Date, datetime, timedelta, timezone
+
+from lectionary.calendar import office_year
+from lectionary.coverage import CONTEXT_ALIASES
+from lectionary.datasets import (
+    COMMEMORATION_OCCASIONS_FILE, OCCASIONS_FILE, READING_FILES, iter_readings, load_records,
+    resolve_data_file,
+)
+from lectionary.date_map import iter_date_map
+from lectionary.resolved import build_reading_groups
+
+PRODID = '-//Chapel Planner//Lectionary//EN'
+UID_DOMAIN = 'chapel-planner'
+
+# Service contexts in the order an event lists them, with their headings
+CONTEXT_LABELS = {
+    'principal': 'Principal Service',
+    'second_service': 'Second Service',
+    'third_service': 'Third Service',
+    'daily_eucharist': 'Holy Communion',
+    'morning_prayer': 'Morning Prayer',
+    'evening_prayer': 'Evening Prayer',
+}
+TRADITION_NAMES = {'cw': 'Common Worship', 'bcp': 'Book of Common Prayer'}
+
+# Content lines longer than this many octets are folded (RFC 5545 3.1)
+MAX_LINE_OCTETS = 75
+
+DayEvent = namedtuple('DayEvent', 'date occasion groups alternatives commemorations')
+
+
+def parse_contexts(names):
+    """The service contexts for command-line names; 'office' is morning and evening prayer."""
+    contexts = []
+    for name in names:
+        for context in CONTEXT_ALIASES.get(name, (name,)):
+            if context not in CONTEXT_LABELS:
+                raise ValueError(f'unknown service context: {name!r}')
+            if context not in contexts:
+                contexts.append(context)
+    return contexts
+
+
+def escape_text(text):
+    """A TEXT property value with its backslashes, separators and newlines escaped."""
+    return (text.replace('\\', '\\\\').replace(';', '\\;').replace(',', '\\,')
+            .replace('\r\n', '\\n').replace('\n', '\\n'))
+
+
+def fold(line):
+    """line split into CRLF-terminated chunks of at most 75 octets.
+
+    Continuation lines start with a space, and a chunk never ends inside a
+    UTF-8 sequence.
+    """
+    data = line.encode('utf-8')
+    if len(data) <= MAX_LINE_OCTETS:
+        return line + '\r\n'
+    chunks = []
+    start, limit = 0, MAX_LINE_OCTETS
+    while len(data) - start > limit:
+        end = start + limit
+        # Back up over continuation bytes (0b10xxxxxx) to a character boundary
+        while data[end] & 0xC0 == 0x80:
+            end -= 1
+        chunks.append(data[start:end])
+        # Later chunks lose one octet to the leading space
+        start, limit = end, MAX_LINE_OCTETS - 1
+    chunks.append(data[start:])
+    return b'\r\n '.join(chunks).decode('utf-8') + '\r\n'
+
+
+def _ical_date(iso):
+    return iso.replace('-', '')
+
+
+class LectionaryCalendar:
+    """Occasions and one tradition's readings, indexed to build each day's event."""
+
+    def __init__(self, tradition='cw', contexts=None, reading_files=READING_FILES):
+        self.tradition = tradition
+        self.contexts = contexts or list(CONTEXT_LABELS)
+        occasions = load_records(resolve_data_file(OCCASIONS_FILE))
+        self.commemorations = load_records(resolve_data_file(COMMEMORATION_OCCASIONS_FILE))
+        self.occasions = {occ['slug']: occ for occ in occasions}
+        self.occasions.update((occ['slug'], occ) for occ in self.commemorations)
+        # occasion slug -> its readings in this tradition and these contexts
+        self.readings = {}
+        wanted = set(self.contexts)
+        for _, reading in iter_readings(reading_files):
+            if (reading['tradition'] == tradition
+                    and (reading.get('serviceContext') or 'principal') in wanted):
+                self.readings.setdefault(reading['occasionSlug'], []).append(reading)
+        # Occasions recur with the same readings every few years
+        self._groups = {}
+
+    def iter_days(self, years):
+        """Yield a DayEvent for every date of the calendar years in years, in order."""
+        slugs = set(self.occasions)
+        pending = {}
+        start = f'{years[0]:04d}-'
+        # The date map for a year ends with the first days of the next January
+        for year in range(years[0] - 1, years[-1] + 1):
+            for m in iter_date_map(slugs, self.commemorations, (year,)):
+                if m.date >= start:
+                    pending.setdefault(m.date, []).append(m)
+            if year < years[0]:
+                continue
+            cutoff = f'{year + 1:04d}-'
+            for day in sorted(d for d in pending if d < cutoff):
+                event = self.day_event(day, pending.pop(day))
+                if event:
+                    yield event
+
+    def day_event(self, day, mappings):
+        """The DayEvent for one date's mappings, or None when it has no primary occasion."""
+        primary = next((m for m in mappings if m.mapping_type == 'primary'), None)
+        if primary is None:
+            return None
+        lit_year = primary.liturgical_year
+        office = office_year(Date.fromisoformat(day))
+        key = (primary.slug, lit_year, office)
+        groups = self._groups.get(key)
+        if groups is None:
+            groups = self._groups[key] = build_reading_groups(
+                self.readings.get(primary.slug, ()), lit_year, office)
+        alternatives = []
+        commemorations = []
+        for m in mappings:
+            if m is primary or m.slug == primary.slug:
+                continue
+            name = self.occasions[m.slug]['name']
+            if m.mapping_type == 'commemoration':
+                commemorations.append(name)
+            else:
+                alternatives.append(name)
+        return DayEvent(day, self.occasions[primary.slug], groups, alternatives, commemorations)
+
+    def description(self, event):
+        lines = []
+        for context in self.contexts:
+            groups = event.groups.get(context)
+            if groups:
+                refs = '; '.join(' or '.join(r['reference'] for r in g['readings'])
+                                 for g in groups)
+                lines.append(f'{CONTEXT_LABELS[context]}: {refs}')
+        if event.alternatives:
+            lines.append('Or: ' + '; '.join(event.alternatives))
+        if event.commemorations:
+            lines.append('Commemoration: ' + '; '.join(event.commemorations))
+        return '\n'.join(lines)
+
+    def vevent(self, event, stamp):
+        """The content lines of one day's VEVENT."""
+        occasion = event.occasion
+        end = Date.fromisoformat(event.date) + timedelta(days=1)
+        lines = [
+            'BEGIN:VEVENT',
+            f'UID:{event.date}-{self.tradition}@{UID_DOMAIN}',
+            f'DTSTAMP:{stamp}',
+            f'DTSTART;VALUE=DATE:{_ical_date(event.date)}',
+            f'DTEND;VALUE=DATE:{end:%Y%m%d}',
+            f'SUMMARY:{escape_text(occasion["name"])}',
+        ]
+        description = self.description(event)
+        if description:
+            lines.append(f'DESCRIPTION:{escape_text(description)}')
+        if occasion.get('season'):
+            lines.append(f'CATEGORIES:{escape_text(occasion["season"].replace("_", " ").title())}')
+        lines += ['TRANSP:TRANSPARENT', 'END:VEVENT']
+        return lines
+
+    def calendar_name(self, years):
+        span = f'{years[0]}-{years[-1]}' if len(years) > 1 else str(years[0])
+        return f'{TRADITION_NAMES.get(self.tradition, self.tradition)} Lectionary {span}'
+
+    def write(self, f, years, stamp=None):
+        """Write years as one VCALENDAR to text file f; return the number of events."""
+        stamp = stamp or datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+        header = [
+            'BEGIN:VCALENDAR',
+            'VERSION:2.0',
+            f'PRODID:{PRODID}',
+            'CALSCALE:GREGORIAN',
+            'METHOD:PUBLISH',
+            f'X-WR-CALNAME:{escape_text(self.calendar_name(years))}',
+        ]
+        f.writelines(map(fold, header))
+        count = 0
+        for event in self.iter_days(years):
+            f.writelines(map(fold, self.vevent(event, stamp)))
+            count += 1
+        f.write(fold('END:VCALENDAR'))
+        return count
@@ -0,0 +1,108 @@
+"""Content-hash manifest that lets generators skip unchanged outputs.
+
+Each generator names its inputs: its own script (which holds the DATA block
+or add() table), every module of the lectionary package, and any data
+files it reads. The SHA-256 of every input and of the output written
+from them are recorded in scripts/data/build/manifest.json, keyed by output
+path. A later run whose inputs, format and output all still match the
+record is skipped without touching the output file.
+"""
+
+import hashlib
+import json
+import os
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows: parallel builds may then lose an entry
+    fcntl = None
+
+from lectionary.datasets import BUILD_DIR, SCRIPTS_DIR
+
+MANIFEST_FILE = BUILD_DIR / 'manifest.json'
+MANIFEST_VERSION = 1
+
+LECTIONARY_DIR = Path(__file__).resolve().parent
+
+# Modules whose behaviour shapes the generated records and their encoding:
+# all of them, since a list of the ones that matter falls out of date as
+# generators come to rely on more of the package
+PARSER_MODULES = tuple(sorted(LECTIONARY_DIR.glob('*.py')))
+
+
+def file_digest(path):
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _key(path):
+    path = Path(path).resolve()
+    try:
+        return path.relative_to(SCRIPTS_DIR.parent).as_posix()
+    except ValueError:
+        return path.as_posix()
+
+
+def generator_inputs(script, *data_files):
+    """The input files for a generator script: itself, the package modules, its data."""
+    return (Path(script).resolve(),) + PARSER_MODULES + tuple(Path(p) for p in data_files)
+
+
+def input_digests(inputs):
+    return {_key(p): file_digest(p) if Path(p).exists() else None for p in inputs}
+
+
+@contextmanager
+def _locked_manifest():
+    """Read-modify-write the manifest under an exclusive lock."""
+    MANIFEST_FILE.parent.mkdir(parents=True, exist_ok=True)
+    with open(MANIFEST_FILE.with_suffix('.lock'), 'w') as lock:
+        if fcntl:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        manifest = load_manifest()
+        yield manifest
+        tmp = MANIFEST_FILE.with_suffix('.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+            f.write('\n')
+        os.replace(tmp, MANIFEST_FILE)
+
+
+def load_manifest():
+    try:
+        with open(MANIFEST_FILE, encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {'version': MANIFEST_VERSION, 'outputs': {}}
+    if manifest.get('version') != MANIFEST_VERSION:
+        return {'version': MANIFEST_VERSION, 'outputs': {}}
+    return manifest
+
+
+def is_up_to_date(output, inputs, fmt):
+    """True if output was built in this format from inputs with these contents."""
+    output = Path(output)
+    entry = load_manifest()['outputs'].get(_key(output))
+    if not entry or entry.get('format') != fmt or not output.exists():
+        return False
+    if entry.get('inputs') != input_digests(inputs):
+        return False
+    return entry.get('output') == file_digest(output)
+
+
+def record_output(output, inputs, fmt):
+    """Record the hashes behind a freshly written output."""
+    output = Path(output)
+    # Hashed after writing, since a generator may rewrite one of its inputs
+    entry = {
+        'format': fmt,
+        'inputs': input_digests(inputs),
+        'output': file_digest(output),
+    }
+    with _locked_manifest() as manifest:
+        manifest['outputs'][_key(output)] = entry
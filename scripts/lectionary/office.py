@@ -0,0 +1,50 @@
+"""Daily office readings (Morning and Evening Prayer) from the office tables.
+
+Both the CW weekday office and the BCP (1662) office give each day an Old
+Testament and a second reading at Morning and at Evening Prayer, one day per
+line of the table in lectionary.tables.
+"""
+
+import re
+
+from lectionary.records import make_reading
+from lectionary.references import parse_reference
+from lectionary.tables import office_lines
+from lectionary.versification import locate_reference
+
+_DAY_LINE_RE = re.compile(r'^(\S+):\s*MP:\s*(.+?);\s*EP:\s*(.+)$')
+
+
+def make_entry(tradition, slug, context, reading_type, reference, sort_order):
+    """Create a reading entry (a lectionary.records.Reading)."""
+    book, chapter, vs, ve = parse_reference(reference)
+    segments, ordinal_start, ordinal_end = locate_reference(reference)
+    return make_reading(
+        slug, tradition, context, reading_type, reference, book, chapter, vs, ve,
+        None, False, sort_order,
+        segments=segments, ordinal_start=ordinal_start, ordinal_end=ordinal_end,
+    )
+
+
+def parse_day_line(line, tradition='cw'):
+    """Parse a line like 'slug: MP: ref1, ref2; EP: ref3, ref4' and yield its entries."""
+    m = _DAY_LINE_RE.match(line.strip())
+    if not m:
+        return
+
+    slug = m.group(1)
+    mp_refs = [r.strip() for r in m.group(2).split(',', 1)]
+    ep_refs = [r.strip() for r in m.group(3).split(',', 1)]
+
+    if len(mp_refs) >= 2:
+        yield make_entry(tradition, slug, "morning_prayer", "old_testament", mp_refs[0], 1)
+        yield make_entry(tradition, slug, "morning_prayer", "second_reading", mp_refs[1], 2)
+    if len(ep_refs) >= 2:
+        yield make_entry(tradition, slug, "evening_prayer", "old_testament", ep_refs[0], 1)
+        yield make_entry(tradition, slug, "evening_prayer", "second_reading", ep_refs[1], 2)
+
+
+def iter_entries(tradition, lines=None):
+    """Yield every reading entry in the tradition's table (or in lines), one day at a time."""
+    for line in office_lines(tradition) if lines is None else lines:
+        yield from parse_day_line(line, tradition)
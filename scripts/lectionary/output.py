@@ -0,0 +1,162 @@
+"""Command-line options and writers shared by the generator scripts.
+
+Generators stream their records as newline-delimited JSON by default: one
+compact object per line, written as each record is produced, so memory
+stays flat and a consumer can start reading before generation finishes
+(use ``-o -`` to write to stdout). ``--pretty`` writes the indented JSON
+array committed under scripts/data/ instead, ``--columnar`` the compact
+columnar form described in lectionary.columnar, and ``--sqlite`` reseeds the
+lectionary tables straight from the generated records (lectionary.database).
+
+A file written by a generator is then checked against the other datasets
+(lectionary.validate) unless ``--no-validate`` is given. ``--profile``
+reports the time and memory of each stage of the run (lectionary.profiling).
+"""
+
+import argparse
+import json
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+from lectionary.columnar import columnar_path
+from lectionary.database import DB_PATH, format_seed_stats, seed
+from lectionary.manifest import is_up_to_date, record_output
+from lectionary.profiling import add_profile_arguments
+from lectionary.validate import format_problems, is_error, summarise, validate_output
+
+STDOUT = '-'
+
+# Validation problems listed after a generator runs
+MAX_PROBLEMS_SHOWN = 10
+
+_ndjson_encode = json.JSONEncoder(ensure_ascii=False, separators=(',', ':')).encode
+
+
+def generator_arguments(doc):
+    """Argument parser with the output options every generator accepts."""
+    parser = argparse.ArgumentParser(
+        description=doc.strip().splitlines()[0],
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    formats = parser.add_mutually_exclusive_group()
+    formats.add_argument('--pretty', action='store_true',
+                         help='write an indented JSON array instead of NDJSON')
+    formats.add_argument('--columnar', action='store_true',
+                         help='write a dictionary-encoded columnar file instead of NDJSON')
+    formats.add_argument('--sqlite', nargs='?', const=DB_PATH, metavar='DB',
+                         help='reseed the lectionary tables of DB (default: '
+                              'data/chapel-planner.db) with these records and the other data files')
+    parser.add_argument('--force', action='store_true',
+                        help='rebuild even if the inputs are unchanged since the last build')
+    parser.add_argument('--no-validate', action='store_true',
+                        help='skip checking the output against the other datasets')
+    parser.add_argument('-o', '--output',
+                        help='output file, or - for stdout (default: next to the '
+                             'committed .json file, with a suffix for the format)')
+    add_profile_arguments(parser)
+    return parser
+
+
+def ndjson_path(path):
+    return Path(path).with_suffix('.ndjson')
+
+
+def output_target(args, json_path):
+    """Where to write: an explicit --output, else the default for the format."""
+    if args.sqlite:
+        return Path(args.sqlite)
+    if args.output:
+        return args.output if args.output == STDOUT else Path(args.output)
+    if args.pretty:
+        return Path(json_path)
+    if args.columnar:
+        return columnar_path(json_path)
+    return ndjson_path(json_path)
+
+
+def output_format(args):
+    if args.sqlite:
+        return 'sqlite'
+    if args.pretty:
+        return 'pretty'
+    if args.columnar:
+        return 'columnar'
+    return 'ndjson'
+
+
+def _tracked(args, target):
+    # Only files can be checked; stdout and databases are always rebuilt
+    return not args.sqlite and target != STDOUT
+
+
+def up_to_date(args, target, inputs, report):
+    """Report and return True when target can be left as it is (see lectionary.manifest)."""
+    if args.force or not _tracked(args, target):
+        return False
+    if not is_up_to_date(target, inputs, output_format(args)):
+        return False
+    print(f'Up to date: {target} (use --force to rebuild)', file=report)
+    return True
+
+
+def record_build(args, target, inputs):
+    """Record the inputs behind a freshly written target."""
+    if _tracked(args, target):
+        record_output(target, inputs, output_format(args))
+
+
+def check_output(args, target, json_path, report):
+    """Validate a freshly written target in place of json_path; exit 1 on errors."""
+    if args.no_validate or not _tracked(args, target):
+        return
+    t0 = time.perf_counter()
+    problems = validate_output(json_path, target)
+    elapsed = (time.perf_counter() - t0) * 1000
+    print(f'Validated in {elapsed:.0f} ms: {summarise(problems)}', file=report)
+    for line in format_problems(problems, MAX_PROBLEMS_SHOWN):
+        print(f'  {line}', file=report)
+    if any(is_error(p) for p in problems):
+        sys.exit(1)
+
+
+def report_stream(target):
+    """Summary lines go to stderr when the records themselves go to stdout."""
+    return sys.stderr if target == STDOUT else sys.stdout
+
+
+@contextmanager
+def open_output(target):
+    if target == STDOUT:
+        yield sys.stdout
+        sys.stdout.flush()
+        return
+    target.parent.mkdir(parents=True, exist_ok=True)
+    with open(target, 'w', encoding='utf-8') as f:
+        yield f
+
+
+def write_ndjson(records, f):
+    """Write records one per line as they arrive; return how many were written."""
+    count = 0
+    for record in records:
+        f.write(_ndjson_encode(record))
+        f.write('\n')
+        count += 1
+    return count
+
+
+def tally(records, counter, key):
+    """Pass records through unchanged, counting key(record) on the way."""
+    for record in records:
+        counter[key(record)] += 1
+        yield record
+
+
+def write_sqlite(records, db_path, json_path, report):
+    """Reseed db_path using records in place of json_path; return the record count."""
+    records = list(records)
+    stats = seed(db_path, {json_path: records}, log=lambda line: print(line, file=report))
+    print(format_seed_stats(stats), file=report)
+    return len(records)
@@ -0,0 +1,175 @@
+"""Interval index over every reading, keyed on verse ordinals.
+
+Each segment of each reading becomes an interval [start, end] of verse
+ordinals (see lectionary.versification). Intervals are kept sorted by
+start, with an implicit max-end tree over them, so that overlap and
+containment queries cost O(log n) plus the number of matches instead of a
+scan over every reading file.
+
+The index is saved to scripts/data/build/passage-index.json together with
+the size and mtime of the files it was built from; load_index() reuses it
+until one of those files changes.
+"""
+
+import json
+from bisect import bisect_left, bisect_right
+
+from lectionary.datasets import BUILD_DIR, READING_FILES, iter_readings, source_signature
+from lectionary.versification import reference_spans
+
+INDEX_FILE = BUILD_DIR / 'passage-index.json'
+INDEX_VERSION = 1
+
+RECORD_FIELDS = (
+    'occasionSlug', 'tradition', 'serviceContext', 'readingType',
+    'reference', 'alternateYear', 'sortOrder',
+)
+
+
+class PassageIndex:
+    """Sorted-interval index answering overlap and containment queries."""
+
+    def __init__(self, records, intervals, sources=None):
+        # intervals: (start, end, record_id), sorted by start
+        self.records = records
+        self.sources = sources or {}
+        self.starts = [i[0] for i in intervals]
+        self.ends = [i[1] for i in intervals]
+        self.record_ids = [i[2] for i in intervals]
+        self.segment_counts = [0] * len(records)
+        for rid in self.record_ids:
+            self.segment_counts[rid] += 1
+        self._build_tree()
+
+    def _build_tree(self):
+        size = 1
+        while size < len(self.ends):
+            size *= 2
+        tree = [-1] * (2 * size)
+        tree[size:size + len(self.ends)] = self.ends
+        for node in range(size - 1, 0, -1):
+            tree[node] = max(tree[2 * node], tree[2 * node + 1])
+        self._size = size
+        self._tree = tree
+
+    @classmethod
+    def build(cls, paths=READING_FILES):
+        records = []
+        intervals = []
+        for _, reading in iter_readings(paths):
+            spans = reference_spans(reading['reference'])
+            if not spans:
+                continue
+            rid = len(records)
+            records.append([reading.get(f) for f in RECORD_FIELDS])
+            intervals.extend((start, end, rid) for start, end in spans)
+        intervals.sort()
+        return cls(records, intervals, source_signature(paths))
+
+    def save(self, path=INDEX_FILE):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            'version': INDEX_VERSION,
+            'sources': self.sources,
+            'fields': RECORD_FIELDS,
+            'records': self.records,
+            'intervals': [list(t) for t in zip(self.starts, self.ends, self.record_ids)],
+        }
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+
+    @classmethod
+    def load(cls, path=INDEX_FILE):
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('version') != INDEX_VERSION or tuple(data['fields']) != RECORD_FIELDS:
+            raise ValueError(f'{path} was written by a different index version')
+        return cls(data['records'], [tuple(i) for i in data['intervals']], data['sources'])
+
+    def __len__(self):
+        return len(self.records)
+
+    def _ends_at_least(self, hi, min_end):
+        """Positions i < hi whose interval ends at or after min_end."""
+        found = []
+        stack = [(1, 0, self._size)]
+        while stack:
+            node, lo, width = stack.pop()
+            if lo >= hi or self._tree[node] < min_end:
+                continue
+            if node >= self._size:
+                found.append(node - self._size)
+                continue
+            half = width // 2
+            stack.append((2 * node + 1, lo + half, half))
+            stack.append((2 * node, lo, half))
+        return found
+
+    def _overlap_ids(self, start, end):
+        hi = bisect_right(self.starts, end)
+        return {self.record_ids[i] for i in self._ends_at_least(hi, start)}
+
+    def _containing_ids(self, start, end):
+        hi = bisect_right(self.starts, start)
+        return {self.record_ids[i] for i in self._ends_at_least(hi, end)}
+
+    def _within_positions(self, start, end):
+        lo = bisect_left(self.starts, start)
+        hi = bisect_right(self.starts, end)
+        return [i for i in range(lo, hi) if self.ends[i] <= end]
+
+    def overlapping(self, query):
+        """Readings that share at least one verse with the query."""
+        ids = set()
+        for start, end in query_spans(query):
+            ids |= self._overlap_ids(start, end)
+        return self._records(ids)
+
+    def containing(self, query):
+        """Readings that include every verse of the query."""
+        ids = None
+        for start, end in query_spans(query):
+            found = self._containing_ids(start, end)
+            ids = found if ids is None else ids & found
+        return self._records(ids or ())
+
+    def within(self, query):
+        """Readings that lie entirely inside the query."""
+        hits = {}
+        for start, end in query_spans(query):
+            for i in self._within_positions(start, end):
+                rid = self.record_ids[i]
+                hits[rid] = hits.get(rid, 0) + 1
+        return self._records(rid for rid, n in hits.items() if n >= self.segment_counts[rid])
+
+    def _records(self, ids):
+        rows = [dict(zip(RECORD_FIELDS, self.records[rid])) for rid in ids]
+        rows.sort(key=lambda r: (r['tradition'], r['serviceContext'] or '',
+                                 r['occasionSlug'], r['alternateYear'] or '',
+                                 r['sortOrder'] or 0))
+        return rows
+
+
+def query_spans(query):
+    """Turn a reference string or (start, end) ordinal pair into ordinal spans."""
+    if isinstance(query, str):
+        spans = reference_spans(query)
+        if not spans:
+            raise ValueError(f'cannot place reference in the versification table: {query!r}')
+        return spans
+    start, end = query
+    return [(start, end)]
+
+
+def load_index(path=INDEX_FILE, paths=READING_FILES):
+    """Load the saved index, rebuilding and saving it if the sources changed."""
+    if path.exists():
+        try:
+            index = PassageIndex.load(path)
+        except (ValueError, KeyError):
+            index = None
+        if index is not None and index.sources == source_signature(paths):
+            return index
+    index = PassageIndex.build(paths)
+    index.save(path)
+    return index
@@ -0,0 +1,38 @@
+"""CW principal service readings from the principal table.
+
+Each row of the table in lectionary.tables gives an occasion's Old
+Testament, psalm, epistle and gospel for one year of the three-year cycle
+(or for every year), and becomes four readings.
+"""
+
+from lectionary.records import make_reading
+from lectionary.references import parse_reference
+from lectionary.tables import principal_rows
+from lectionary.versification import locate_reference
+
+READING_TYPES = ('old_testament', 'psalm', 'epistle', 'gospel')
+SORT_ORDERS = {'old_testament': 1, 'psalm': 2, 'epistle': 3, 'gospel': 4}
+
+
+def make_readings(slug, year, ot, ps, ep, go):
+    """Yield the four readings of one table row."""
+    for reading_type, ref in zip(READING_TYPES, (ot, ps, ep, go)):
+        ref = ref.strip()
+        book, chapter, vs, ve = parse_reference(ref)
+        segments, ordinal_start, ordinal_end = locate_reference(ref)
+        yield make_reading(
+            slug, 'cw', 'principal', reading_type, ref, book, chapter, vs, ve,
+            year, False, SORT_ORDERS[reading_type],
+            segments=segments, ordinal_start=ordinal_start, ordinal_end=ordinal_end,
+        )
+
+
+def iter_readings(rows=None):
+    """Yield the readings of every row in the table (or in rows)."""
+    for row in principal_rows() if rows is None else rows:
+        yield from make_readings(*row)
+
+
+def sort_key(reading):
+    """The order of the committed JSON file: by occasion, then year, then reading."""
+    return reading.occasion_slug, reading.alternate_year or '', reading.sort_order
@@ -0,0 +1,195 @@
+"""Per-stage profiles of a generator run (--profile).
+
+A generator marks out its stages (load, parse, build, sort, serialize,
+write) with Profile.stage() and Profile.collect(). With --profile each
+stage's wall time, record count and tracemalloc peak are recorded and
+written as a JSON report to scripts/data/build/profiles/<script>.json, and
+--cprofile FILE also dumps cProfile statistics for the whole run.
+
+Generators normally stream records from one stage to the next, so no stage
+can be timed on its own. When profiling, collect() runs each stage to
+completion into a list and serialize_to() writes into memory before the
+file, which makes the stages separable (and memory higher than usual).
+Without --profile both hand their argument straight back, and stage() is
+a shared no-op, so an unprofiled run is unchanged.
+"""
+
+import cProfile
+import io
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from datetime import datetime, timezone
+from pathlib import Path
+
+from lectionary.datasets import BUILD_DIR
+
+PROFILE_DIR = BUILD_DIR / 'profiles'
+REPORT_FORMAT = 'lectionary-profile'
+REPORT_VERSION = 1
+
+# --profile with no file: the default report path for the script
+DEFAULT_REPORT = 'default'
+STDERR = '-'
+
+
+class Stage:
+    __slots__ = ('name', 'seconds', 'records', 'bytes', 'peak_bytes', 'allocated_bytes')
+
+    def __init__(self, name):
+        self.name = name
+        self.seconds = 0.0
+        self.records = None
+        self.bytes = None
+        self.peak_bytes = 0
+        self.allocated_bytes = 0
+
+    def as_json(self):
+        stage = {'name': self.name, 'seconds': round(self.seconds, 6)}
+        if self.records is not None:
+            stage['records'] = self.records
+        if self.bytes is not None:
+            stage['bytes'] = self.bytes
+        stage['peakBytes'] = self.peak_bytes
+        stage['allocatedBytes'] = self.allocated_bytes
+        return stage
+
+
+class NoProfile:
+    """Stand-in used when --profile is off: every hook passes straight through."""
+
+    _stage = nullcontext(Stage('unprofiled'))
+
+    def stage(self, name):
+        return self._stage
+
+    def collect(self, name, records):
+        return records
+
+    def serialize_to(self, f):
+        return nullcontext(f)
+
+    def finish(self, report, output, output_format, records):
+        pass
+
+
+class Profile:
+    """Stage timings and memory for one generator run."""
+
+    def __init__(self, script, report_path, cprofile_path=None):
+        self.script = Path(script).name
+        self.report_path = report_path
+        self.cprofile_path = cprofile_path
+        self.stages = []
+        self.peak_bytes = 0
+        tracemalloc.start()
+        self._profiler = None
+        if cprofile_path:
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        self._started = time.perf_counter()
+
+    @contextmanager
+    def stage(self, name):
+        """Time the block as stage name; set .records or .bytes on the yielded Stage."""
+        stage = Stage(name)
+        start, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        t0 = time.perf_counter()
+        try:
+            yield stage
+        finally:
+            stage.seconds = time.perf_counter() - t0
+            current, peak = tracemalloc.get_traced_memory()
+            stage.peak_bytes = peak - start
+            stage.allocated_bytes = current - start
+            self.peak_bytes = max(self.peak_bytes, peak)
+            self.stages.append(stage)
+
+    def collect(self, name, records):
+        """Run records to completion as stage name and return them as a list."""
+        with self.stage(name) as stage:
+            records = list(records)
+            stage.records = len(records)
+        return records
+
+    @contextmanager
+    def serialize_to(self, f):
+        """Yield a buffer to serialize into (stage 'serialize'), then copy it to f ('write')."""
+        buf = io.StringIO()
+        with self.stage('serialize') as stage:
+            yield buf
+            text = buf.getvalue()
+            stage.bytes = len(text.encode('utf-8'))
+        with self.stage('write') as stage:
+            f.write(text)
+            stage.bytes = len(text.encode('utf-8'))
+
+    def finish(self, report, output, output_format, records):
+        """Write the JSON report and print a summary of the stages to report."""
+        total = time.perf_counter() - self._started
+        if self._profiler:
+            self._profiler.disable()
+            self._profiler.dump_stats(self.cprofile_path)
+        tracemalloc.stop()
+
+        data = {
+            'format': REPORT_FORMAT,
+            'version': REPORT_VERSION,
+            'script': self.script,
+            'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'output': str(output),
+            'outputFormat': output_format,
+            'records': records,
+            'totalSeconds': round(total, 6),
+            'peakBytes': self.peak_bytes,
+            'stages': [stage.as_json() for stage in self.stages],
+            'cprofile': str(self.cprofile_path) if self.cprofile_path else None,
+        }
+
+        print('Profile (times include tracemalloc overhead):', file=report)
+        for stage in self.stages:
+            size = (f'{stage.records} records' if stage.records is not None
+                    else f'{stage.bytes / 1e6:.2f} MB' if stage.bytes is not None else '')
+            print(f'  {stage.name:<10} {stage.seconds * 1000:9.1f} ms  {size:>15}  '
+                  f'peak {stage.peak_bytes / 1e6:6.2f} MB', file=report)
+        print(f'  {"total":<10} {total * 1000:9.1f} ms  {"":>15}  '
+              f'peak {self.peak_bytes / 1e6:6.2f} MB', file=report)
+
+        if self.report_path == STDERR:
+            json.dump(data, sys.stderr, indent=2)
+            print(file=sys.stderr)
+            return
+        self.report_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.report_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+            f.write('\n')
+        print(f'Profile report: {self.report_path}', file=report)
+        if self.cprofile_path:
+            print(f'cProfile stats: {self.cprofile_path}', file=report)
+
+
+def add_profile_arguments(parser):
+    parser.add_argument('--profile', nargs='?', const=DEFAULT_REPORT, metavar='FILE',
+                        help='time each stage and record its tracemalloc peak, writing a JSON '
+                             'report to FILE (default: data/build/profiles/<script>.json, '
+                             '- for stderr)')
+    parser.add_argument('--cprofile', metavar='FILE',
+                        help='also dump cProfile statistics for the run to FILE '
+                             '(implies --profile)')
+
+
+def start_profile(args, script):
+    """A Profile for the run if --profile or --cprofile was given, else a NoProfile."""
+    if not args.profile and not args.cprofile:
+        return NoProfile()
+    report_path = args.profile or DEFAULT_REPORT
+    if report_path == DEFAULT_REPORT:
+        report_path = PROFILE_DIR / (Path(script).stem + '.json')
+    elif report_path != STDERR:
+        report_path = Path(report_path)
+    return Profile(script, report_path, args.cprofile)
@@ -0,0 +1,272 @@
+"""Compact reading records, one at a time or a whole file at once.
+
+A reading loaded from JSON is a dict of twelve or more keys whose values
+repeat endlessly ("cw", "morning_prayer", "Isaiah", "1", ...), each record
+holding its own copies. Reading is a named tuple of the same fields with
+every repeated string interned, so all records share one object per
+distinct value; ReadingSet goes further and stores a whole file as columns
+(lectionary.columnar does the same on disk): repeated strings as small
+integer codes into a table of values, integers in packed arrays.
+
+The generators build Readings and the seeder reads them; they become dicts
+only where they are written as JSON (Reading.as_json). The keys that only
+some files have (readingSetLabel, and the segments and ordinals the
+generators add) are ABSENT rather than None when a record lacks them, so
+as_json() gives back exactly the dict that was read.
+"""
+
+import sys
+from array import array
+from collections import namedtuple
+
+from lectionary.references import Segment, segments_json
+from lectionary.versification import canonical_book
+
+
+class _Absent:
+    __slots__ = ()
+
+    def __repr__(self):
+        return 'ABSENT'
+
+    def __reduce__(self):
+        return 'ABSENT'
+
+
+# The value of a field whose key the record does not have
+ABSENT = _Absent()
+
+# JSON key of each field, in the order the data files write them
+JSON_KEYS = {
+    'occasion_slug': 'occasionSlug',
+    'tradition': 'tradition',
+    'service_context': 'serviceContext',
+    'reading_type': 'readingType',
+    'reference': 'reference',
+    'book': 'book',
+    'chapter': 'chapter',
+    'verse_start': 'verseStart',
+    'verse_end': 'verseEnd',
+    'alternate_year': 'alternateYear',
+    'is_optional': 'isOptional',
+    'sort_order': 'sortOrder',
+    'reading_set_label': 'readingSetLabel',
+    'segments': 'segments',
+    'ordinal_start': 'ordinalStart',
+    'ordinal_end': 'ordinalEnd',
+}
+FIELDS = tuple(JSON_KEYS)
+# Fields a record may lack
+OPTIONAL_FIELDS = ('reading_set_label', 'segments', 'ordinal_start', 'ordinal_end')
+
+# Strings drawn from a small set of values, shared between records
+INTERNED_FIELDS = (
+    'occasion_slug', 'tradition', 'service_context', 'reading_type', 'book', 'chapter',
+    'verse_start', 'verse_end', 'alternate_year', 'reading_set_label',
+)
+INT_FIELDS = ('sort_order', 'ordinal_start', 'ordinal_end')
+
+_intern = sys.intern
+
+
+def _interned(value):
+    return _intern(value) if type(value) is str else value
+
+
+class Reading(namedtuple('Reading', FIELDS, defaults=(ABSENT,) * len(OPTIONAL_FIELDS))):
+    """One reading, with the fields of a reading JSON record in snake_case."""
+
+    __slots__ = ()
+
+    @classmethod
+    def from_json(cls, record):
+        """The Reading for a dict read from a reading file."""
+        get = record.get
+        intern = _intern
+        context, book, chapter = get('serviceContext'), get('book'), get('chapter')
+        verse_start, verse_end, year = get('verseStart'), get('verseEnd'), get('alternateYear')
+        label = get('readingSetLabel', ABSENT)
+        segments = get('segments', ABSENT)
+        if segments is not ABSENT and segments is not None:
+            segments = tuple(
+                Segment(s['chapter'], s['verseStart'], s['chapterEnd'], s['verseEnd'])
+                for s in segments
+            )
+        # Each of these is a string or None, so `x and intern(x)` keeps None
+        return cls._make((
+            intern(record['occasionSlug']),
+            intern(record['tradition']),
+            context and intern(context),
+            intern(record['readingType']),
+            record['reference'],
+            book and intern(book),
+            chapter and intern(chapter),
+            verse_start and intern(verse_start),
+            verse_end and intern(verse_end),
+            year and intern(year),
+            get('isOptional'),
+            get('sortOrder'),
+            label if label is ABSENT or label is None else intern(label),
+            segments,
+            get('ordinalStart', ABSENT),
+            get('ordinalEnd', ABSENT),
+        ))
+
+    def as_json(self):
+        """The dict written to a reading file, keys in file order."""
+        record = {}
+        for field, value in zip(FIELDS, self):
+            if value is ABSENT:
+                continue
+            if field == 'segments' and value is not None:
+                value = segments_json(value)
+            record[JSON_KEYS[field]] = value
+        return record
+
+
+def make_reading(occasion_slug, tradition, service_context, reading_type, reference, book,
+                 chapter, verse_start, verse_end, alternate_year, is_optional, sort_order,
+                 **optional):
+    """A Reading built by a generator, with its strings interned and its book canonical."""
+    return Reading(
+        _intern(occasion_slug), _intern(tradition), _intern(service_context),
+        _intern(reading_type), reference, canonical_book(book) or _interned(book),
+        _interned(chapter),
+        _interned(verse_start), _interned(verse_end), _interned(alternate_year),
+        is_optional, sort_order, **optional,
+    )
+
+
+def as_reading(record):
+    """record as a Reading, whether it is one already or a dict from a file."""
+    return record if isinstance(record, Reading) else Reading.from_json(record)
+
+
+def as_json(records):
+    """Yield records as the dicts written to a reading file."""
+    for record in records:
+        yield record.as_json() if isinstance(record, Reading) else record
+
+
+# Packed integer columns: the two lowest values stand for None and ABSENT
+_INT_TYPECODE = 'i'
+_INT_NULL = -2 ** 31
+_INT_ABSENT = _INT_NULL + 1
+
+
+def _pack_int(value):
+    if value is None:
+        return _INT_NULL
+    if value is ABSENT:
+        return _INT_ABSENT
+    return value
+
+
+def _unpack_int(value):
+    if value == _INT_NULL:
+        return None
+    if value == _INT_ABSENT:
+        return ABSENT
+    return value
+
+
+class _CodedColumn:
+    """A column of repeated values: distinct values and a code per row."""
+
+    __slots__ = ('values', 'index', 'codes')
+
+    def __init__(self):
+        self.values = []
+        self.index = {}
+        self.codes = array('B')
+
+    def append(self, value):
+        code = self.index.get(value)
+        if code is None:
+            code = self.index[value] = len(self.values)
+            self.values.append(value)
+            if code > 0xFF and self.codes.typecode == 'B':
+                self.codes = array('H', self.codes)
+            elif code > 0xFFFF and self.codes.typecode == 'H':
+                self.codes = array('I', self.codes)
+        self.codes.append(code)
+
+    def __getitem__(self, i):
+        return self.values[self.codes[i]]
+
+    def __iter__(self):
+        values = self.values
+        return (values[code] for code in self.codes)
+
+
+class _IntColumn:
+    __slots__ = ('data',)
+
+    def __init__(self):
+        self.data = array(_INT_TYPECODE)
+
+    def append(self, value):
+        self.data.append(_pack_int(value))
+
+    def __getitem__(self, i):
+        return _unpack_int(self.data[i])
+
+    def __iter__(self):
+        return map(_unpack_int, self.data)
+
+
+def _column(field):
+    if field in INTERNED_FIELDS or field == 'is_optional':
+        return _CodedColumn()
+    if field in INT_FIELDS:
+        return _IntColumn()
+    return []
+
+
+class ReadingSet:
+    """Readings stored as columns, one per field.
+
+    Indexing and iteration rebuild Reading tuples on demand; column() gives
+    one field for every reading without building any.
+    """
+
+    def __init__(self, readings=()):
+        self._columns = tuple(_column(field) for field in FIELDS)
+        self._count = 0
+        self.extend(readings)
+
+    @classmethod
+    def from_json(cls, records):
+        """A ReadingSet of reading dicts (or Readings), read one at a time."""
+        return cls(map(as_reading, records))
+
+    def append(self, reading):
+        for column, value in zip(self._columns, reading):
+            column.append(value)
+        self._count += 1
+
+    def extend(self, readings):
+        for reading in readings:
+            self.append(reading)
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += self._count
+        if not 0 <= i < self._count:
+            raise IndexError('ReadingSet index out of range')
+        return Reading._make(column[i] for column in self._columns)
+
+    def __iter__(self):
+        return map(Reading._make, zip(*self._columns))
+
+    def column(self, field):
+        """Every reading's value of field (a Reading field name), in order."""
+        return list(self._columns[FIELDS.index(field)])
+
+    def records(self):
+        """Yield the readings as the dicts written to a reading file."""
+        for reading in self:
+            yield reading.as_json()
@@ -0,0 +1,236 @@
+"""Parse biblical references into book, chapter, verseStart, verseEnd.
+
+All generators share this parser so that the same reference string always
+produces the same fields. Patterns are compiled once at import time and
+results are memoised on the reference string, since references such as
+"Psalm 23" recur hundreds of times across the datasets.
+
+Conventions:
+  - chapter and verse values are strings, as stored in lectionary_readings
+  - verse suffixes (12b, 56a) are kept
+  - verseEnd is None for a single verse and for spans that cross chapters
+
+The flat fields only describe the start of a reading. parse_segments()
+returns every span of the reference, for range work at build time.
+"""
+
+import re
+from collections import namedtuple
+from functools import lru_cache
+
+SINGLE_CHAPTER_BOOKS = (
+    'Obadiah', 'Philemon', '2 John', '3 John', 'Jude',
+    'Prayer of Manasseh', 'Song of the Three Children', 'Susannah',
+)
+
+# Distinct references across every dataset number a few thousand; this bound
+# keeps the cache from growing without limit on unexpected input.
+CACHE_SIZE = 8192
+
+_VERSE_SPAN_RE = re.compile(r'(\d+[a-z]?)\s*[-–]\s*(\d+[a-z]?)')
+_VERSE_RE = re.compile(r'(\d+[a-z]?)')
+
+# Cross-chapter span: "Isaiah 52.13—53.12"
+_CROSS_CHAPTER_RE = re.compile(r'^(.+?)\s+(\d+)\.(\d+[a-z]?)\s*[—–]\s*(\d+)\.(\d+[a-z]?)$')
+# First chapter.verse of a multi-part reference: "Numbers 5.5-7; 6.1-21"
+_LEADING_VERSE_RE = re.compile(r'^(.+?)\s+(\d+)\.(\d+[a-z]?)')
+# Standard: "Acts 2.1-21"
+_STANDARD_RE = re.compile(r'^(.+?)\s+(\d+)\.(\d+[a-z]?)\s*-\s*(\d+[a-z]?)$')
+# Complex verse list: "Psalm 72.1-7,18-19"
+_COMPLEX_RE = re.compile(r'^(.+?)\s+(\d+)\.(.+)$')
+# A later part of a verse list that runs into another chapter
+_INNER_CROSS_CHAPTER_RE = re.compile(r'[—–]\s*\d+\.')
+# Whole chapter: "Psalm 23"
+_CHAPTER_RE = re.compile(r'^(.+?)\s+(\d+)$')
+# Run of whole chapters: "Psalms 1-2"
+_CHAPTER_SPAN_RE = re.compile(r'^(.+?)\s+(\d+)\s*[-–]\s*\d+$')
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def parse_reference(ref):
+    """Parse a biblical reference into (book, chapter, verseStart, verseEnd)."""
+    ref = ref.strip()
+
+    # Each pattern below needs a character the others do not, so a cheap
+    # membership test skips the ones that cannot match
+    if ref.startswith(SINGLE_CHAPTER_BOOKS):
+        for book in SINGLE_CHAPTER_BOOKS:
+            if ref == book:
+                return book, '1', None, None
+            if ref.startswith(book + ' ') and '.' not in ref:
+                rest = ref[len(book) + 1:]
+                m = _VERSE_SPAN_RE.match(rest)
+                if m:
+                    return book, '1', m.group(1), m.group(2)
+                m = _VERSE_RE.match(rest)
+                if m:
+                    return book, '1', m.group(1), None
+
+    if '.' in ref:
+        if '—' in ref or '–' in ref:
+            m = _CROSS_CHAPTER_RE.match(ref)
+            if m:
+                return m.group(1), m.group(2), m.group(3), None
+
+        if ';' in ref:
+            m = _LEADING_VERSE_RE.match(ref)
+            if m:
+                return m.group(1), m.group(2), m.group(3), None
+
+        if '-' in ref:
+            m = _STANDARD_RE.match(ref)
+            if m:
+                return m.group(1), m.group(2), m.group(3), m.group(4)
+
+        m = _COMPLEX_RE.match(ref)
+        if m:
+            verses = m.group(3)
+            numbers = _VERSE_RE.findall(verses)
+            vs = numbers[0] if numbers else None
+            ve = numbers[-1] if len(numbers) > 1 else None
+            if _INNER_CROSS_CHAPTER_RE.search(verses):
+                ve = None
+            return m.group(1), m.group(2), vs, ve
+
+    m = _CHAPTER_RE.match(ref)
+    if m:
+        return m.group(1), m.group(2), None, None
+
+    m = _CHAPTER_SPAN_RE.match(ref)
+    if m:
+        return m.group(1), m.group(2), None, None
+
+    return ref, None, None, None
+
+
+def cache_stats():
+    """Return hit/miss counts and hit rate for the reference cache."""
+    info = parse_reference.cache_info()
+    lookups = info.hits + info.misses
+    return {
+        'hits': info.hits,
+        'misses': info.misses,
+        'distinct': info.currsize,
+        'hitRate': info.hits / lookups if lookups else 0.0,
+    }
+
+
+def format_cache_stats():
+    """One-line summary of the reference cache for generator output."""
+    stats = cache_stats()
+    return (f'Reference cache: {stats["distinct"]} distinct, '
+            f'{stats["hits"]} hits, {stats["hitRate"]:.1%} hit rate')
+
+
+# A contiguous span of verses. chapter/chapter_end are ints; verse_start is
+# None for a whole chapter and verse_end is None when the span runs to the
+# end of chapter_end. Verse suffixes (12b) are dropped.
+Segment = namedtuple('Segment', 'chapter verse_start chapter_end verse_end')
+
+_BOOK_PREFIX_RE = re.compile(r"^((?:[1-4]\s?)?[A-Za-z][^\d\[(]*?)\s*(?=[\d\[(])")
+_ITEM_BOOK_RE = re.compile(r'^[A-Za-z][A-Za-z ]*?\s*(?=\d)')
+_END_OF_RE = re.compile(r'end\s+of\s+(\d+)')
+_PART_SPLIT_RE = re.compile(r'\s*(?:;|&|\band\b)\s*')
+_ITEM_SPLIT_RE = re.compile(r'\s*,\s*|\s+')
+_ITEM_RE = re.compile(
+    r'^(\d+)(?:\.(\d+)[a-z]?)?'
+    r'(?:-(?:(\d+)\.(\d+|end)[a-z]?|(\d+)[a-z]?|(end)))?$'
+)
+
+
+def split_book(ref):
+    """Split a reference into (book, remainder); book is None for bare numbers."""
+    ref = ref.strip()
+    # "2 John" alone would otherwise read as chapter 2 of no book
+    for book in SINGLE_CHAPTER_BOOKS:
+        if ref == book:
+            return book, ''
+        if ref.startswith(book + ' '):
+            return book, ref[len(book) + 1:]
+    m = _BOOK_PREFIX_RE.match(ref)
+    if not m:
+        if ref and not ref[0].isdigit() and ref[0] not in '[(':
+            return ref, ''
+        return None, ref
+    return m.group(1).strip(), ref[m.end():]
+
+
+def _normalise_body(body):
+    body = body.replace(':', '.').replace('*', '')
+    for ch in '[]()':
+        body = body.replace(ch, ' ')
+    for dash in '—–':
+        body = body.replace(dash, '-')
+    body = _END_OF_RE.sub(r'\1.end', body)
+    body = re.sub(r'\s*-\s*', '-', body)
+    body = re.sub(r'\.\s+', '.', body)
+    return body.strip()
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def parse_segments(ref):
+    """Parse every span of a reference into a tuple of Segments.
+
+    Commas continue the current chapter ("72.1-7,18-19"); semicolons, '&'
+    and 'and' start a new part whose bare numbers are chapters unless they
+    run to "end" ("Esther 2:5-11 & 15-end"). Items that cannot be read,
+    such as typos in the source data, are skipped.
+    """
+    book, body = split_book(ref)
+    single_chapter = book in SINGLE_CHAPTER_BOOKS
+    chapter = 1 if single_chapter else None
+    segments = []
+
+    for part in _PART_SPLIT_RE.split(_normalise_body(body)):
+        verse_mode = single_chapter
+        for item in _ITEM_SPLIT_RE.split(part):
+            item = _ITEM_BOOK_RE.sub('', item)
+            m = _ITEM_RE.match(item)
+            if not m:
+                continue
+            first, first_verse, end_ch, end_verse, end_num, to_end = m.groups()
+            first = int(first)
+
+            if first_verse is not None:
+                chapter, start, verse_mode = first, int(first_verse), True
+            elif verse_mode or (to_end and chapter is not None):
+                start, verse_mode = first, True
+            else:
+                # Whole chapter, or a run of whole chapters
+                chapter = first
+                last = int(end_num) if end_num else first
+                segments.append(Segment(first, None, last, None))
+                chapter = last
+                continue
+
+            if end_ch is not None:
+                last_ch = int(end_ch)
+                last_verse = None if end_verse == 'end' else int(end_verse)
+                segments.append(Segment(chapter, start, last_ch, last_verse))
+                chapter = last_ch
+            elif end_num is not None:
+                segments.append(Segment(chapter, start, chapter, int(end_num)))
+            elif to_end:
+                # The chapter is finished, so a following bare number is a
+                # new chapter: "Psalms 18.31-end, 150"
+                segments.append(Segment(chapter, start, chapter, None))
+                verse_mode = single_chapter
+            else:
+                segments.append(Segment(chapter, start, chapter, start))
+
+    if single_chapter and not body.strip():
+        segments.append(Segment(1, None, 1, None))
+    return tuple(segments)
+
+
+def segments_json(segments):
+    """Convert Segments to the dicts written to the reading JSON files."""
+    return [
+        {
+            'chapter': s.chapter,
+            'verseStart': s.verse_start,
+            'chapterEnd': s.chapter_end,
+            'verseEnd': s.verse_end,
+        }
+        for s in segments
+    ]
@@ -0,0 +1,195 @@
+"""Readings for a date resolved and grouped ahead of time.
+
+getReadingsGroupedByContext() in src/lib/server/services/lectionary.ts
+joins the date map, occasions and readings and groups alternative readings
+on every page load. resolve_date() does the same in Python from rows
+already in memory, giving the same JSON document: the occasion, its
+readings grouped by service context, commemorations, and alternative or
+transferred occasions. lectionary.database.seed_resolved_readings() stores
+one document per date and tradition in lectionary_resolved_readings, which
+the service reads with a single primary-key lookup.
+
+Rows here are dicts with the keys Drizzle gives them (occasionId,
+isOptional, ...), so the JSON matches what the service would serialize.
+"""
+
+import json
+from datetime import date as Date
+
+from lectionary.calendar import office_year
+
+TRADITIONS = ('cw', 'bcp')
+
+# Columns selected from each table, and the Drizzle key of each
+OCCASION_FIELDS = (
+    ('id', 'id'), ('name', 'name'), ('slug', 'slug'), ('season', 'season'),
+    ('colour', 'colour'), ('is_fixed', 'isFixed'), ('fixed_month', 'fixedMonth'),
+    ('fixed_day', 'fixedDay'), ('week_of_season', 'weekOfSeason'),
+    ('day_of_week', 'dayOfWeek'), ('priority', 'priority'), ('collect_cw', 'collectCw'),
+    ('collect_bcp', 'collectBcp'), ('post_communion_cw', 'postCommunionCw'),
+    ('occasion_rank', 'occasionRank'), ('can_transfer_to_sunday', 'canTransferToSunday'),
+    ('common_slug', 'commonSlug'),
+)
+READING_FIELDS = (
+    ('id', 'id'), ('occasion_id', 'occasionId'), ('tradition', 'tradition'),
+    ('service_context', 'serviceContext'), ('reading_type', 'readingType'), ('book', 'book'),
+    ('chapter', 'chapter'), ('verse_start', 'verseStart'), ('verse_end', 'verseEnd'),
+    ('reference', 'reference'), ('alternate_year', 'alternateYear'),
+    ('is_optional', 'isOptional'), ('sort_order', 'sortOrder'),
+    ('reading_set_label', 'readingSetLabel'),
+)
+# Integer columns Drizzle reads in boolean mode
+BOOLEAN_KEYS = {'isFixed', 'canTransferToSunday', 'isOptional'}
+
+
+def _row_json(fields, row):
+    return {
+        key: (bool(value) if key in BOOLEAN_KEYS and value is not None else value)
+        for (_, key), value in zip(fields, row)
+    }
+
+
+def occasion_json(row):
+    """An occasion row (columns as in OCCASION_FIELDS) as the service sees it."""
+    return _row_json(OCCASION_FIELDS, row)
+
+
+def reading_json(row):
+    """A reading row (columns as in READING_FIELDS) as the service sees it."""
+    return _row_json(READING_FIELDS, row)
+
+
+def _in_year(reading, lit_year, office_year):
+    year = reading['alternateYear']
+    return not year or year == lit_year or year == office_year
+
+
+def _sort_order(reading):
+    return reading['sortOrder'] or 0
+
+
+def group_alternative_readings(readings):
+    """Collapse sorted readings into groups, merging alternatives.
+
+    Mirrors groupAlternativeReadings(): an optional reading joins the
+    previous group when it has the group's sortOrder, or the next one after
+    a primary that is not optional.
+    """
+    groups = []
+    for reading in readings:
+        if reading['isOptional'] and groups:
+            primary = groups[-1]['readings'][0]
+            primary_sort = _sort_order(primary)
+            reading_sort = _sort_order(reading)
+            if (reading_sort == primary_sort
+                    or (reading_sort == primary_sort + 1 and not primary['isOptional'])):
+                groups[-1]['readings'].append(reading)
+                continue
+        groups.append({'readingType': reading['readingType'], 'readings': [reading]})
+    return groups
+
+
+def _group_by_context(context_readings):
+    return {
+        context: group_alternative_readings(sorted(readings, key=_sort_order))
+        for context, readings in context_readings.items()
+    }
+
+
+def _by_context(readings):
+    context_readings = {}
+    for reading in readings:
+        context_readings.setdefault(reading['serviceContext'] or 'principal', []).append(reading)
+    return context_readings
+
+
+def build_reading_groups(readings, lit_year, office_year):
+    """Mirrors buildReadingGroupsForOccasion() for one occasion's readings in a tradition."""
+    return _group_by_context(_by_context(
+        r for r in readings if _in_year(r, lit_year, office_year)))
+
+
+class ResolvedReadings:
+    """Every occasion and reading, indexed for resolve_date().
+
+    readings maps (occasionId, tradition) to that occasion's readings in
+    id order, as the service's unordered queries return them.
+    """
+
+    def __init__(self, occasions, readings):
+        self.occasions = occasions
+        self.readings = readings
+
+    def _readings(self, occasion_id, tradition):
+        return self.readings.get((occasion_id, tradition), ())
+
+    def resolve_date(self, date, mappings, tradition):
+        """The getReadingsGroupedByContext() document for date, or None.
+
+        mappings are the date's (occasionId, liturgicalYear, mappingType)
+        date map rows in id order; None when none of them is primary.
+        """
+        primary = next((m for m in mappings if m[2] == 'primary'), None)
+        if primary is None or primary[0] not in self.occasions:
+            return None
+        occasion_id, lit_year, _ = primary
+        occasion = dict(self.occasions[occasion_id], liturgicalYear=lit_year)
+        office = office_year(Date.fromisoformat(date))
+
+        filtered = [r for r in self._readings(occasion_id, tradition)
+                    if _in_year(r, lit_year, office)]
+        commemorations = []
+        alternatives = []
+        commemoration_readings = []
+        for other_id, _, mapping_type in mappings:
+            other = self.occasions.get(other_id)
+            if mapping_type == 'primary' or other is None or other_id == occasion_id:
+                continue
+            eucharist = [
+                r for r in self._readings(other_id, tradition)
+                if r['serviceContext'] == 'daily_eucharist' and _in_year(r, lit_year, office)
+            ]
+            if mapping_type == 'commemoration':
+                if eucharist or other['collectCw'] or other['postCommunionCw']:
+                    commemorations.append({
+                        'id': other_id,
+                        'name': other['name'] or '',
+                        'slug': other['slug'] or '',
+                        'colour': other['colour'],
+                        'collectCw': other['collectCw'],
+                        'postCommunionCw': other['postCommunionCw'],
+                    })
+                    commemoration_readings.extend(eucharist)
+            elif mapping_type in ('alternative', 'transferred'):
+                groups = {}
+                for t in TRADITIONS:
+                    groups[t] = build_reading_groups(self._readings(other_id, t), lit_year, office)
+                    # Their daily eucharist readings join the principal's instead
+                    groups[t].pop('daily_eucharist', None)
+                commemoration_readings.extend(eucharist)
+                alternatives.append({
+                    'id': other_id,
+                    'name': other['name'] or '',
+                    'slug': other['slug'] or '',
+                    'colour': other['colour'],
+                    'collectCw': other['collectCw'],
+                    'collectBcp': other['collectBcp'],
+                    'postCommunionCw': other['postCommunionCw'],
+                    'mappingType': mapping_type or 'alternative',
+                    'cwGroups': groups['cw'],
+                    'bcpGroups': groups['bcp'],
+                })
+
+        context_readings = _by_context(filtered)
+        if commemoration_readings:
+            context_readings.setdefault('daily_eucharist', []).extend(commemoration_readings)
+        return {
+            'occasion': occasion,
+            'groups': _group_by_context(context_readings),
+            'commemorations': commemorations,
+            'alternativeOccasions': alternatives,
+        }
+
+
+def dumps(document):
+    return json.dumps(document, ensure_ascii=False, separators=(',', ':'))
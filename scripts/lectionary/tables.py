@@ -0,0 +1,48 @@
+"""The lectionary source tables the generators build their readings from.
+
+The tables are plain text files in scripts/data/tables/ ('#' lines are
+comments), read and split on first use and kept for the life of the
+process. Importing this module, or anything that only needs the reference
+parser or the calendar, reads none of them.
+
+  cw-office.txt, bcp-office.txt   one day per line:
+                                  "slug: MP: ref, ref; EP: ref, ref"
+  cw-principal.tsv                slug, year (empty for every year) and the
+                                  OT, psalm, epistle and gospel, tab-separated
+"""
+
+from functools import lru_cache
+
+from lectionary.datasets import DATA_DIR
+
+TABLES_DIR = DATA_DIR / 'tables'
+
+OFFICE_TABLES = {
+    'cw': TABLES_DIR / 'cw-office.txt',
+    'bcp': TABLES_DIR / 'bcp-office.txt',
+}
+PRINCIPAL_TABLE = TABLES_DIR / 'cw-principal.tsv'
+
+
+def _table_lines(path):
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith('#'):
+                yield line
+
+
+@lru_cache(maxsize=None)
+def office_lines(tradition):
+    """The day lines of the CW or BCP office table, as a tuple."""
+    return tuple(_table_lines(OFFICE_TABLES[tradition]))
+
+
+@lru_cache(maxsize=None)
+def principal_rows():
+    """(slug, year or None, ot, psalm, epistle, gospel) for each principal table row."""
+    rows = []
+    for line in _table_lines(PRINCIPAL_TABLE):
+        slug, year, *refs = line.split('\t')
+        rows.append((slug, year or None, *refs))
+    return tuple(rows)
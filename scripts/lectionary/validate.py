@@ -0,0 +1,214 @@
+"""Cross-file checks on the lectionary datasets.
+
+seed-lectionary.ts silently skips readings whose occasionSlug has no
+occasion; these checks report them before seeding instead, along with
+duplicate occasions and readings, enum values the app does not know and
+malformed reference fields.
+
+Every dataset is loaded once and indexed into sets (occasion slugs, reading
+keys, the enum values below), so the checks themselves are a single pass of
+set lookups and take a few milliseconds.
+"""
+
+import re
+from collections import namedtuple
+from functools import lru_cache
+from pathlib import Path
+
+from lectionary.datasets import (
+    COMMEMORATION_OCCASIONS_FILE, OCCASIONS_FILE, READING_FILES, load_records,
+    resolve_data_file,
+)
+from lectionary.versification import chapter_count
+
+Problem = namedtuple('Problem', 'file index kind message')
+
+# Mirrors LectionaryTradition, ServiceContext and ReadingType in src/lib/types/enums.ts
+TRADITIONS = frozenset({'cw', 'bcp'})
+SERVICE_CONTEXTS = frozenset({
+    'principal', 'morning_prayer', 'evening_prayer', 'second_service',
+    'third_service', 'daily_eucharist',
+})
+READING_TYPES = frozenset({
+    'old_testament', 'psalm', 'epistle', 'gospel', 'canticle', 'second_reading',
+})
+# Sunday cycle years and weekday office years, as matched in lectionary.ts
+ALTERNATE_YEARS = frozenset({'A', 'B', 'C', '1', '2'})
+
+READING_ENUMS = (
+    ('tradition', TRADITIONS),
+    ('serviceContext', SERVICE_CONTEXTS),
+    ('readingType', READING_TYPES),
+    ('alternateYear', ALTERNATE_YEARS),
+)
+# Fields the seeder defaults or leaves NULL when they are missing
+NULLABLE_FIELDS = frozenset({'serviceContext', 'alternateYear'})
+
+# Problems that change what gets seeded; 'reference' problems are warnings,
+# since the committed data has references the parsers read differently
+ERROR_KINDS = frozenset({'missing', 'orphan', 'duplicate', 'enum'})
+
+_NUMBER_RE = re.compile(r'(\d+)[a-z]?$')
+
+
+def is_error(problem):
+    return problem.kind in ERROR_KINDS
+
+
+def reading_key(reading):
+    """What makes a reading distinct once seeded."""
+    return (
+        reading.get('occasionSlug'), reading.get('tradition'),
+        reading.get('serviceContext') or 'principal', reading.get('alternateYear'),
+        reading.get('readingSetLabel'), reading.get('readingType'),
+        reading.get('sortOrder'), reading.get('reference'),
+    )
+
+
+def load_datasets(sources=None):
+    """(occasion files, reading files), each a list of (path, records).
+
+    Each file is read in the form the seeders read, unless sources
+    maps its path (as in lectionary.datasets) to another file to read.
+    """
+    sources = {Path(p): Path(s) for p, s in (sources or {}).items()}
+
+    def load(paths):
+        loaded = []
+        for path in paths:
+            source = sources.get(path) or resolve_data_file(path)
+            if source.exists():
+                loaded.append((source, load_records(source)))
+        return loaded
+
+    return load((OCCASIONS_FILE, COMMEMORATION_OCCASIONS_FILE)), load(READING_FILES)
+
+
+def check_occasions(occasion_files):
+    """Yield missing and duplicate slugs in each occasion file."""
+    for path, records in occasion_files:
+        seen = {}
+        for i, occ in enumerate(records):
+            slug = occ.get('slug')
+            if not slug:
+                yield Problem(path.name, i, 'missing', 'occasion has no slug')
+            elif slug in seen:
+                yield Problem(path.name, i, 'duplicate', f'slug {slug!r} repeats [{seen[slug]}]')
+            else:
+                seen[slug] = i
+
+
+def occasion_slugs(occasion_files):
+    return {occ.get('slug') for _, records in occasion_files for occ in records}
+
+
+@lru_cache(maxsize=None)
+def _verse_number(value):
+    """The number in a chapter or verse field ('12b' -> 12), or None if malformed."""
+    m = _NUMBER_RE.match(value) if isinstance(value, str) else None
+    return int(m.group(1)) if m else None
+
+
+@lru_cache(maxsize=None)
+def _chapters(book):
+    return chapter_count(book)
+
+
+def _reference_problem(reading):
+    """Why a reading's reference fields are malformed, or None."""
+    if not (reading.get('reference') or '').strip():
+        return 'empty reference'
+    for field in ('chapter', 'verseStart', 'verseEnd'):
+        value = reading.get(field)
+        if value is not None and _verse_number(value) is None:
+            return f'{field} {value!r} is not a verse number'
+    book = reading.get('book')
+    if not book:
+        # Bare psalm numbers ("1, 2, 3") in the office tables have no book
+        return None
+    chapters = _chapters(book)
+    if chapters is None:
+        return f'unknown book {book!r}'
+    chapter = reading.get('chapter')
+    if chapter and _verse_number(chapter) > chapters:
+        return f'{book} has no chapter {chapter}'
+    return None
+
+
+def _enum_problems(values):
+    for (field, allowed), value in zip(READING_ENUMS, values):
+        if value not in allowed and not (value is None and field in NULLABLE_FIELDS):
+            yield f'{field} {value!r}'
+
+
+def check_readings(slugs, reading_files):
+    """Yield orphan, duplicate, enum and reference problems with the readings."""
+    seen = {}
+    # Enum value combinations already checked, with what was wrong with them;
+    # there are only a few dozen across all the datasets
+    enum_problems = {}
+    for path, records in reading_files:
+        name = path.name
+        for i, reading in enumerate(records):
+            slug = reading.get('occasionSlug')
+            if slug not in slugs:
+                yield Problem(name, i, 'orphan', f'no occasion {slug!r}')
+
+            values = (reading.get('tradition'), reading.get('serviceContext'),
+                      reading.get('readingType'), reading.get('alternateYear'))
+            if values not in enum_problems:
+                enum_problems[values] = list(_enum_problems(values))
+            for message in enum_problems[values]:
+                yield Problem(name, i, 'enum', message)
+
+            where = (name, i)
+            first = seen.setdefault(reading_key(reading), where)
+            if first is not where:
+                yield Problem(name, i, 'duplicate', f'same reading as {first[0]}[{first[1]}]')
+
+            reason = _reference_problem(reading)
+            if reason:
+                yield Problem(name, i, 'reference', f'{reading.get("reference")!r}: {reason}')
+
+
+def check(occasion_files, reading_files):
+    """Every problem in loaded datasets, occasions first."""
+    problems = list(check_occasions(occasion_files))
+    problems.extend(check_readings(occasion_slugs(occasion_files), reading_files))
+    return problems
+
+
+def validate(sources=None):
+    """Load every dataset once and return the list of problems found."""
+    return check(*load_datasets(sources))
+
+
+def validate_output(data_file, output):
+    """Problems caused by a generator writing output in place of data_file.
+
+    That is the problems within output itself, and for an occasions file
+    also the readings it leaves without an occasion.
+    """
+    output = Path(output)
+    problems = validate({data_file: output})
+    if Path(data_file) in (OCCASIONS_FILE, COMMEMORATION_OCCASIONS_FILE):
+        return [p for p in problems if p.file == output.name or p.kind == 'orphan']
+    return [p for p in problems if p.file == output.name]
+
+
+def format_problems(problems, limit=None):
+    """One line per problem (errors first, up to limit), then a count of the rest."""
+    problems = sorted(problems, key=lambda p: not is_error(p))
+    shown = problems if limit is None else problems[:limit]
+    lines = [f'{p.file}[{p.index}] {p.kind}: {p.message}' for p in shown]
+    if len(problems) > len(shown):
+        lines.append(f'... and {len(problems) - len(shown)} more')
+    return lines
+
+
+def summarise(problems):
+    errors = sum(1 for p in problems if is_error(p))
+    warnings = len(problems) - errors
+    if not problems:
+        return 'no problems'
+    return f'{errors} error{"s" * (errors != 1)}, {warnings} warning{"s" * (warnings != 1)}'
@@ -0,0 +1,549 @@
+#!/usr/bin/env python3
+"""Parse the oremus almanac HTML into the CW and BCP lectionary datasets.
+
+A Python port of parse-almanac.ts that reads every
+scripts/data/almanac-YYYY.html file, streaming each through
+lectionary.almanac in its own process and caching the parsed entries
+by file hash, so adding a year parses only the new file. Writes the CW
+principal, office, eucharist and commemoration readings, the BCP Holy
+Communion readings, the commemoration occasions and the collects overlay.
+
+NDJSON is written next to each committed .json file by default (the
+collects overlay, a single object, goes to scripts/data/build/);
+--pretty writes the committed .json files themselves.
+
+Usage:
+  python3 scripts/parse-almanac.py
+  python3 scripts/parse-almanac.py --pretty
+  python3 scripts/parse-almanac.py -j 1 --no-cache
+  python3 scripts/parse-almanac.py scripts/data/almanac-2025.html -d /tmp/almanac-2025
+"""
+
+import argparse
+import json
+import re
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+from lectionary.almanac import ALMANAC_RE, almanac_files, parse_almanacs
+from lectionary.calendar import advent_sunday, day_info, easter, js_weekday, sundays_between
+from lectionary.datasets import (
+    BUILD_DIR, COLLECTS_FILE, COMMEMORATION_OCCASIONS_FILE, DATA_DIR, OCCASIONS_FILE,
+    load_records, resolve_data_file,
+)
+from lectionary.date_map import CHRISTMAS_DATE_SLUGS, DAY_ABBREVS, FIXED_FEASTS, HOLY_WEEK
+from lectionary.output import ndjson_path, write_ndjson
+from lectionary.validate import format_problems, is_error, summarise, validate
+from lectionary.versification import canonical_book
+
+READING_OUTPUTS = (
+    ('cwPrincipal', 'CW Principal', DATA_DIR / 'lectionary-readings-cw-principal.json'),
+    ('cwOffice', 'CW Office', DATA_DIR / 'lectionary-readings-cw-office.json'),
+    ('cwEucharist', 'CW Eucharist', DATA_DIR / 'lectionary-readings-cw-eucharist.json'),
+    ('bcpHc', 'BCP HC', DATA_DIR / 'lectionary-readings-bcp-hc.json'),
+    ('cwCommemorations', 'CW Commemorations', DATA_DIR / 'lectionary-readings-cw-commemorations.json'),
+)
+
+MAX_PROBLEMS_SHOWN = 10
+
+
+# ---------------------------------------------------------------------------
+# Date -> slug mapping (as buildDateSlugMap() in parse-almanac.ts)
+# ---------------------------------------------------------------------------
+
+def date_slug_map(years):
+    """ISO date -> slug, the first mapping set for a date winning."""
+    slugs = {}
+    day = timedelta(days=1)
+
+    def put(d, slug):
+        slugs.setdefault(d.isoformat(), slug)
+
+    def put_week(sunday, slug):
+        put(sunday, slug)
+        for d in range(1, 7):
+            put(sunday + d * day, f'{slug}-{DAY_ABBREVS[d]}')
+
+    for year in years:
+        easter_day = easter(year)
+        advent = advent_sunday(year)
+
+        for w in range(4):
+            put_week(advent + 7 * w * day, f'advent-{w + 1}')
+        put(date(year, 12, 24), 'christmas-eve')
+        put(date(year, 12, 25), 'christmas-day')
+        for d, slug in CHRISTMAS_DATE_SLUGS:
+            put(date(year, 12, d), slug)
+        put(date(year + 1, 1, 1), 'christmas-jan-1')
+        for sunday in sundays_between(date(year, 12, 26), date(year + 1, 1, 1))[:1]:
+            put(sunday, 'christmas-1')
+        for sunday in sundays_between(date(year + 1, 1, 2), date(year + 1, 1, 5))[:1]:
+            put(sunday, 'christmas-2')
+
+        put(date(year, 1, 6), 'epiphany')
+        ash_wednesday = easter_day - 46 * day
+        epiphany_start = date(year, 1, 7)
+        epiphany_sundays = sundays_between(epiphany_start, ash_wednesday - 15 * day)
+        for i, sunday in enumerate(epiphany_sundays[:4]):
+            put_week(sunday, f'epiphany-{i + 1}')
+        put(date(year, 2, 2), 'candlemas')
+
+        weekday = js_weekday(ash_wednesday)
+        before_lent = ash_wednesday - (7 if weekday == 0 else weekday) * day
+        put_week(before_lent, 'before-lent-1')
+        put_week(before_lent - 7 * day, 'before-lent-2')
+        epiphany_end = epiphany_sundays[3] + 7 * day if len(epiphany_sundays) >= 4 else epiphany_start
+        if before_lent - 14 * day >= epiphany_end:
+            put_week(before_lent - 14 * day, 'before-lent-3')
+            if before_lent - 21 * day >= epiphany_end:
+                put_week(before_lent - 21 * day, 'before-lent-4')
+
+        put(ash_wednesday, 'ash-wednesday')
+        for w in range(5):
+            put_week(ash_wednesday + (4 + 7 * w) * day, f'lent-{w + 1}')
+        for offset, slug in HOLY_WEEK:
+            put(easter_day + offset * day, slug)
+        put(easter_day, 'easter-day')
+        for w in range(2, 8):
+            put_week(easter_day + 7 * (w - 1) * day, f'easter-{w}')
+        put(easter_day + 39 * day, 'ascension-day')
+        put(easter_day + 49 * day, 'pentecost')
+        put(easter_day + 56 * day, 'trinity-sunday')
+        put(easter_day + 60 * day, 'corpus-christi')
+
+        sunday = easter_day + 63 * day
+        proper = 4
+        while sunday < advent and proper <= 25:
+            weeks_before_advent = (advent - sunday).days // 7
+            if weeks_before_advent == 0:
+                put(sunday, 'christ-the-king')
+            elif weeks_before_advent <= 4:
+                put_week(sunday, f'kingdom-{weeks_before_advent + 1}')
+            else:
+                put_week(sunday, f'proper-{proper}')
+                proper += 1
+            sunday += 7 * day
+
+        # Fixed feasts never displace a seasonal mapping here
+        for month, d, slug in FIXED_FEASTS:
+            put(date(year, month, d), slug)
+
+    return slugs
+
+
+# ---------------------------------------------------------------------------
+# Almanac summary -> slug, for feasts the date mapping misses
+# ---------------------------------------------------------------------------
+
+SUMMARY_SLUG_OVERRIDES = {
+    'stephen': 'st-stephen',
+    'john': 'st-john-evangelist',
+    'holy innocents': 'holy-innocents',
+    'naming and circumcision of jesus': 'naming-of-jesus',
+    'baptism of christ': 'epiphany-1',
+    'the presentation': 'candlemas',
+    'the annunciation': 'annunciation',
+    'joseph of nazareth': 'st-joseph',
+    'george': 'st-george',
+    'mark the evangelist': 'st-mark',
+    'philip and james': 'ss-philip-and-james',
+    'matthias': 'st-matthias',
+    'the visitation': 'visit-of-mary',
+    'barnabas': 'st-barnabas',
+    'birth of john the baptist': 'birth-of-st-john-baptist',
+    'peter and paul': 'ss-peter-and-paul',
+    'thomas': 'st-thomas',
+    'mary magdalene': 'st-mary-magdalene',
+    'james': 'st-james',
+    'the transfiguration': 'transfiguration',
+    'the blessed virgin mary': 'blessed-virgin-mary',
+    'bartholomew': 'st-bartholomew',
+    'holy cross day': 'holy-cross-day',
+    'matthew': 'st-matthew',
+    'michael and all angels': 'st-michael-all-angels',
+    'luke the evangelist': 'st-luke',
+    'simon and jude': 'ss-simon-and-jude',
+    "all saints' day": 'all-saints',
+    "all saints' sunday": 'all-saints',
+    "all souls' day": 'all-souls',
+    'andrew': 'st-andrew',
+    'conversion of paul': 'conversion-of-st-paul',
+    'christmas day': 'christmas-day',
+    'christmas eve': 'christmas-eve',
+    'easter eve': 'easter-eve',
+    'easter day': 'easter-day',
+    'ascension day': 'ascension-day',
+    'palm sunday': 'palm-sunday',
+    'maundy thursday': 'maundy-thursday',
+    'good friday': 'good-friday',
+    'pentecost': 'pentecost',
+    'trinity sunday': 'trinity-sunday',
+    'ash wednesday': 'ash-wednesday',
+    'corpus christi': 'corpus-christi',
+    'christ the king': 'christ-the-king',
+    'sunday before lent': 'before-lent-1',
+    'mothering sunday': 'mothering-sunday',
+    'dedication festival': 'dedication-festival',
+    'bible sunday': 'bible-sunday',
+    'easter vigil': 'easter-vigil',
+    'peter': 'peter-apostle',
+}
+
+# Numbered summaries: "Advent 2" -> advent-2; "Trinity N" is left to the date
+_NUMBERED_SEASONS = re.compile(r'(advent|christmas|epiphany|lent|easter) (\d+)')
+
+# Days with year-specific principal readings even when not a Sunday
+SPECIAL_DAYS = frozenset({
+    'christmas-day', 'ash-wednesday', 'maundy-thursday', 'good-friday',
+    'easter-eve', 'easter-day', 'ascension-day', 'pentecost',
+    'trinity-sunday', 'all-saints', 'christ-the-king',
+    'epiphany', 'candlemas', 'annunciation',
+})
+
+
+def summary_slug(summary):
+    clean = re.sub(r'^CW\*?\s*', '', summary)
+    clean = re.sub(r'^\(or\)\s*', '', clean)
+    clean = clean.replace('&rsquo;', "'").replace('&ndash;', '–').strip()
+    # Trailing notes: "; Remembrance Sunday"
+    clean = clean.split(';', 1)[0].strip()
+    if not clean:
+        return None
+
+    lower = clean.lower()
+    if lower in SUMMARY_SLUG_OVERRIDES:
+        return SUMMARY_SLUG_OVERRIDES[lower]
+    m = _NUMBERED_SEASONS.fullmatch(lower)
+    if m:
+        return f'{m.group(1)}-{m.group(2)}'
+    if lower in ('epiphany', 'the epiphany'):
+        return 'epiphany'
+    m = re.fullmatch(r'(\d+) before lent', lower)
+    if m:
+        return f'before-lent-{int(m.group(1))}' if 1 <= int(m.group(1)) <= 4 else None
+    # "3 before Advent" is kingdom-4
+    m = re.fullmatch(r'(\d+) before advent', lower)
+    if m:
+        return f'kingdom-{int(m.group(1)) + 1}' if 2 <= int(m.group(1)) <= 4 else None
+    return None
+
+
+# ---------------------------------------------------------------------------
+# Readings
+# ---------------------------------------------------------------------------
+
+GOSPEL_BOOKS = ('Matthew', 'Mark', 'Luke', 'John')
+EPISTLE_BOOKS = frozenset({
+    'Romans', 'Corinthians', 'Galatians', 'Ephesians', 'Philippians',
+    'Colossians', 'Thessalonians', 'Timothy', 'Titus', 'Philemon',
+    'Hebrews', 'James', 'Peter', 'Jude', 'Revelation', 'Acts',
+})
+
+SERVICE_CONTEXTS = {
+    'principal service': 'principal',
+    'second service': 'second_service',
+    'third service': 'third_service',
+    'holy communion': 'daily_eucharist',
+    'morning prayer': 'morning_prayer',
+    'evening prayer': 'evening_prayer',
+}
+
+_ALMANAC_REFERENCE_RE = re.compile(
+    r'(\d?\s*[A-Za-z][A-Za-z\s]*?)\s+(\d+)(?:\.(\d+[a-z]?)(?:\s*[-–]\s*(\d+[a-z]?))?)?'
+)
+
+
+def classify_reading_type(ref, bibleref):
+    # The ref attribute has the full "Psalms 139" when the text is just "139"
+    check = bibleref.lower()
+    if check.startswith('psalm') or re.match(r'\d+\s*psalm', check):
+        return 'psalm'
+    # Bare numbers ("142, 144") in the office tables are psalms
+    if re.fullmatch(r'\d[\d,\s]*', ref.strip()):
+        return 'psalm'
+    if ref.startswith(GOSPEL_BOOKS):
+        return 'gospel'
+    if any(book in ref for book in EPISTLE_BOOKS):
+        return 'epistle'
+    return 'old_testament'
+
+
+def service_context(label):
+    lower = label.lower()
+    if lower in SERVICE_CONTEXTS:
+        return SERVICE_CONTEXTS[lower]
+    if 'morning psalm' in lower:
+        return 'morning_prayer'
+    if 'evening psalm' in lower:
+        return 'evening_prayer'
+    return None
+
+
+def clean_reference(ref):
+    ref = re.sub(r'<[^>]+>', '', ref)
+    ref = ref.replace('&ndash;', '–').replace('&rsquo;', '’').replace('&nbsp;', ' ')
+    ref = ref.replace('&amp;', '&')
+    ref = re.sub(r'\s+', ' ', ref)
+    return re.sub(r'\s*–\s*', '–', ref).strip()
+
+
+def almanac_reference(ref):
+    """(book, chapter, verseStart, verseEnd) as parse-almanac.ts reads them.
+
+    This is deliberately not lectionary.references.parse_reference: the
+    committed almanac datasets hold this simpler reading of each reference.
+    The book is given its canonical name, as make_reading() gives it.
+    """
+    cleaned = re.sub(r'\s+', ' ', ref).replace('–', '-').replace('&ndash;', '-').strip()
+    m = _ALMANAC_REFERENCE_RE.match(cleaned)
+    if not m:
+        return None, None, None, None
+    book = m.group(1).strip()
+    return canonical_book(book) or book, m.group(2), m.group(3), m.group(4)
+
+
+def reading_record(slug, tradition, context, reading, alternate_year, sort_order,
+                   is_optional=None):
+    ref = reading['ref']
+    book, chapter, verse_start, verse_end = almanac_reference(ref)
+    return {
+        'occasionSlug': slug,
+        'tradition': tradition,
+        'serviceContext': context,
+        'readingType': classify_reading_type(ref, reading['biblerefAttr']),
+        'reference': clean_reference(ref),
+        'book': book,
+        'chapter': chapter,
+        'verseStart': verse_start,
+        'verseEnd': verse_end,
+        'alternateYear': alternate_year,
+        'isOptional': reading.get('isOptional', False) if is_optional is None else is_optional,
+        'sortOrder': sort_order,
+    }
+
+
+def commemoration_slug(title):
+    """"Charles, King and Martyr, 1649" -> "charles-king-and-martyr"."""
+    title = re.sub(r',\s*\d{3,4}(\s+and\s+\d{3,4})?\Z', '', title)
+    title = re.sub(r',\s*c\.\s*\d{3,4}\Z', '', title)
+    title = re.sub(r'[,()]', '', title).replace('&rsquo;', '').replace('&ndash;', '-')
+    return re.sub(r'\s+', '-', title.strip().lower())
+
+
+def deduplicate(readings):
+    """Keep the first of readings repeated in later almanac years."""
+    seen = set()
+    kept = []
+    for r in readings:
+        key = (r['occasionSlug'], r['serviceContext'], r['alternateYear'] or '',
+               r['readingType'], r['reference'])
+        if key not in seen:
+            seen.add(key)
+            kept.append(r)
+    return kept
+
+
+def choose_slug(entry, slugs_by_date, valid_slugs):
+    date_slug = slugs_by_date.get(entry['dateStart'])
+    from_summary = summary_slug(entry['summary'])
+    summary_valid = from_summary in valid_slugs
+    # A feast alternative ("(or) ...") or a feast on a seasonal date takes
+    # its own occasion
+    if summary_valid and '(or)' in entry['summary']:
+        return from_summary
+    if summary_valid and date_slug and from_summary != date_slug:
+        return from_summary
+    if date_slug in valid_slugs:
+        return date_slug
+    if summary_valid:
+        return from_summary
+    return date_slug
+
+
+def build_datasets(entries, valid_slugs, slugs_by_date):
+    """The output datasets from almanac entries in year order, and unmatched summaries."""
+    out = {key: [] for key, _, _ in READING_OUTPUTS}
+    commemorations = {}
+    collects = {}
+    unmatched = {}
+    matched = 0
+
+    for entry in entries:
+        slug = choose_slug(entry, slugs_by_date, valid_slugs)
+        if slug not in valid_slugs:
+            if 'CW*' in entry['summary']:
+                unmatched[entry['summary']] = None
+            continue
+        matched += 1
+
+        cw = entry['collectsCw']
+        if slug not in collects and (cw['collectCw'] or entry['collectBcp'] or cw['postCommunionCw']):
+            collects[slug] = {
+                'collectCw': cw['collectCw'],
+                'collectBcp': entry['collectBcp'],
+                'postCommunionCw': cw['postCommunionCw'],
+            }
+
+        d = date.fromisoformat(entry['dateStart'])
+        info = day_info(d)
+        sections = entry['sections']
+        principal_year = info.liturgical_year if js_weekday(d) == 0 or slug in SPECIAL_DAYS else None
+
+        for key, lect, year in (('cwPrincipal', 'lect1', principal_year),
+                                ('cwEucharist', 'lect2', info.office_year),
+                                ('cwOffice', 'lect3', info.office_year)):
+            for section in sections[lect]:
+                context = service_context(section['label'])
+                if not context:
+                    continue
+                if key == 'cwEucharist':
+                    context = 'daily_eucharist'
+                out[key].extend(
+                    reading_record(slug, 'cw', context, reading, year, i)
+                    for i, reading in enumerate(section['readings'], 1)
+                )
+
+        out['bcpHc'].extend(
+            reading_record(slug, 'bcp', 'principal', reading, None, i)
+            for i, reading in enumerate(sections['bcpadd'] + sections['bcphc'], 1)
+        )
+
+        name = entry['commemorationName']
+        if sections['lect4'] and name:
+            comm_slug = commemoration_slug(name)
+            if comm_slug not in commemorations:
+                comm = entry['commemorationCollects']
+                commemorations[comm_slug] = {
+                    'slug': comm_slug,
+                    'name': name,
+                    'colour': entry['commemorationColour'],
+                    'isFixed': True,
+                    'fixedMonth': d.month,
+                    'fixedDay': d.day,
+                    'priority': 20,
+                    'collectCw': comm['collectCw'],
+                    'postCommunionCw': comm['postCommunionCw'],
+                }
+            # Optional alternatives to the daily eucharist readings (1-4)
+            readings = [r for section in sections['lect4'] for r in section['readings']]
+            out['cwCommemorations'].extend(
+                reading_record(comm_slug, 'cw', 'daily_eucharist', reading, None, i, True)
+                for i, reading in enumerate(readings, 5)
+            )
+
+    datasets = {key: deduplicate(readings) for key, readings in out.items()}
+    datasets['commemorations'] = list(commemorations.values())
+    datasets['collects'] = collects
+    return datasets, matched, list(unmatched)
+
+
+# ---------------------------------------------------------------------------
+# Output
+# ---------------------------------------------------------------------------
+
+def output_files(datasets, pretty, output_dir):
+    """(data file, written file, record count) for each dataset written."""
+    outputs = [(key, path) for key, _, path in READING_OUTPUTS]
+    outputs += [('commemorations', COMMEMORATION_OCCASIONS_FILE), ('collects', COLLECTS_FILE)]
+    written = []
+    for key, data_file in outputs:
+        records = datasets[key]
+        if pretty:
+            target = output_dir / data_file.name
+        elif key == 'collects':
+            # An object keyed by slug, which the seeder only reads as .json
+            target = (BUILD_DIR if output_dir == DATA_DIR else output_dir) / data_file.name
+        else:
+            target = output_dir / ndjson_path(data_file).name
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with open(target, 'w', encoding='utf-8') as f:
+            if pretty or key == 'collects':
+                json.dump(records, f, indent=2, ensure_ascii=False)
+                f.write('\n')
+            else:
+                write_ndjson(records, f)
+        written.append((data_file, target, len(records)))
+    return written
+
+
+def check_outputs(written, report):
+    """Validate the written files together in place of the data files."""
+    t0 = time.perf_counter()
+    sources = {data_file: target for data_file, target, _ in written if data_file != COLLECTS_FILE}
+    names = {target.name for target in sources.values()}
+    problems = [p for p in validate(sources) if p.file in names or p.kind == 'orphan']
+    print(f'Validated in {(time.perf_counter() - t0) * 1000:.0f} ms: {summarise(problems)}',
+          file=report)
+    for line in format_problems(problems, MAX_PROBLEMS_SHOWN):
+        print(f'  {line}', file=report)
+    return not any(is_error(p) for p in problems)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__.strip().splitlines()[0],
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument('files', nargs='*', type=Path,
+                        help='almanac files to parse (default: every almanac-YYYY.html '
+                             'in scripts/data/)')
+    parser.add_argument('--pretty', action='store_true',
+                        help='write the indented JSON files committed under scripts/data/')
+    parser.add_argument('-d', '--output-dir', type=Path, default=DATA_DIR,
+                        help='directory to write to (default: scripts/data/)')
+    parser.add_argument('-j', '--jobs', type=int,
+                        help='almanac files to parse at once (default: one per CPU)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='parse every almanac file, ignoring cached entries')
+    parser.add_argument('--no-validate', action='store_true',
+                        help='skip checking the output against the other datasets')
+    args = parser.parse_args()
+    report = sys.stdout
+
+    paths = sorted(args.files, key=lambda p: p.name) or almanac_files()
+    if not paths:
+        sys.exit(f'No almanac-YYYY.html files in {DATA_DIR}')
+    for path in paths:
+        if not ALMANAC_RE.match(path.name):
+            sys.exit(f'Not an almanac-YYYY.html file: {path}')
+    t0 = time.perf_counter()
+    parsed = parse_almanacs(paths, args.jobs, use_cache=not args.no_cache)
+    t1 = time.perf_counter()
+    entries = []
+    for path, file_entries, cached in parsed:
+        print(f'{path.name}: {len(file_entries)} entries{" (cached)" if cached else ""}',
+              file=report)
+        entries.extend(file_entries)
+
+    valid_slugs = {occ['slug'] for occ in load_records(resolve_data_file(OCCASIONS_FILE))}
+    years = [int(p.name[len('almanac-'):-len('.html')]) for p in paths]
+    # A year's almanac runs from Advent of the year before into the next
+    slugs_by_date = date_slug_map(range(years[0] - 1, years[-1] + 2))
+    datasets, matched, unmatched = build_datasets(entries, valid_slugs, slugs_by_date)
+    t2 = time.perf_counter()
+
+    print(f'\nMatched {matched} entries, {len(entries) - matched} unmatched', file=report)
+    if unmatched:
+        print('Unmatched CW* summaries (major occasions):', file=report)
+        for summary in unmatched:
+            print(f'  {summary}', file=report)
+
+    print('\nOutput counts (after deduplication):', file=report)
+    for key, label, _ in READING_OUTPUTS:
+        print(f'  {label}: {len(datasets[key])}', file=report)
+    print(f'  Commemoration occasions: {len(datasets["commemorations"])}', file=report)
+    print(f'  Collects: {len(datasets["collects"])}', file=report)
+
+    written = output_files(datasets, args.pretty, args.output_dir)
+    for _, target, _ in written:
+        print(f'  Wrote {target}', file=report)
+    print(f'Parsed in {t1 - t0:.2f}s, built in {t2 - t1:.2f}s', file=report)
+
+    if not args.no_validate and not check_outputs(written, report):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""Parse the 1922 Revised Table of Lessons (CSV) into BCP office readings.
+
+A Python port of parse-bcp-office.ts that streams data/1922-time.csv and
+data/1922-saints.csv a row at a time (see lectionary.bcp_1922), with
+lessons that run to "end" given the chapter's last verse. Output options
+are those of the generate-*.py scripts; --pretty writes
+data/lectionary-readings-bcp-office.json.
+"""
+
+import json
+import os
+from collections import Counter
+
+from lectionary import bcp_1922
+from lectionary.bcp_1922 import SAINTS_CSV, TIME_CSV, iter_readings
+from lectionary.columnar import write_columns
+from lectionary.datasets import OCCASIONS_FILE, load_records, resolve_data_file
+from lectionary.manifest import generator_inputs
+from lectionary.output import (
+    check_output, generator_arguments, open_output, output_format, output_target, record_build,
+    report_stream, tally, up_to_date, write_ndjson, write_sqlite,
+)
+from lectionary.profiling import start_profile
+from lectionary.records import as_json
+
+
+def main():
+    args = generator_arguments(__doc__).parse_args()
+    default_path = os.path.join(os.path.dirname(__file__), 'data', 'lectionary-readings-bcp-office.json')
+    output_path = output_target(args, default_path)
+    report = report_stream(output_path)
+    occasions_path = resolve_data_file(OCCASIONS_FILE)
+    inputs = generator_inputs(__file__, bcp_1922.__file__, TIME_CSV, SAINTS_CSV, occasions_path)
+    if up_to_date(args, output_path, inputs, report):
+        return
+    profile = start_profile(args, __file__)
+
+    with profile.stage('load'):
+        valid_slugs = {occ['slug'] for occ in load_records(occasions_path)}
+    contexts = Counter()
+    slugs = Counter()
+    skipped = {}
+    entries = profile.collect('parse', iter_readings(valid_slugs, skipped=skipped))
+    entries = tally(entries, contexts, lambda e: e.service_context)
+    entries = tally(entries, slugs, lambda e: e.occasion_slug)
+
+    if args.sqlite:
+        with profile.stage('write'):
+            count = write_sqlite(entries, output_path, default_path, report)
+    elif args.pretty:
+        entries = list(entries)
+        with open_output(output_path) as f, profile.serialize_to(f) as out:
+            json.dump(list(as_json(entries)), out, ensure_ascii=False, indent=2)
+            out.write('\n')
+        count = len(entries)
+    elif args.columnar:
+        with open_output(output_path) as f, profile.serialize_to(f) as out:
+            count = write_columns(as_json(entries), out)
+    else:
+        with open_output(output_path) as f, profile.serialize_to(f) as out:
+            count = write_ndjson(as_json(entries), out)
+
+    record_build(args, output_path, inputs)
+    profile.finish(report, output_path, output_format(args), count)
+
+    for source, labels in skipped.items():
+        if labels:
+            print(f'Skipped 1922-{source}.csv rows (no matching slug):', file=report)
+            for label in sorted(labels):
+                print(f'  {label}', file=report)
+
+    print(f'Generated {count} BCP office readings from the 1922 table', file=report)
+    print(f'Output: {output_path}', file=report)
+
+    for ctx, n in sorted(contexts.items()):
+        print(f'  {ctx}: {n}', file=report)
+
+    print(f'  Unique occasion slugs: {len(slugs)}', file=report)
+    check_output(args, output_path, default_path, report)
+
+
+if __name__ == '__main__':
+    main()
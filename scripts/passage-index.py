@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""Build or query the passage interval index over all lectionary readings.
+
+Usage:
+  python3 scripts/passage-index.py build
+  python3 scripts/passage-index.py overlapping "John 11"
+  python3 scripts/passage-index.py containing "John 11.35" --tradition cw
+  python3 scripts/passage-index.py within "Isaiah 40-55" --context evening_prayer
+"""
+
+import argparse
+import time
+
+from lectionary.passage_index import INDEX_FILE, PassageIndex, load_index
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('command', choices=['build', 'overlapping', 'containing', 'within'])
+    parser.add_argument('reference', nargs='?')
+    parser.add_argument('--tradition', choices=['cw', 'bcp'])
+    parser.add_argument('--context', help='service context, e.g. morning_prayer')
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        t0 = time.perf_counter()
+        index = PassageIndex.build()
+        index.save()
+        print(f'Indexed {len(index)} readings ({len(index.starts)} intervals) '
+              f'in {time.perf_counter() - t0:.2f}s')
+        print(f'Output: {INDEX_FILE}')
+        return
+
+    if not args.reference:
+        parser.error(f'{args.command} needs a reference')
+
+    index = load_index()
+    t0 = time.perf_counter()
+    rows = getattr(index, args.command)(args.reference)
+    elapsed = time.perf_counter() - t0
+    rows = [r for r in rows
+            if (not args.tradition or r['tradition'] == args.tradition)
+            and (not args.context or r['serviceContext'] == args.context)]
+
+    for r in rows:
+        year = f' [{r["alternateYear"]}]' if r['alternateYear'] else ''
+        print(f'{r["tradition"]:3} {r["serviceContext"] or "":18} '
+              f'{r["occasionSlug"]}{year}: {r["reference"]}')
+    occasions = {r['occasionSlug'] for r in rows}
+    print(f'{len(rows)} readings on {len(occasions)} occasions ({elapsed * 1000:.2f} ms)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""Precompute each date's grouped readings into lectionary_resolved_readings.
+
+For every date of the range in the date map, and for each tradition,
+stores as JSON what getReadingsGroupedByContext() in
+src/lib/server/services/lectionary.ts would build from the lectionary
+tables, so the lectionary page reads it with one primary-key lookup (see
+lectionary.resolved). Run after seeding: reseeding empties the table, and
+the service falls back to the joins for any date it lacks.
+
+Usage:
+  python3 scripts/resolve-readings.py
+  python3 scripts/resolve-readings.py --db /tmp/test.db --years 2020-2040
+  python3 scripts/resolve-readings.py --show 2025-12-25 --tradition bcp
+"""
+
+import argparse
+import json
+import sqlite3
+import sys
+
+from lectionary.database import DB_PATH, RESOLVED_TABLE, seed_resolved_readings
+from lectionary.date_map import DEFAULT_YEARS, parse_years
+from lectionary.resolved import TRADITIONS
+
+
+def show(db_path, date, tradition):
+    conn = sqlite3.connect(db_path)
+    try:
+        row = conn.execute(f'SELECT data FROM {RESOLVED_TABLE} WHERE date = ? AND tradition = ?',
+                           (date, tradition)).fetchone()
+    except sqlite3.OperationalError as e:
+        sys.exit(str(e))
+    finally:
+        conn.close()
+    if row is None:
+        sys.exit(f'No resolved readings for {date} ({tradition})')
+    json.dump(json.loads(row[0]), sys.stdout, indent=2, ensure_ascii=False)
+    print()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__.strip().splitlines()[0],
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument('--db', default=DB_PATH, help='database (default: data/chapel-planner.db)')
+    parser.add_argument('--years', type=parse_years, default=DEFAULT_YEARS,
+                        help='years to resolve, e.g. 2020-2040 (default: 2024-2030)')
+    parser.add_argument('--show', metavar='DATE',
+                        help='print the stored document for DATE instead of building')
+    parser.add_argument('--tradition', choices=TRADITIONS, default='cw',
+                        help='with --show, the tradition (default: cw)')
+    args = parser.parse_args()
+
+    if args.show:
+        show(args.db, args.show, args.tradition)
+        return
+
+    try:
+        stats = seed_resolved_readings(args.db, args.years)
+    except RuntimeError as e:
+        sys.exit(str(e))
+    t = stats['timings']
+    print(f'Resolved {stats["rows"]} date/tradition rows for {stats["dates"]} dates in {args.db}')
+    print(f'  Load {t["load"]:.3f}s, build {t["build"]:.3f}s, write {t["write"]:.3f}s '
+          f'(total {sum(t.values()):.3f}s)')
+
+
+if __name__ == '__main__':
+    main()
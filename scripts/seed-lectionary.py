@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""Seed the lectionary tables in one bulk sqlite3 transaction.
+
+A faster equivalent of `npm run db:seed-lectionary`: it reads the same data
+files (the committed .json files, or the form $LECTIONARY_DATA_FORM names,
+as the TypeScript seeder does) and writes the same occasions, readings and
+date map.
+
+Usage:
+  python3 scripts/seed-lectionary.py
+  python3 scripts/seed-lectionary.py --db /tmp/test.db --years 2020-2040
+  python3 scripts/seed-lectionary.py --compare-ts
+"""
+
+import argparse
+import sqlite3
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from lectionary.database import DB_PATH, format_seed_stats, seed
+from lectionary.datasets import SCRIPTS_DIR
+from lectionary.date_map import DEFAULT_YEARS, parse_years
+
+SNAPSHOT_QUERIES = {
+    'lectionary_occasions':
+        'SELECT name, slug, season, colour, is_fixed, fixed_month, fixed_day, week_of_season, '
+        'day_of_week, priority, collect_cw, collect_bcp, post_communion_cw, occasion_rank, '
+        'can_transfer_to_sunday, common_slug FROM lectionary_occasions ORDER BY id',
+    'lectionary_readings':
+        'SELECT o.slug, r.tradition, r.service_context, r.reading_type, r.book, r.chapter, '
+        'r.verse_start, r.verse_end, r.reference, r.alternate_year, r.is_optional, '
+        'r.sort_order, r.reading_set_label FROM lectionary_readings r '
+        'JOIN lectionary_occasions o ON o.id = r.occasion_id ORDER BY r.id',
+    'lectionary_date_map':
+        'SELECT m.date, o.slug, m.liturgical_year, m.mapping_type FROM lectionary_date_map m '
+        'JOIN lectionary_occasions o ON o.id = m.occasion_id ORDER BY m.id',
+}
+
+
+def snapshot(db_path):
+    """Lectionary rows with occasion ids replaced by slugs, for comparison."""
+    conn = sqlite3.connect(db_path)
+    try:
+        return {table: conn.execute(sql).fetchall() for table, sql in SNAPSHOT_QUERIES.items()}
+    finally:
+        conn.close()
+
+
+def compare_with_ts(db_path, years):
+    """Time the TypeScript seeder and this one on the same database."""
+    if db_path != DB_PATH:
+        sys.exit('--compare-ts works on the default database only, '
+                 'since seed-lectionary.ts always writes data/chapel-planner.db')
+    t0 = time.perf_counter()
+    result = subprocess.run(['npx', 'tsx', 'scripts/seed-lectionary.ts'],
+                            cwd=SCRIPTS_DIR.parent, capture_output=True, text=True)
+    ts_elapsed = time.perf_counter() - t0
+    if result.returncode != 0:
+        sys.exit(f'seed-lectionary.ts failed:\n{result.stderr or result.stdout}')
+    ts_rows = snapshot(db_path)
+
+    t0 = time.perf_counter()
+    stats = seed(db_path, years=years, log=lambda *_: None)
+    py_elapsed = time.perf_counter() - t0
+    py_rows = snapshot(db_path)
+
+    print(f'seed-lectionary.ts: {ts_elapsed:.2f}s (including tsx start-up)')
+    print(f'seed-lectionary.py: {py_elapsed:.2f}s ({ts_elapsed / py_elapsed:.1f}x faster)')
+    print(format_seed_stats(stats))
+    for table in SNAPSHOT_QUERIES:
+        same = ts_rows[table] == py_rows[table]
+        print(f'  {table}: {len(py_rows[table])} rows, '
+              f'{"identical" if same else "DIFFERENT"} to the TypeScript seeder')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--db', default=DB_PATH, help=f'database file (default: {DB_PATH})')
+    parser.add_argument('--years', type=parse_years, default=DEFAULT_YEARS,
+                        help='date map years, e.g. 2024-2030 (the default)')
+    parser.add_argument('--compare-ts', action='store_true',
+                        help='run seed-lectionary.ts first and compare time and rows')
+    args = parser.parse_args()
+    db_path = Path(args.db)
+
+    if args.compare_ts:
+        compare_with_ts(db_path, args.years)
+        return
+
+    print('Seeding lectionary data...')
+    try:
+        stats = seed(db_path, years=args.years)
+    except RuntimeError as e:
+        sys.exit(str(e))
+    print(format_seed_stats(stats))
+    print('\nLectionary seed complete.')
+
+
+if __name__ == '__main__':
+    main()
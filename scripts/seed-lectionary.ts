@@ -1,8 +1,9 @@
 import Database from 'better-sqlite3';
 import { drizzle } from 'drizzle-orm/better-sqlite3';
 import { eq } from 'drizzle-orm';
-import { resolve } from 'path';
-import { mkdirSync, readFileSync, existsSync } from 'fs';
+import { relative, resolve } from 'path';
+import { mkdirSync, readFileSync, existsSync, createReadStream } from 'fs';
+import { createInterface } from 'readline';
 import * as schema from '../src/lib/server/db/schema';
 
 const DB_PATH = resolve('data/chapel-planner.db');
@@ -15,6 +16,92 @@ sqlite.pragma('foreign_keys = ON');
 
 const db = drizzle(sqlite, { schema });
 
+const DATA_FORM_ENDINGS: Record<string, string> = {
+	json: '.json',
+	ndjson: '.ndjson',
+	columns: '.columns.json'
+};
+
+/**
+ * The Python tools write NDJSON (generators) or columnar files (generators,
+ * scripts/columnar.py) next to the committed .json files, and those need not
+ * hold the committed data. Read the committed .json files unless
+ * LECTIONARY_DATA_FORM asks for another form; a file with no copy in that
+ * form is read from its .json file. Mirrors resolve_data_file() in
+ * scripts/lectionary/datasets.py.
+ */
+const DATA_FORM = process.env.LECTIONARY_DATA_FORM || 'json';
+if (!(DATA_FORM in DATA_FORM_ENDINGS)) {
+	throw new Error(
+		`LECTIONARY_DATA_FORM must be one of ${Object.keys(DATA_FORM_ENDINGS).join(', ')}, not ${DATA_FORM}`
+	);
+}
+
+function resolveDataFile(file: string): string {
+	const jsonPath = resolve(file);
+	const candidate = jsonPath.replace(/\.json$/, DATA_FORM_ENDINGS[DATA_FORM]);
+	return existsSync(candidate) ? candidate : jsonPath;
+}
+
+const TYPED_ARRAYS = {
+	b: Int8Array,
+	h: Int16Array,
+	i: Int32Array,
+	B: Uint8Array,
+	H: Uint16Array,
+	I: Uint32Array
+};
+
+/** Decode a little-endian packed array written by lectionary/columnar.py. */
+function unpackArray(text: string, width: keyof typeof TYPED_ARRAYS) {
+	// Copy into a fresh buffer so the typed array view is aligned
+	const bytes = new Uint8Array(Buffer.from(text, 'base64'));
+	return new TYPED_ARRAYS[width](bytes.buffer);
+}
+
+/** Rebuild records from a dictionary-encoded columnar document. */
+function* decodeColumns(doc: any): Generator<any> {
+	const columns = doc.columns.map((column: any) => {
+		const missing = column.missing ? Buffer.from(column.missing, 'base64') : null;
+		if (column.type === 'int') {
+			const data = unpackArray(column.data, column.width);
+			const nullValue = -(2 ** (8 * data.BYTES_PER_ELEMENT - 1));
+			return { name: column.name, missing, get: (i: number) => (data[i] === nullValue ? null : data[i]) };
+		}
+		const codes = unpackArray(column.codes, column.width);
+		const values = column.values;
+		return { name: column.name, missing, get: (i: number) => values[codes[i]] };
+	});
+	for (let i = 0; i < doc.count; i++) {
+		const record: Record<string, any> = {};
+		for (const column of columns) {
+			if (column.missing && column.missing[i >> 3] & (1 << (i & 7))) continue;
+			record[column.name] = column.get(i);
+		}
+		yield record;
+	}
+}
+
+/**
+ * Yield records from a JSON array, a columnar file or, line by line, from an
+ * NDJSON file. NDJSON is read as it arrives, so a FIFO fed by a generator
+ * works too.
+ */
+async function* readRecords(filePath: string): AsyncGenerator<any> {
+	if (filePath.endsWith('.columns.json')) {
+		yield* decodeColumns(JSON.parse(readFileSync(filePath, 'utf-8')));
+		return;
+	}
+	if (!filePath.endsWith('.ndjson')) {
+		yield* JSON.parse(readFileSync(filePath, 'utf-8'));
+		return;
+	}
+	const lines = createInterface({ input: createReadStream(filePath, 'utf-8'), crlfDelay: Infinity });
+	for await (const line of lines) {
+		if (line.trim()) yield JSON.parse(line);
+	}
+}
+
 console.log('Seeding lectionary data...');
 
 // Clear existing lectionary data (order matters for FK constraints)
@@ -23,11 +110,22 @@ db.delete(schema.lectionaryReadings).run();
 db.delete(schema.lectionaryOccasions).run();
 console.log('  Cleared existing lectionary data.');
 
+// The collect search index holds the old occasions' collects; empty it
+// rather than let it serve stale text (scripts/index-collects.py rebuilds it)
+const searchIndex = sqlite
+	.prepare("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'lectionary_collect_search'")
+	.get();
+if (searchIndex) {
+	sqlite.exec('DELETE FROM lectionary_collect_search');
+	console.log('  Emptied the collect search index (rebuild it with scripts/index-collects.py).');
+}
+
 // --- 1. Load and insert occasions ---
 
-const occasionsRaw = JSON.parse(
-	readFileSync(resolve('scripts/data/lectionary-occasions.json'), 'utf-8')
-);
+const occasionsRaw: any[] = [];
+for await (const occ of readRecords(resolveDataFile('scripts/data/lectionary-occasions.json'))) {
+	occasionsRaw.push(occ);
+}
 
 console.log(`  Loading ${occasionsRaw.length} occasions...`);
 
@@ -147,16 +245,15 @@ let readingsInserted = 0;
 let readingsSkipped = 0;
 
 for (const file of readingFiles) {
-	const filePath = resolve(file);
+	const filePath = resolveDataFile(file);
 	if (!existsSync(filePath)) {
 		console.log(`  Skipping ${file} (not found)`);
 		continue;
 	}
 
-	const readingsRaw = JSON.parse(readFileSync(filePath, 'utf-8'));
-	console.log(`  Loading ${readingsRaw.length} readings from ${file}...`);
+	console.log(`  Loading readings from ${relative(process.cwd(), filePath)}...`);
 
-	for (const reading of readingsRaw) {
+	for await (const reading of readRecords(filePath)) {
 		const occasionId = slugToId[reading.occasionSlug];
 		if (!occasionId) {
 			readingsSkipped++;
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# The lectionary package is imported from scripts/, as the scripts do
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,47 @@
+import pytest
+
+from lectionary.books import alias_table, book_key
+from lectionary.versification import BOOK_ORDER, canonical_book
+
+
+@pytest.mark.parametrize('name, canonical', [
+    ('Psalm', 'Psalms'),
+    ('Ps.', 'Psalms'),
+    ('psalms', 'Psalms'),
+    ('1 Cor', '1 Corinthians'),
+    ('1Cor', '1 Corinthians'),
+    ('I Corinthians', '1 Corinthians'),
+    ('First Corinthians', '1 Corinthians'),
+    ('II Kings', '2 Kings'),
+    ('2nd Kings', '2 Kings'),
+    ('  1   John ', '1 John'),
+    ('Song of Songs', 'Song of Solomon'),
+    ('Susannah', 'Susanna'),
+    ('Wisdom of Solomon', 'Wisdom'),
+    ('Sirach', 'Ecclesiasticus'),
+    ('Rev.', 'Revelation'),
+    ('Jude', 'Jude'),
+])
+def test_canonical_book(name, canonical):
+    assert canonical_book(name) == canonical
+
+
+@pytest.mark.parametrize('name', ['Nonsense', '4 Kings', None])
+def test_unknown_book(name):
+    assert canonical_book(name) is None
+
+
+def test_canonical_names_are_shared():
+    assert canonical_book('Psalm') is canonical_book('Ps')
+
+
+def test_every_canonical_name_is_its_own_alias():
+    table = alias_table(BOOK_ORDER)
+    for name in BOOK_ORDER:
+        assert table[name] == name
+        assert table[book_key(name)] == name
+
+
+def test_shared_spelling_is_refused():
+    with pytest.raises(ValueError, match="'Psalm' names both Psalms and Psalm"):
+        alias_table(['Psalms', 'Psalm'])
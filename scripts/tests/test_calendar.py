@@ -0,0 +1,48 @@
+from datetime import date
+
+import pytest
+
+from lectionary.calendar import (
+    advent_sunday, computus, day_info, easter, liturgical_year, timeline_json,
+)
+
+
+@pytest.mark.parametrize('year', [1990, 2024, 2025, 2100])
+def test_candlemas_ends_epiphany(year):
+    assert day_info(date(year, 2, 2))[:2] == ('epiphany', 'white')
+    assert day_info(date(year, 2, 3))[:2] == ('ordinary_time', 'green')
+
+
+def test_timeline_starts_ordinary_time_after_candlemas():
+    runs = timeline_json([2025])['runs']
+    starts = {run[0]: run[1] for run in runs}
+    assert starts['2025-01-06'] == 'epiphany'
+    assert starts['2025-02-03'] == 'ordinary_time'
+
+
+@pytest.mark.parametrize('year, expected', [
+    (1583, date(1583, 4, 10)),
+    (2024, date(2024, 3, 31)),
+    (2038, date(2038, 4, 25)),
+    (2285, date(2285, 3, 22)),
+    (4099, date(4099, 4, 19)),
+    (4100, computus(4100)),
+])
+def test_easter(year, expected):
+    assert easter(year) == expected
+
+
+@pytest.mark.parametrize('year, expected', [
+    (2023, date(2023, 12, 3)),
+    (2024, date(2024, 12, 1)),
+    (2025, date(2025, 11, 30)),
+])
+def test_advent_sunday(year, expected):
+    assert advent_sunday(year) == expected
+
+
+def test_year_changes_on_advent_sunday():
+    assert liturgical_year(date(2025, 11, 29)) == 'C'
+    assert liturgical_year(date(2025, 11, 30)) == 'A'
+    assert day_info(date(2025, 11, 30)).season == 'advent'
+    assert day_info(date(2025, 12, 25)).season == 'christmas'
@@ -0,0 +1,42 @@
+import os
+
+import pytest
+
+from lectionary.datasets import DATA_FORM_ENV, resolve_data_file
+
+
+@pytest.fixture
+def data_file(tmp_path, monkeypatch):
+    monkeypatch.delenv(DATA_FORM_ENV, raising=False)
+    path = tmp_path / 'lectionary-readings-cw-office.json'
+    path.write_text('[]')
+    return path
+
+
+def test_committed_json_by_default(data_file):
+    ndjson = data_file.with_suffix('.ndjson')
+    ndjson.write_text('')
+    # A newer generator output is still not read unless asked for
+    os.utime(data_file, ns=(0, 0))
+    assert resolve_data_file(data_file) == data_file
+
+
+@pytest.mark.parametrize('form, ending', [('ndjson', '.ndjson'), ('columns', '.columns.json')])
+def test_form_asked_for(data_file, monkeypatch, form, ending):
+    other = data_file.with_name('lectionary-readings-cw-office' + ending)
+    other.write_text('')
+    os.utime(other, ns=(0, 0))
+    assert resolve_data_file(data_file, form) == other
+    monkeypatch.setenv(DATA_FORM_ENV, form)
+    assert resolve_data_file(data_file) == other
+
+
+def test_form_asked_for_falls_back_to_json(data_file, monkeypatch):
+    monkeypatch.setenv(DATA_FORM_ENV, 'ndjson')
+    assert resolve_data_file(data_file) == data_file
+
+
+def test_unknown_form(data_file, monkeypatch):
+    monkeypatch.setenv(DATA_FORM_ENV, 'csv')
+    with pytest.raises(ValueError, match=DATA_FORM_ENV):
+        resolve_data_file(data_file)
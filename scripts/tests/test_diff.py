@@ -0,0 +1,80 @@
+from lectionary.datasets import DATA_FORM_ENV
+from lectionary.diff import (
+    by_occasion, changed_fields, dataset_name, diff_records, format_change, index_records,
+    pair_files, record_key,
+)
+
+
+def reading(slug='easter-day', sort_order=1, reference='John 20.1-18', **fields):
+    return {'occasionSlug': slug, 'tradition': 'cw', 'serviceContext': 'principal',
+            'readingType': 'gospel', 'alternateYear': None, 'sortOrder': sort_order,
+            'reference': reference, **fields}
+
+
+def test_reading_key():
+    assert record_key(reading()) == ('easter-day', 'cw', 'principal', 'gospel', None, 1)
+
+
+def test_missing_service_context_is_principal():
+    record = reading()
+    del record['serviceContext']
+    assert record_key(record) == record_key(reading())
+
+
+def test_occasion_key():
+    assert record_key({'slug': 'easter-day', 'name': 'Easter Day'}) == ('easter-day',)
+
+
+def test_repeated_keys_pair_up_in_order():
+    index = index_records([reading(reference='a'), reading(reference='b')])
+    key = record_key(reading())
+    assert index[key]['reference'] == 'a'
+    assert index[key + (2,)]['reference'] == 'b'
+
+
+def test_collects_are_keyed_by_slug():
+    assert index_records({'easter-day': {'collect': 'x'}}) == {('easter-day',): {'collect': 'x'}}
+
+
+def test_missing_and_null_fields_are_the_same():
+    assert changed_fields({'verseEnd': None}, {}) == ()
+    assert changed_fields({'book': 'Psalm'}, {'book': 'Psalms'}) == ('book',)
+
+
+def test_diff_records():
+    old = [reading(), reading(sort_order=2, reference='Mark 16.1-8'), reading('pentecost')]
+    new = [reading(reference='John 20.1-10'), reading(sort_order=2, reference='Mark 16.1-8'),
+           reading('trinity-sunday')]
+    changes = diff_records(old, new)
+    assert [(c.kind, c.key[0], c.fields) for c in changes] == [
+        ('changed', 'easter-day', ('reference',)),
+        ('added', 'trinity-sunday', ()),
+        ('removed', 'pentecost', ()),
+    ]
+    assert list(by_occasion(changes)) == ['easter-day', 'trinity-sunday', 'pentecost']
+    assert format_change(changes[0]) == (
+        "~ cw principal gospel 1: reference 'John 20.1-18' -> 'John 20.1-10'")
+    assert format_change(changes[1]) == '+ cw principal gospel 1: John 20.1-18'
+
+
+def test_dataset_name():
+    for ending in ('.json', '.ndjson', '.columns.json'):
+        assert dataset_name(f'data/lectionary-readings-cw-office{ending}') == (
+            'lectionary-readings-cw-office')
+
+
+def test_pair_directories(tmp_path, monkeypatch):
+    monkeypatch.delenv(DATA_FORM_ENV, raising=False)
+    old, new = tmp_path / 'old', tmp_path / 'new'
+    old.mkdir()
+    new.mkdir()
+    for name in ('lectionary-readings-a.json', 'lectionary-readings-a.ndjson',
+                 'lectionary-readings-b.json'):
+        (old / name).write_text('[]')
+    # Generator output alone is still compared
+    (new / 'lectionary-readings-a.ndjson').write_text('')
+    assert pair_files(old, new) == [
+        ('lectionary-readings-a', old / 'lectionary-readings-a.json',
+         new / 'lectionary-readings-a.ndjson'),
+        ('lectionary-readings-b', old / 'lectionary-readings-b.json', None),
+    ]
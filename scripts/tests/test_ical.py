@@ -0,0 +1,44 @@
+import pytest
+
+from lectionary.ical import MAX_LINE_OCTETS, escape_text, fold, parse_contexts
+
+
+def unfold(text):
+    return text.replace('\r\n ', '')
+
+
+def octets(text):
+    return [len(line.encode('utf-8')) for line in text.split('\r\n')[:-1]]
+
+
+def test_short_line_is_not_folded():
+    line = 'S' * MAX_LINE_OCTETS
+    assert fold(line) == line + '\r\n'
+
+
+def test_long_line_is_folded():
+    line = 'DESCRIPTION:' + 'x' * 200
+    folded = fold(line)
+    assert folded.endswith('\r\n')
+    assert octets(folded) == [75, 75, 64]
+    assert unfold(folded) == line + '\r\n'
+
+
+@pytest.mark.parametrize('char', ['é', '—', '𝔊'])
+def test_fold_keeps_characters_whole(char):
+    for prefix in range(4):
+        line = 'SUMMARY:' + 'x' * prefix + char * 100
+        folded = fold(line)
+        assert max(octets(folded)) <= MAX_LINE_OCTETS
+        assert unfold(folded) == line + '\r\n'
+
+
+def test_escape_text():
+    assert escape_text('a\\b; c, d\ne\r\nf') == r'a\\b\; c\, d\ne\nf'
+
+
+def test_parse_contexts():
+    assert parse_contexts(['principal', 'office', 'morning_prayer']) == [
+        'principal', 'morning_prayer', 'evening_prayer']
+    with pytest.raises(ValueError, match='matins'):
+        parse_contexts(['matins'])
@@ -0,0 +1,95 @@
+import json
+import random
+
+import pytest
+
+from lectionary.passage_index import PassageIndex, load_index, query_spans
+
+REFERENCES = [
+    'John 1.1-14',
+    'John 1.6-8, 19-28',
+    'John 3.16',
+    'Genesis 1.1—2.3',
+    'Psalm 23',
+]
+
+
+@pytest.fixture
+def readings_file(tmp_path):
+    path = tmp_path / 'lectionary-readings-test.json'
+    readings = [
+        {'occasionSlug': f'day-{i}', 'tradition': 'cw', 'serviceContext': 'principal',
+         'readingType': 'gospel', 'reference': ref, 'alternateYear': None, 'sortOrder': i}
+        for i, ref in enumerate(REFERENCES)
+    ]
+    path.write_text(json.dumps(readings))
+    return path
+
+
+@pytest.fixture
+def index(readings_file):
+    return PassageIndex.build([readings_file])
+
+
+def references(rows):
+    return sorted(row['reference'] for row in rows)
+
+
+@pytest.mark.parametrize('query, expected', [
+    ('John 1.10', ['John 1.1-14']),
+    ('John 1.7', ['John 1.1-14', 'John 1.6-8, 19-28']),
+    ('John 1.15-18', []),
+    ('John 1.15-20', ['John 1.6-8, 19-28']),
+    ('Genesis 2.1', ['Genesis 1.1—2.3']),
+    ('Psalm 23.4', ['Psalm 23']),
+])
+def test_overlapping(index, query, expected):
+    assert references(index.overlapping(query)) == expected
+
+
+@pytest.mark.parametrize('query, expected', [
+    ('John 1.6-8', ['John 1.1-14', 'John 1.6-8, 19-28']),
+    ('John 1.6-20', []),
+    ('John 1.6-8, 20', ['John 1.6-8, 19-28']),
+])
+def test_containing(index, query, expected):
+    assert references(index.containing(query)) == expected
+
+
+@pytest.mark.parametrize('query, expected', [
+    ('John 1.1-30', ['John 1.1-14', 'John 1.6-8, 19-28']),
+    # Every segment of a reading has to fall inside the query
+    ('John 1.1-20', ['John 1.1-14']),
+    ('John 3', ['John 3.16']),
+])
+def test_within(index, query, expected):
+    assert references(index.within(query)) == expected
+
+
+def test_overlap_matches_a_scan():
+    rng = random.Random(1)
+    intervals = []
+    for rid in range(500):
+        start = rng.randrange(10000)
+        intervals.append((start, start + rng.randrange(200), rid))
+    records = [[f'day-{rid}', 'cw', None, 'gospel', None, None, rid] for rid in range(500)]
+    index = PassageIndex(records, sorted(intervals))
+    for _ in range(200):
+        start = rng.randrange(10000)
+        end = start + rng.randrange(300)
+        expected = {f'day-{rid}' for s, e, rid in intervals if s <= end and e >= start}
+        assert {row['occasionSlug'] for row in index.overlapping((start, end))} == expected
+
+
+def test_unplaced_reference():
+    with pytest.raises(ValueError):
+        query_spans('Nonsense 1.1')
+
+
+def test_saved_index_is_reused_until_a_source_changes(readings_file, tmp_path):
+    path = tmp_path / 'passage-index.json'
+    first = load_index(path, [readings_file])
+    assert path.exists()
+    assert len(load_index(path, [readings_file])) == len(first) == len(REFERENCES)
+    readings_file.write_text(json.dumps(json.loads(readings_file.read_text())[:2]))
+    assert len(load_index(path, [readings_file])) == 2
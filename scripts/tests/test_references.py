@@ -0,0 +1,65 @@
+import pytest
+
+from lectionary.references import Segment, parse_reference, parse_segments, split_book
+
+
+@pytest.mark.parametrize('book', ['2 John', '3 John', 'Jude'])
+def test_single_chapter_book_alone_is_its_one_chapter(book):
+    assert split_book(book) == (book, '')
+    assert parse_reference(book) == (book, '1', None, None)
+    assert parse_segments(book) == (Segment(1, None, 1, None),)
+
+
+@pytest.mark.parametrize('ref, segment', [
+    ('2 John 4-9', Segment(1, 4, 1, 9)),
+    ('3 John 5-8', Segment(1, 5, 1, 8)),
+    ('Jude 17-25', Segment(1, 17, 1, 25)),
+])
+def test_single_chapter_book_verses(ref, segment):
+    assert parse_segments(ref) == (segment,)
+
+
+@pytest.mark.parametrize('ref, expected', [
+    ('Psalm 23', ('Psalm', '23', None, None)),
+    ('Psalms 1-2', ('Psalms', '1', None, None)),
+    ('Romans 8.28', ('Romans', '8', '28', None)),
+    ('Acts 2.1-21', ('Acts', '2', '1', '21')),
+    ('Luke 2.22-40b', ('Luke', '2', '22', '40b')),
+    ('Isaiah 52.13—53.12', ('Isaiah', '52', '13', None)),
+    ('Numbers 5.5-7; 6.1-21', ('Numbers', '5', '5', None)),
+    ('Psalm 72.1-7,18-19', ('Psalm', '72', '1', '19')),
+    ('Genesis 1.1—2.3, 4.1', ('Genesis', '1', '1', None)),
+    ('Philemon 1-16', ('Philemon', '1', '1', '16')),
+    ('Jude 3', ('Jude', '1', '3', None)),
+    ('Song of the Three Children 29-37', ('Song of the Three Children', '1', '29', '37')),
+    ('nonsense', ('nonsense', None, None, None)),
+])
+def test_parse_reference(ref, expected):
+    assert parse_reference(ref) == expected
+
+
+@pytest.mark.parametrize('ref, expected', [
+    ('1 Corinthians 13', ('1 Corinthians', '13')),
+    ('Song of Solomon 2.8-13', ('Song of Solomon', '2.8-13')),
+    ('12.1-5', (None, '12.1-5')),
+])
+def test_split_book(ref, expected):
+    assert split_book(ref) == expected
+
+
+@pytest.mark.parametrize('ref, segments', [
+    # Commas continue the chapter, semicolons start a new part
+    ('Psalm 72.1-7,18-19', [(72, 1, 72, 7), (72, 18, 72, 19)]),
+    ('Numbers 5.5-7; 6.1-21', [(5, 5, 5, 7), (6, 1, 6, 21)]),
+    ('Psalms 120; 121', [(120, None, 120, None), (121, None, 121, None)]),
+    ('Genesis 1 and 2', [(1, None, 1, None), (2, None, 2, None)]),
+    # A bare number that runs to the end stays in the chapter
+    ('Esther 2:5-11 & 15-end', [(2, 5, 2, 11), (2, 15, 2, None)]),
+    ('Psalms 18.31-end, 150', [(18, 31, 18, None), (150, None, 150, None)]),
+    ('Isaiah 52.13—53.12', [(52, 13, 53, 12)]),
+    ('Job 38.1-end of 39', [(38, 1, 39, None)]),
+    ('Ezekiel 36.24-28 [29-30]', [(36, 24, 36, 28), (36, 29, 36, 30)]),
+    ('Mark 1.1-5, 8x', [(1, 1, 1, 5)]),
+])
+def test_parse_segments(ref, segments):
+    assert parse_segments(ref) == tuple(Segment(*s) for s in segments)
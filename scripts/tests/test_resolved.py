@@ -0,0 +1,77 @@
+from lectionary.resolved import ResolvedReadings, build_reading_groups, group_alternative_readings
+
+
+def reading(id, sort_order, optional=False, context='principal', year=None, type='gospel'):
+    return {'id': id, 'serviceContext': context, 'readingType': type, 'alternateYear': year,
+            'isOptional': optional, 'sortOrder': sort_order}
+
+
+def ids(groups):
+    return [[r['id'] for r in group['readings']] for group in groups]
+
+
+def test_optional_reading_joins_its_alternative():
+    readings = [reading(1, 1), reading(2, 1, optional=True), reading(3, 2)]
+    assert ids(group_alternative_readings(readings)) == [[1, 2], [3]]
+
+
+def test_optional_reading_after_a_primary_joins_it():
+    readings = [reading(1, 1), reading(2, 2, optional=True), reading(3, 3, optional=True)]
+    assert ids(group_alternative_readings(readings)) == [[1, 2], [3]]
+
+
+def test_group_takes_its_first_reading_type():
+    readings = [reading(1, 1, type='psalm'), reading(2, 1, optional=True)]
+    assert group_alternative_readings(readings)[0]['readingType'] == 'psalm'
+
+
+def test_build_reading_groups():
+    readings = [
+        reading(1, 2, year='A'), reading(2, 1), reading(3, 1, year='B'),
+        reading(4, 1, context=None), reading(5, 1, context='evening_prayer', year='2'),
+    ]
+    groups = build_reading_groups(readings, 'A', '2')
+    assert {context: ids(g) for context, g in groups.items()} == {
+        'principal': [[2], [4], [1]],
+        'evening_prayer': [[5]],
+    }
+
+
+def occasion(id, slug, collect=None):
+    return {'id': id, 'name': slug.title(), 'slug': slug, 'colour': 'white',
+            'collectCw': collect, 'collectBcp': None, 'postCommunionCw': None}
+
+
+def test_resolve_date():
+    occasions = {
+        1: occasion(1, 'trinity-sunday'),
+        2: occasion(2, 'st-someone', collect='Almighty God'),
+        3: occasion(3, 'dedication'),
+    }
+    readings = {
+        (1, 'cw'): [reading(10, 1), reading(11, 1, context='daily_eucharist')],
+        (2, 'cw'): [reading(20, 1, context='daily_eucharist'), reading(21, 1)],
+        (3, 'cw'): [reading(30, 1), reading(31, 2, context='daily_eucharist')],
+    }
+    resolved = ResolvedReadings(occasions, readings)
+    mappings = [(1, 'C', 'primary'), (2, 'C', 'commemoration'), (3, 'C', 'alternative')]
+    document = resolved.resolve_date('2025-06-15', mappings, 'cw')
+
+    assert document['occasion'] == dict(occasions[1], liturgicalYear='C')
+    # Commemorations and alternatives add their daily eucharist readings to the day's
+    assert {context: ids(g) for context, g in document['groups'].items()} == {
+        'principal': [[10]],
+        'daily_eucharist': [[11], [20], [31]],
+    }
+    assert [c['slug'] for c in document['commemorations']] == ['st-someone']
+    [alternative] = document['alternativeOccasions']
+    assert alternative['mappingType'] == 'alternative'
+    assert {context: ids(g) for context, g in alternative['cwGroups'].items()} == {
+        'principal': [[30]],
+    }
+    assert alternative['bcpGroups'] == {}
+
+
+def test_resolve_date_without_a_primary():
+    resolved = ResolvedReadings({1: occasion(1, 'trinity-sunday')}, {})
+    assert resolved.resolve_date('2025-06-15', [(1, 'C', 'alternative')], 'cw') is None
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""Check the lectionary datasets for problems before they are seeded.
+
+Loads every occasion and reading file once (in the form the seeders
+read) and reports readings with no occasion, duplicate occasions and
+readings, unknown tradition/serviceContext/readingType/alternateYear values
+and malformed reference fields. Exits 1 if there are errors, or with
+--strict if there are any problems at all.
+
+Usage:
+  python3 scripts/validate-lectionary.py
+  python3 scripts/validate-lectionary.py --all --strict
+"""
+
+import argparse
+import sys
+import time
+
+from lectionary.validate import check, format_problems, is_error, load_datasets, summarise
+
+DEFAULT_LIMIT = 20
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--strict', action='store_true',
+                        help='fail on warnings (malformed references) as well as errors')
+    parser.add_argument('--all', action='store_true',
+                        help=f'list every problem, not just the first {DEFAULT_LIMIT}')
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    occasion_files, reading_files = load_datasets()
+    t1 = time.perf_counter()
+    problems = check(occasion_files, reading_files)
+    t2 = time.perf_counter()
+
+    for line in format_problems(problems, None if args.all else DEFAULT_LIMIT):
+        print(line)
+    occasions = sum(len(records) for _, records in occasion_files)
+    readings = sum(len(records) for _, records in reading_files)
+    print(f'Checked {occasions} occasions and {readings} readings '
+          f'in {len(occasion_files) + len(reading_files)} files: {summarise(problems)}')
+    print(f'  Load {(t1 - t0) * 1000:.0f} ms, check {(t2 - t1) * 1000:.0f} ms')
+
+    if any(is_error(p) for p in problems) or (args.strict and problems):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
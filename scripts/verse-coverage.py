@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""Report which verses the lectionaries read, how often, and where they overlap.
+
+Groups are 'all', a tradition ('cw', 'bcp') or a tradition and service
+context ('cw:principal'); 'office' means morning and evening prayer
+('bcp:office'). --book limits summary, overlap and gaps to one book. See
+lectionary.coverage.
+
+Usage:
+  python3 scripts/verse-coverage.py summary
+  python3 scripts/verse-coverage.py overlap cw:office bcp:office
+  python3 scripts/verse-coverage.py gaps all --book Psalms
+  python3 scripts/verse-coverage.py heatmap cw bcp -o heatmap.csv
+  python3 scripts/verse-coverage.py heatmap cw:office bcp:office --book Psalms --chapter 119
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+from lectionary.coverage import (
+    ALL_VERSES, VerseCoverage, book_mask, chapter_heatmap, format_span, overlap, summary,
+    verse_heatmap, write_heatmap,
+)
+from lectionary.output import STDOUT, open_output, report_stream
+
+
+def print_summary(data):
+    parts = '  '.join(f'{name} {part["verses"]:,}/{part["total"]:,} ({part["fraction"]:.1%})'
+                      for name, part in data['coverage'].items())
+    print(f'{data["group"]:<22} {data["readings"]:>6,} readings  {parts}')
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__.strip().splitlines()[0],
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument('command', choices=['summary', 'overlap', 'gaps', 'heatmap'])
+    parser.add_argument('groups', nargs='*',
+                        help='groups to report (summary: default every group; overlap: two)')
+    parser.add_argument('--book', help='only this book (heatmap: one row per verse)')
+    parser.add_argument('--chapter', type=int, action='append',
+                        help='with heatmap --book, only this chapter (repeatable)')
+    parser.add_argument('--metric', choices=['covered', 'reads'],
+                        help='heatmap cells: share of verses read (default per chapter) or '
+                             'number of readings (default per verse)')
+    parser.add_argument('--format', choices=['csv', 'json'],
+                        help='heatmap format (default: from the -o suffix, else csv)')
+    parser.add_argument('-o', '--output', default=STDOUT,
+                        help='heatmap output file (default: stdout)')
+    parser.add_argument('--json', action='store_true',
+                        help='print summary, overlap or gaps as JSON')
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    data = VerseCoverage.load()
+    try:
+        within = book_mask(args.book) if args.book and args.command != 'heatmap' else ALL_VERSES
+        groups = args.groups or (data.groups() if args.command == 'summary' else ['all'])
+        coverages = [data.coverage(g) for g in groups]
+    except ValueError as e:
+        sys.exit(str(e))
+
+    if args.command == 'summary':
+        results = [summary(c, args.book) for c in coverages]
+        if args.json:
+            json.dump(results, sys.stdout, indent=2)
+            print()
+        else:
+            for result in results:
+                print_summary(result)
+
+    elif args.command == 'overlap':
+        if len(coverages) != 2:
+            parser.error('overlap needs two groups')
+        result = overlap(*coverages, within=within)
+        if args.json:
+            json.dump(result, sys.stdout, indent=2)
+            print()
+        else:
+            a, b = result['groups']
+            lines = [('Both', result['both']), (f'Only {a}', result['onlyFirst']),
+                     (f'Only {b}', result['onlySecond']), ('Neither', result['neither'])]
+            width = max(len(label) for label, _ in lines)
+            for label, verses in lines:
+                print(f'{label + ":":<{width + 1}} {verses:>7,} verses')
+            print(f'{"Jaccard:":<{width + 1}} {result["jaccard"]}')
+
+    elif args.command == 'gaps':
+        for c in coverages:
+            gaps = c.gaps(within)
+            if args.json:
+                json.dump({'group': c.name, 'gaps': [
+                    {'reference': format_span(start, end), 'start': start, 'end': end}
+                    for start, end in gaps
+                ]}, sys.stdout, indent=2)
+                print()
+                continue
+            unread = sum(end - start + 1 for start, end in gaps)
+            print(f'{c.name}: {unread:,} verses never read, in {len(gaps):,} gaps')
+            for start, end in gaps:
+                print(f'  {format_span(start, end)}  ({end - start + 1})')
+
+    else:
+        target = STDOUT if args.output == STDOUT else Path(args.output)
+        fmt = args.format or ('json' if str(target).endswith('.json') else 'csv')
+        try:
+            if args.book:
+                header, rows = verse_heatmap(coverages, args.book, args.chapter,
+                                             args.metric or 'reads')
+            else:
+                header, rows = chapter_heatmap(coverages, metric=args.metric or 'covered')
+        except ValueError as e:
+            sys.exit(str(e))
+        with open_output(target) as f:
+            write_heatmap(f, header, rows, coverages, fmt)
+        print(f'Wrote {len(rows):,} rows x {len(coverages)} groups to {target} '
+              f'in {time.perf_counter() - t0:.2f}s', file=report_stream(target))
+
+
+if __name__ == '__main__':
+    main()
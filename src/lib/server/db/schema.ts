@@ -1,4 +1,4 @@
-import { sqliteTable, text, integer, real } from 'drizzle-orm/sqlite-core';
+import { sqliteTable, text, integer, real, primaryKey } from 'drizzle-orm/sqlite-core';
 import { sql } from 'drizzle-orm';
 
 const timestamps = {
@@ -159,6 +159,23 @@ export const lectionaryDateMap = sqliteTable('lectionary_date_map', {
 	mappingType: text('mapping_type').notNull().default('primary')
 });
 
+// Readings for a date fully resolved and grouped as getReadingsGroupedByContext()
+// returns them, serialized as JSON; built by scripts/resolve-readings.py
+export const lectionaryResolvedReadings = sqliteTable(
+	'lectionary_resolved_readings',
+	{
+		date: text('date').notNull(),
+		tradition: text('tradition').notNull(),
+		occasionId: integer('occasion_id')
+			.notNull()
+			.references(() => lectionaryOccasions.id, { onDelete: 'cascade' }),
+		data: text('data').notNull()
+	},
+	(table) => ({
+		pk: primaryKey({ columns: [table.date, table.tradition] })
+	})
+);
+
 // --- Service Readings ---
 
 export const serviceReadings = sqliteTable('service_readings', {
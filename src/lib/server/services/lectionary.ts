@@ -1,5 +1,11 @@
-import { eq, and } from 'drizzle-orm';
-import { db, lectionaryOccasions, lectionaryReadings, lectionaryDateMap } from '../db';
+import { eq, and, sql } from 'drizzle-orm';
+import {
+	db,
+	lectionaryOccasions,
+	lectionaryReadings,
+	lectionaryDateMap,
+	lectionaryResolvedReadings
+} from '../db';
 import {
 	getLiturgicalSeason,
 	getLiturgicalYear,
@@ -208,11 +214,40 @@ function buildReadingGroupsForOccasion(
  * Returns readings for a specific tradition, organised into contexts
  * (principal, morning_prayer, evening_prayer, etc.).
  *
+ * Dates precomputed by scripts/resolve-readings.py are one primary-key
+ * lookup in lectionary_resolved_readings; any other date is resolved from
+ * the lectionary tables by resolveReadingsGroupedByContext().
+ */
+export function getReadingsGroupedByContext(
+	date: string,
+	tradition: string = 'cw'
+): ReturnType<typeof resolveReadingsGroupedByContext> {
+	const resolved = db
+		.select({ data: lectionaryResolvedReadings.data })
+		.from(lectionaryResolvedReadings)
+		.where(
+			and(
+				eq(lectionaryResolvedReadings.date, date),
+				eq(lectionaryResolvedReadings.tradition, tradition)
+			)
+		)
+		.get();
+
+	if (resolved) return JSON.parse(resolved.data);
+	return resolveReadingsGroupedByContext(date, tradition);
+}
+
+/**
+ * Resolve all readings for a date from the lectionary tables, grouped by
+ * service context.
+ *
  * Also merges commemoration readings (from non-principal occasions)
  * into the daily_eucharist context, and returns commemoration metadata.
  * Occasions with non-eucharist readings are returned as alternativeOccasions.
+ *
+ * scripts/lectionary/resolved.py mirrors this function; keep them in step.
  */
-export function getReadingsGroupedByContext(date: string, tradition: string = 'cw') {
+export function resolveReadingsGroupedByContext(date: string, tradition: string = 'cw') {
 	const occasion = getOccasionByDate(date);
 	if (!occasion) return { occasion: null, groups: {} as Record<string, never[]>, commemorations: [] as { id: number; name: string; slug: string; colour: string | null; collectCw: string | null; postCommunionCw: string | null }[], alternativeOccasions: [] as AlternativeOccasion[] };
 
@@ -447,3 +482,41 @@ export function getLiturgicalInfoForDate(dateStr: string) {
 		occasionId: occasion?.id ?? null
 	};
 }
+
+export interface CollectSearchHit {
+	slug: string;
+	name: string | null;
+	prayer: 'collectCw' | 'collectBcp' | 'postCommunionCw';
+	snippet: string;
+	score: number;
+}
+
+/**
+ * Search the collects and post-communions for a phrase, best match first.
+ * Uses the FTS5 index built by scripts/index-collects.py (see
+ * scripts/lectionary/collect_search.py); matches in each snippet are
+ * marked with [ and ]. Returns no results until the index is built.
+ * Reseeding empties the index and only build-lectionary.py --seed
+ * rebuilds it, so after `npm run db:seed-lectionary` run index-collects.py.
+ */
+export function searchCollects(query: string, limit = 20): CollectSearchHit[] {
+	const words = query.replace(/[‘’]/g, "'").replace(/[“”]/g, '"').trim().split(/\s+/);
+	if (!words[0]) return [];
+	const phrase = `"${words.join(' ').replace(/"/g, '""')}"`;
+
+	try {
+		return db.all<CollectSearchHit>(sql`
+			SELECT s.slug, o.name, s.prayer,
+				snippet(lectionary_collect_search, 2, '[', ']', '...', 12) AS snippet,
+				bm25(lectionary_collect_search) AS score
+			FROM lectionary_collect_search s
+			LEFT JOIN lectionary_occasions o ON o.slug = s.slug
+			WHERE lectionary_collect_search MATCH ${phrase}
+			ORDER BY rank
+			LIMIT ${limit}
+		`);
+	} catch (e) {
+		if (e instanceof Error && e.message.includes('no such table')) return [];
+		throw e;
+	}
+}
@@ -115,10 +115,10 @@ export function getLiturgicalSeason(
 		return { season: 'christmas', colour: 'white' };
 	}
 
-	// Epiphany season
+	// Epiphany season, to the end of Candlemas (callers pass midday)
 	const epiphany = dates.epiphany;
 	const candlemas = dates.candlemas;
-	if (d >= epiphany.getTime() && d <= candlemas.getTime()) {
+	if (d >= epiphany.getTime() && d < addDays(candlemas, 1).getTime()) {
 		return { season: 'epiphany', colour: 'white' };
 	}
 
@@ -0,0 +1,10 @@
+import { json } from '@sveltejs/kit';
+import { searchCollects } from '$lib/server/services/lectionary';
+import type { RequestHandler } from './$types';
+
+export const GET: RequestHandler = ({ url }) => {
+	const query = url.searchParams.get('q') ?? '';
+	const limit = Math.max(1, Math.min(Number(url.searchParams.get('limit')) || 20, 100));
+
+	return json(searchCollects(query, limit));
+};